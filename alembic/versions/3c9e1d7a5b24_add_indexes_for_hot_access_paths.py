@@ -0,0 +1,48 @@
+"""Add indexes for task, meeting, comment and evaluation access paths
+
+Revision ID: 3c9e1d7a5b24
+Revises: 18437d7f4700
+Create Date: 2026-10-17 10:12:41.203518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9e1d7a5b24'
+down_revision: Union[str, None] = '18437d7f4700'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_team_status_priority', 'tasks', ['team_id', 'status', 'priority'])
+    op.create_index(
+        'ix_tasks_team_active_created', 'tasks', ['team_id', 'created_at', 'id'],
+        postgresql_where=sa.text("status IN ('OPEN', 'IN_PROGRESS')"))
+    op.create_index('ix_tasks_team_due_date', 'tasks', ['team_id', 'due_date'])
+    op.create_index('ix_tasks_creator_id', 'tasks', ['creator_id'])
+    op.create_index('ix_tasks_due_date', 'tasks', ['due_date'])
+    op.create_index('ix_meetings_start_end', 'meetings', ['start_datetime', 'end_datetime'])
+    op.create_index('ix_comments_task_created', 'comments', ['task_id', sa.text('created_at DESC')])
+    op.create_index('ix_task_status_history_task_changed', 'task_status_history', ['task_id', 'changed_at'])
+    op.create_index('ix_evaluation_recipients_user_id', 'evaluation_recipients', ['user_id', 'evaluation_id'])
+    op.create_index('ix_evaluations_created_at', 'evaluations', ['created_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_evaluations_created_at', table_name='evaluations')
+    op.drop_index('ix_evaluation_recipients_user_id', table_name='evaluation_recipients')
+    op.drop_index('ix_task_status_history_task_changed', table_name='task_status_history')
+    op.drop_index('ix_comments_task_created', table_name='comments')
+    op.drop_index('ix_meetings_start_end', table_name='meetings')
+    op.drop_index('ix_tasks_due_date', table_name='tasks')
+    op.drop_index('ix_tasks_creator_id', table_name='tasks')
+    op.drop_index('ix_tasks_team_due_date', table_name='tasks')
+    op.drop_index('ix_tasks_team_active_created', table_name='tasks')
+    op.drop_index('ix_tasks_team_status_priority', table_name='tasks')
@@ -0,0 +1,68 @@
+"""Add materialized calendar entries
+
+Revision ID: 7b2f4c8e9d13
+Revises: 3c9e1d7a5b24
+Create Date: 2026-10-17 13:40:05.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2f4c8e9d13'
+down_revision: Union[str, None] = '3c9e1d7a5b24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'calendar_entries',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('task_id', sa.Integer(), nullable=True),
+        sa.Column('meeting_id', sa.Integer(), nullable=True),
+        sa.Column('title', sa.String(length=100), nullable=False),
+        sa.Column('start_datetime', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('end_datetime', sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint('(task_id IS NULL) <> (meeting_id IS NULL)', name='check_calendar_entry_source'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_calendar_entries_user_day', 'calendar_entries', ['user_id', 'day'])
+    op.create_index('ix_calendar_entries_task_id', 'calendar_entries', ['task_id'])
+    op.create_index('ix_calendar_entries_meeting_id', 'calendar_entries', ['meeting_id'])
+
+    op.execute("""
+        INSERT INTO calendar_entries (user_id, day, task_id, title)
+        SELECT task_users.user_id, (tasks.due_date AT TIME ZONE 'UTC')::date, tasks.id, tasks.title
+        FROM tasks
+        JOIN (
+            SELECT id AS task_id, creator_id AS user_id FROM tasks
+            UNION
+            SELECT task_id, user_id FROM task_assignee_association
+        ) AS task_users ON task_users.task_id = tasks.id
+        WHERE tasks.due_date IS NOT NULL
+    """)
+    op.execute("""
+        INSERT INTO calendar_entries (user_id, day, meeting_id, title, start_datetime, end_datetime)
+        SELECT participants.user_id, (meetings.start_datetime AT TIME ZONE 'UTC')::date, meetings.id,
+               COALESCE(meetings.title, 'Untitled'), meetings.start_datetime, meetings.end_datetime
+        FROM meetings
+        JOIN meeting_participant_association AS participants ON participants.meeting_id = meetings.id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_calendar_entries_meeting_id', table_name='calendar_entries')
+    op.drop_index('ix_calendar_entries_task_id', table_name='calendar_entries')
+    op.drop_index('ix_calendar_entries_user_day', table_name='calendar_entries')
+    op.drop_table('calendar_entries')
@@ -0,0 +1,32 @@
+"""Add updated_at to teams and users
+
+Revision ID: 8d4b6f2e1a37
+Revises: e5a7c3b19d42
+Create Date: 2026-10-17 18:12:47.530961
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d4b6f2e1a37'
+down_revision: Union[str, None] = 'e5a7c3b19d42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ('teams', 'users'):
+        op.add_column(table, sa.Column(
+            'updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False))
+        op.alter_column(table, 'updated_at', server_default=None)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('users', 'teams'):
+        op.drop_column(table, 'updated_at')
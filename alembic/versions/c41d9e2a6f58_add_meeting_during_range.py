@@ -0,0 +1,38 @@
+"""Add generated tstzrange for meeting intervals with a GiST index
+
+Revision ID: c41d9e2a6f58
+Revises: 7b2f4c8e9d13
+Create Date: 2026-10-17 15:02:37.640913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d9e2a6f58'
+down_revision: Union[str, None] = '7b2f4c8e9d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('meetings', sa.Column(
+        'during',
+        postgresql.TSTZRANGE(),
+        sa.Computed("tstzrange(start_datetime, end_datetime, '[)')", persisted=True),
+        nullable=True))
+    op.create_index('ix_meetings_during', 'meetings', ['during'], postgresql_using='gist')
+    op.create_index(
+        'ix_meeting_participant_association_user_id', 'meeting_participant_association', ['user_id', 'meeting_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_meeting_participant_association_user_id', table_name='meeting_participant_association')
+    op.drop_index('ix_meetings_during', table_name='meetings')
+    op.drop_column('meetings', 'during')
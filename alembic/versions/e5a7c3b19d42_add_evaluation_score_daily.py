@@ -0,0 +1,45 @@
+"""Add daily evaluation score rollup
+
+Revision ID: e5a7c3b19d42
+Revises: c41d9e2a6f58
+Create Date: 2026-10-17 16:05:31.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c3b19d42'
+down_revision: Union[str, None] = 'c41d9e2a6f58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'evaluation_score_daily',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('score_sum', sa.Integer(), nullable=False),
+        sa.Column('score_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'day')
+    )
+
+    op.execute("""
+        INSERT INTO evaluation_score_daily (user_id, day, score_sum, score_count)
+        SELECT recipients.user_id, (evaluations.created_at AT TIME ZONE 'UTC')::date,
+               SUM(evaluations.score), COUNT(*)
+        FROM evaluation_recipients AS recipients
+        JOIN evaluations ON evaluations.id = recipients.evaluation_id
+        GROUP BY recipients.user_id, (evaluations.created_at AT TIME ZONE 'UTC')::date
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('evaluation_score_daily')
@@ -0,0 +1,65 @@
+"""
+Availability lookup latency for 60 participants with four meetings a day over a month.
+
+    python -m benchmarks.bench_availability
+"""
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+from benchmarks.common import bench_engine, measure
+from src.config.db import get_async_sessionmaker
+from src.models import User, Meeting, MeetingParticipantAssociation
+from src.services.meeting import meeting_crud
+
+PARTICIPANTS = 60
+DAYS = 31
+MEETINGS_PER_DAY = 4
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+async def seed(engine: AsyncEngine) -> list[int]:
+    """Give every participant MEETINGS_PER_DAY random half-hour to two-hour meetings on working hours."""
+    rng = random.Random(42)
+    async with engine.begin() as conn:
+        user_ids = (await conn.execute(insert(User).returning(User.id), [
+            {"email": f"member{i}@example.com", "password": "x", "first_name": "Team", "last_name": f"Member{i}"}
+            for i in range(PARTICIPANTS)
+        ])).scalars().all()
+        for user_id in user_ids:
+            meetings = []
+            for day in range(DAYS):
+                for _ in range(MEETINGS_PER_DAY):
+                    start = START + timedelta(days=day, hours=rng.randint(8, 17), minutes=rng.choice((0, 30)))
+                    meetings.append({
+                        "title": "Busy", "creator_id": user_id, "start_datetime": start,
+                        "end_datetime": start + timedelta(minutes=rng.choice((30, 60, 90, 120)))})
+            meeting_ids = (await conn.execute(insert(Meeting).returning(Meeting.id), meetings)).scalars().all()
+            await conn.execute(insert(MeetingParticipantAssociation), [
+                {"meeting_id": meeting_id, "user_id": user_id} for meeting_id in meeting_ids
+            ])
+        await conn.exec_driver_sql("ANALYZE")
+    return list(user_ids)
+
+
+async def main() -> None:
+    async with bench_engine() as engine:
+        user_ids = await seed(engine)
+        sessionmaker = get_async_sessionmaker(engine)
+
+        print(f"{PARTICIPANTS} participants, {MEETINGS_PER_DAY} meetings/day each, {DAYS} days")
+        print(f"{'participants':>12} {'window':>8} {'median_ms':>10} {'p95_ms':>8}")
+        for count in (10, 50, PARTICIPANTS):
+            for days in (7, DAYS):
+                async def lookup() -> None:
+                    async with sessionmaker() as db:
+                        await meeting_crud.get_availability(
+                            db, user_ids[:count], START, START + timedelta(days=days), timedelta(minutes=30), 10)
+
+                result = await measure(lookup)
+                print(f"{count:>12} {str(days) + 'd':>8} {result['median_ms']:>10} {result['p95_ms']:>8}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+"""
+Calendar latency against the number of events: the materialized user calendar,
+and the live team calendar run sequentially vs fan-out.
+
+    python -m benchmarks.bench_calendar
+"""
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+from benchmarks.common import bench_engine, measure
+from src.config.db import get_async_sessionmaker
+from src.config.settings import settings
+from src.models import User, Team, Task, Meeting, MeetingParticipantAssociation, TaskAssigneeAssociation
+from src.services.calendar import get_user_calendar, get_team_calendar, rebuild_calendar
+
+EVENT_COUNTS = (10, 100, 1000, 5000)
+DAYS = 30
+
+
+async def seed(engine: AsyncEngine, events: int) -> tuple[int, int]:
+    """Create one user with `events` tasks and `events` meetings spread over DAYS days."""
+    start = datetime(2025, 1, 1, 9, tzinfo=timezone.utc)
+    async with engine.begin() as conn:
+        user_id = (await conn.execute(insert(User).values(
+            email=f"bench{events}@example.com", password="x", first_name="Bench", last_name="User",
+        ).returning(User.id))).scalar_one()
+        team_id = (await conn.execute(insert(Team).values(
+            name=f"Bench {events}", invite_code=f"BENCH{events}",
+        ).returning(Team.id))).scalar_one()
+        task_ids = (await conn.execute(insert(Task).returning(Task.id), [
+            {"title": f"Task {i}", "team_id": team_id, "creator_id": user_id,
+             "due_date": start + timedelta(days=i % DAYS)}
+            for i in range(events)
+        ])).scalars().all()
+        await conn.execute(insert(TaskAssigneeAssociation), [
+            {"task_id": task_id, "user_id": user_id} for task_id in task_ids
+        ])
+        meeting_ids = (await conn.execute(insert(Meeting).returning(Meeting.id), [
+            {"title": f"Meeting {i}", "creator_id": user_id,
+             "start_datetime": start + timedelta(days=i % DAYS, hours=1),
+             "end_datetime": start + timedelta(days=i % DAYS, hours=2)}
+            for i in range(events)
+        ])).scalars().all()
+        await conn.execute(insert(MeetingParticipantAssociation), [
+            {"meeting_id": meeting_id, "user_id": user_id} for meeting_id in meeting_ids
+        ])
+    return user_id, team_id
+
+
+async def main() -> None:
+    async with bench_engine() as engine:
+        sessionmaker = get_async_sessionmaker(engine)
+        print(f"{'events':>8} {'mode':>16} {'median_ms':>10} {'p95_ms':>8}")
+        for events in EVENT_COUNTS:
+            user_id, team_id = await seed(engine, events)
+            async with sessionmaker() as db:
+                await rebuild_calendar(db)
+                await db.commit()
+
+            async def user_calendar() -> None:
+                async with sessionmaker() as db:
+                    await get_user_calendar(db, date(2025, 1, 1), date(2025, 1, DAYS), user_id)
+
+            async def team_calendar() -> None:
+                async with sessionmaker() as db:
+                    await get_team_calendar(db, team_id, date(2025, 1, 1), date(2025, 1, DAYS))
+
+            result = await measure(user_calendar)
+            print(f"{events:>8} {'user':>16} {result['median_ms']:>10} {result['p95_ms']:>8}")
+            for fanout in (False, True):
+                settings.CALENDAR_FANOUT = fanout
+                result = await measure(team_calendar)
+                mode = "team fanout" if fanout else "team sequential"
+                print(f"{events:>8} {mode:>16} {result['median_ms']:>10} {result['p95_ms']:>8}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
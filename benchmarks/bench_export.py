@@ -0,0 +1,59 @@
+"""
+Peak memory and time of exporting a team's tasks as NDJSON against the team size:
+the streamed export against loading every row and serializing one list.
+
+    python -m benchmarks.bench_export
+"""
+import asyncio
+from typing import List
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+from benchmarks.common import bench_engine, measure, measure_allocations
+from src.config.db import get_async_sessionmaker
+from src.models import User, Team, Task
+from src.schemas import ExportFormat, TaskExportRow
+from src.services.export import team_tasks_export, team_tasks_query
+from src.utils.serialization import type_adapter
+
+TASK_COUNTS = (1_000, 10_000, 50_000)
+
+
+async def seed(engine: AsyncEngine, tasks: int) -> int:
+    async with engine.begin() as conn:
+        user_id = (await conn.execute(insert(User).values(
+            email=f"bench{tasks}@example.com", password="x", first_name="Bench", last_name="User",
+        ).returning(User.id))).scalar_one()
+        team_id = (await conn.execute(insert(Team).values(
+            name=f"Bench {tasks}", invite_code=f"BENCH{tasks}").returning(Team.id))).scalar_one()
+        await conn.execute(insert(Task), [
+            {"title": f"Task {i}", "description": "Exported task " * 4, "team_id": team_id, "creator_id": user_id}
+            for i in range(tasks)
+        ])
+    return team_id
+
+
+async def main() -> None:
+    async with bench_engine() as engine:
+        sessionmaker = get_async_sessionmaker(engine)
+        print(f"{'tasks':>8} {'mode':>8} {'median_ms':>10} {'p95_ms':>8} {'peak_kib':>9}")
+        for count in TASK_COUNTS:
+            team_id = await seed(engine, count)
+
+            async def streamed() -> None:
+                async for _ in team_tasks_export(engine, team_id, ExportFormat.NDJSON):
+                    pass
+
+            async def in_memory() -> None:
+                async with sessionmaker() as db:
+                    rows = (await db.execute(team_tasks_query(team_id))).all()
+                type_adapter(List[TaskExportRow]).dump_json(
+                    type_adapter(List[TaskExportRow]).validate_python(rows, from_attributes=True))
+
+            for name, func in (("stream", streamed), ("list", in_memory)):
+                timing = await measure(func, repeat=5, warmup=1)
+                memory = await measure_allocations(func, repeat=3, warmup=0)
+                print(f"{count:>8} {name:>8} {timing['median_ms']:>10} {timing['p95_ms']:>8} {memory['peak_kib']:>9}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,67 @@
+"""
+CPU cost of turning loaded tasks into a Page[TaskShortRead] response body: per-row model_validate
+followed by FastAPI's response_model validation and JSON rendering, against one TypeAdapter
+validation of the page followed by a single dump_json.
+
+    python -m benchmarks.bench_list_serialization
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+from benchmarks.common import bench_engine, measure, measure_allocations
+from src.config.db import get_async_sessionmaker
+from src.models import User, Team, Task
+from src.schemas import Page, TaskShortRead
+from src.utils.serialization import json_response, type_adapter
+
+TASK_COUNTS = (200, 10_000)
+
+
+async def seed(engine: AsyncEngine) -> None:
+    start = datetime(2025, 1, 1, 9, tzinfo=timezone.utc)
+    async with engine.begin() as conn:
+        user_id = (await conn.execute(insert(User).values(
+            email="bench@example.com", password="x", first_name="Bench", last_name="User",
+        ).returning(User.id))).scalar_one()
+        team_id = (await conn.execute(insert(Team).values(
+            name="Bench", invite_code="BENCH").returning(Team.id))).scalar_one()
+        await conn.execute(insert(Task), [
+            {"title": f"Task {i}", "description": "Benchmark task " * 4, "team_id": team_id, "creator_id": user_id,
+             "due_date": start + timedelta(hours=i)}
+            for i in range(max(TASK_COUNTS))
+        ])
+
+
+async def main() -> None:
+    field = create_model_field(name="Response", type_=Page[TaskShortRead], mode="serialization")
+    async with bench_engine() as engine:
+        await seed(engine)
+        async with get_async_sessionmaker(engine)() as db:
+            tasks = (await db.execute(select(Task).order_by(Task.id))).scalars().all()
+
+        print(f"{'tasks':>8} {'path':>14} {'median_ms':>10} {'p95_ms':>8} {'peak_kib':>9}")
+        for count in TASK_COUNTS:
+            rows = tasks[:count]
+
+            async def response_model() -> None:
+                page = Page(items=[TaskShortRead.model_validate(task) for task in rows])
+                content = await serialize_response(field=field, response_content=page, is_coroutine=True)
+                JSONResponse(content)
+
+            async def single_pass() -> None:
+                page = Page(items=type_adapter(list[TaskShortRead]).validate_python(rows, from_attributes=True))
+                json_response(Page[TaskShortRead], page)
+
+            for name, func in (("response_model", response_model), ("single pass", single_pass)):
+                timing = await measure(func, repeat=10)
+                memory = await measure_allocations(func, repeat=5)
+                print(f"{count:>8} {name:>14} {timing['median_ms']:>10} {timing['p95_ms']:>8} "
+                      f"{memory['peak_kib']:>9}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,96 @@
+"""
+Meeting creation latency for participants who already have 10k meetings each:
+the range-overlap conflict check against the previous three-branch OR predicate.
+
+    python -m benchmarks.bench_meeting_conflicts
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from itertools import count
+from sqlalchemy import insert, select, and_, or_
+from sqlalchemy.ext.asyncio import AsyncEngine
+from benchmarks.common import bench_engine, measure
+from src.config.db import get_async_sessionmaker
+from src.models import User, Meeting, MeetingParticipantAssociation, MeetingStatus
+from src.schemas import MeetingCreate
+from src.services.meeting import meeting_crud
+
+PARTICIPANTS = 5
+MEETINGS_PER_USER = 10_000
+START = datetime(2025, 1, 1, 9, tzinfo=timezone.utc)
+
+
+async def seed(engine: AsyncEngine) -> list[int]:
+    """Create PARTICIPANTS users with MEETINGS_PER_USER one-hour meetings each, one per day."""
+    async with engine.begin() as conn:
+        user_ids = (await conn.execute(insert(User).returning(User.id), [
+            {"email": f"busy{i}@example.com", "password": "x", "first_name": "Busy", "last_name": f"User{i}"}
+            for i in range(PARTICIPANTS)
+        ])).scalars().all()
+        for user_id in user_ids:
+            meeting_ids = (await conn.execute(insert(Meeting).returning(Meeting.id), [
+                {"title": f"Meeting {day}", "creator_id": user_id,
+                 "start_datetime": START + timedelta(days=day),
+                 "end_datetime": START + timedelta(days=day, hours=1)}
+                for day in range(MEETINGS_PER_USER)
+            ])).scalars().all()
+            await conn.execute(insert(MeetingParticipantAssociation), [
+                {"meeting_id": meeting_id, "user_id": user_id} for meeting_id in meeting_ids
+            ])
+    return list(user_ids)
+
+
+def legacy_conflict_stmt(user_ids: list[int], start: datetime, end: datetime):
+    """The conflict query used before the `during` range column."""
+    return (
+        select(User.id)
+        .join(User.meetings)
+        .where(
+            User.id.in_(user_ids),
+            Meeting.status == MeetingStatus.SCHEDULED,
+            or_(
+                and_(Meeting.start_datetime <= start, Meeting.end_datetime > start),
+                and_(Meeting.start_datetime < end, Meeting.end_datetime >= end),
+                and_(Meeting.start_datetime >= start, Meeting.end_datetime <= end))).distinct())
+
+
+async def main() -> None:
+    async with bench_engine() as engine:
+        user_ids = await seed(engine)
+        sessionmaker = get_async_sessionmaker(engine)
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql("ANALYZE")
+
+        slots = count()
+
+        def next_free_slot() -> tuple[datetime, datetime]:
+            start = START + timedelta(days=next(slots), hours=3)
+            return start, start + timedelta(minutes=30)
+
+        async def legacy_check() -> None:
+            async with sessionmaker() as db:
+                await db.execute(legacy_conflict_stmt(user_ids, *next_free_slot()))
+
+        async def range_check() -> None:
+            async with sessionmaker() as db:
+                await meeting_crud.get_conflicting_users(db, user_ids, *next_free_slot())
+
+        async def create_meeting() -> None:
+            start, end = next_free_slot()
+            async with sessionmaker() as db:
+                await meeting_crud.create_meet(
+                    db, MeetingCreate(start_datetime=start, end_datetime=end, participant_ids=user_ids[1:]),
+                    user_ids[0])
+
+        print(f"{PARTICIPANTS} participants x {MEETINGS_PER_USER} meetings each")
+        print(f"{'operation':>22} {'median_ms':>10} {'p95_ms':>8}")
+        for name, func in (
+                ("legacy OR check", legacy_check),
+                ("range && check", range_check),
+                ("create_meet", create_meeting)):
+            result = await measure(func)
+            print(f"{name:>22} {result['median_ms']:>10} {result['p95_ms']:>8}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
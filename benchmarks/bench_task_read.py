@@ -0,0 +1,71 @@
+"""
+Task detail (TaskRead) latency and memory per request against the number of assignees:
+the ORM graph (task, creator, associations and users as entities, copied through dicts)
+vs the single projection statement with the assignees aggregated to JSON.
+
+    python -m benchmarks.bench_task_read
+"""
+import asyncio
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import selectinload
+from benchmarks.common import bench_engine, measure, measure_allocations
+from src.config.db import get_async_sessionmaker
+from src.models import User, Team, Task, TaskAssigneeAssociation
+from src.services.task import tasks_crud
+
+ASSIGNEE_COUNTS = (0, 5, 50, 200)
+
+
+async def seed(engine: AsyncEngine) -> dict[int, int]:
+    """One task per entry of ASSIGNEE_COUNTS with that many assignees; returns task id by assignee count."""
+    async with engine.begin() as conn:
+        user_ids = (await conn.execute(insert(User).returning(User.id), [
+            {"email": f"member{i}@example.com", "password": "x", "first_name": "Team", "last_name": f"Member{i}"}
+            for i in range(max(ASSIGNEE_COUNTS) + 1)
+        ])).scalars().all()
+        team_id = (await conn.execute(insert(Team).values(
+            name="Bench", invite_code="BENCH").returning(Team.id))).scalar_one()
+        task_ids = {}
+        for count in ASSIGNEE_COUNTS:
+            task_ids[count] = (await conn.execute(insert(Task).values(
+                title=f"{count} assignees", team_id=team_id, creator_id=user_ids[0],
+            ).returning(Task.id))).scalar_one()
+            if count:
+                await conn.execute(insert(TaskAssigneeAssociation), [
+                    {"task_id": task_ids[count], "user_id": user_id, "role": "EXECUTOR"}
+                    for user_id in user_ids[1:count + 1]
+                ])
+        await conn.exec_driver_sql("ANALYZE")
+    return task_ids
+
+
+async def main() -> None:
+    async with bench_engine() as engine:
+        task_ids = await seed(engine)
+        sessionmaker = get_async_sessionmaker(engine)
+
+        async def orm_graph(task_id: int) -> None:
+            async with sessionmaker() as db:
+                task = (await db.execute(
+                    select(Task).options(
+                        selectinload(Task.creator), selectinload(Task.assignee_associations)
+                        .selectinload(TaskAssigneeAssociation.user))
+                    .where(Task.id == task_id))).scalar_one()
+                tasks_crud.to_task_read(task)
+
+        async def projection(task_id: int) -> None:
+            async with sessionmaker() as db:
+                await tasks_crud.get_task_with_dependencies(db, task_id)
+
+        print(f"{'assignees':>9} {'loader':>10} {'median_ms':>10} {'p95_ms':>8} {'peak_kib':>9}")
+        for count, task_id in task_ids.items():
+            for name, loader in (("orm graph", orm_graph), ("projection", projection)):
+                timing = await measure(lambda: loader(task_id))
+                memory = await measure_allocations(lambda: loader(task_id))
+                print(f"{count:>9} {name:>10} {timing['median_ms']:>10} {timing['p95_ms']:>8} "
+                      f"{memory['peak_kib']:>9}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
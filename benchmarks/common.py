@@ -0,0 +1,64 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks recreate the schema, so they refuse to run outside MODE=TEST. Run them from the
+project root with the test environment loaded, e.g. `python -m benchmarks.bench_calendar`.
+"""
+import statistics
+import tracemalloc
+from contextlib import asynccontextmanager
+from time import perf_counter
+from typing import AsyncIterator, Awaitable, Callable, List
+from sqlalchemy.ext.asyncio import AsyncEngine
+from src.config.db import Base, get_async_engine
+from src.config.settings import settings
+
+
+@asynccontextmanager
+async def bench_engine() -> AsyncIterator[AsyncEngine]:
+    """Pooled engine on a freshly created schema, dropped again afterwards."""
+    if settings.MODE != "TEST":
+        raise SystemExit(f"Benchmarks drop all tables; expected MODE=TEST, got {settings.MODE}")
+    engine = get_async_engine()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        yield engine
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+async def measure(func: Callable[[], Awaitable[object]], repeat: int = 20, warmup: int = 3) -> dict:
+    """Time `func` and return median and p95 latency in milliseconds."""
+    for _ in range(warmup):
+        await func()
+    samples: List[float] = []
+    for _ in range(repeat):
+        started = perf_counter()
+        await func()
+        samples.append((perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "median_ms": round(statistics.median(samples), 2),
+        "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 2),
+    }
+
+
+async def measure_allocations(func: Callable[[], Awaitable[object]], repeat: int = 20, warmup: int = 3) -> dict:
+    """Trace `func` and return the median peak of memory it held on top of what was allocated before, in KiB."""
+    for _ in range(warmup):
+        await func()
+    peaks: List[float] = []
+    tracemalloc.start()
+    try:
+        for _ in range(repeat):
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            await func()
+            peaks.append((tracemalloc.get_traced_memory()[1] - baseline) / 1024)
+    finally:
+        tracemalloc.stop()
+    return {"peak_kib": round(statistics.median(peaks), 1)}
@@ -3,7 +3,7 @@ from fastapi import Request
 from sqlalchemy import select
 from src.config.db import SessionLocal
 from src.models import User
-from src.utils.security import verify_password
+from src.utils.security import password_hasher
 
 
 class AdminAuth(AuthenticationBackend):
@@ -19,7 +19,7 @@ class AdminAuth(AuthenticationBackend):
 
         async with SessionLocal() as session:
             user = await session.scalar(select(User).where(User.email == email))
-            if not user or not verify_password(password, user.password):
+            if not user or not await password_hasher.verify(password, user.password):
                 return False
 
             if not user.is_superuser:
@@ -0,0 +1,55 @@
+import asyncio
+import sys
+from src.config.db import SessionLocal
+from src.services.calendar import rebuild_calendar, check_calendar
+
+
+async def rebuild() -> None:
+    """Recreate the materialized calendar from tasks and meetings."""
+    async with SessionLocal() as session:
+        try:
+            count = await rebuild_calendar(session)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            print(f"Failed to rebuild calendar: {e}")
+            return
+    print(f"Calendar rebuilt: {count} entries.")
+
+
+async def check() -> bool:
+    """Report entries that are missing from or stale in the materialized calendar."""
+    async with SessionLocal() as session:
+        result = await check_calendar(session)
+
+    if result.consistent:
+        print("Calendar is consistent.")
+        return True
+
+    print(f"Missing entries: {len(result.missing)}")
+    for row in result.missing:
+        print(f"  + {row}")
+    print(f"Stale entries: {len(result.stale)}")
+    for row in result.stale:
+        print(f"  - {row}")
+    print("Run `python -m src.admin.calendar rebuild` to repair.")
+    return False
+
+
+def main() -> None:
+    """
+    Maintenance commands for the materialized calendar.
+    python -m src.admin.calendar rebuild | check
+    """
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    if command == "rebuild":
+        asyncio.run(rebuild())
+    elif command == "check":
+        sys.exit(0 if asyncio.run(check()) else 1)
+    else:
+        print("Usage: python -m src.admin.calendar rebuild | check")
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
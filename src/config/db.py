@@ -1,22 +1,60 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession, AsyncEngine
 from sqlalchemy.orm import declarative_base
 from src.config.settings import settings
+from src.utils.metrics import metrics
+from src.utils.sql_logging import setup_sql_logging
 
 Base = declarative_base()
 
 
-def get_async_engine():
-    return create_async_engine(settings.DB_URL, echo=True)
+def get_async_engine() -> AsyncEngine:
+    """Create the pooled async engine configured from settings."""
+    return create_async_engine(
+        settings.DB_URL,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+    )
 
 
-def get_async_sessionmaker():
-    return async_sessionmaker(bind=get_async_engine(), expire_on_commit=False)
+def get_async_sessionmaker(bind: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=bind, expire_on_commit=False)
+
+
+def register_pool_metrics(bind: AsyncEngine) -> None:
+    """Expose connection pool usage as gauges for sizing the pool under load."""
+    pool = bind.pool
+    metrics.gauge("db_pool_size", pool.size)
+    metrics.gauge("db_pool_checked_out", pool.checkedout)
+    metrics.gauge("db_pool_checked_in", pool.checkedin)
+    metrics.gauge("db_pool_overflow", pool.overflow)
+
+
+engine = get_async_engine()
+SessionLocal = get_async_sessionmaker(engine)
+register_pool_metrics(engine)
+setup_sql_logging(
+    engine.sync_engine,
+    mode=settings.SQL_LOG_MODE,
+    sample_rate=settings.SQL_LOG_SAMPLE_RATE,
+    slow_ms=settings.SQL_SLOW_QUERY_MS,
+)
 
 
 async def get_db() -> AsyncSession:
-    async with get_async_sessionmaker()() as session:
+    async with SessionLocal() as session:
         yield session
 
 
-SessionLocal = get_async_sessionmaker()
-engine = get_async_engine()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the shared pool on startup and close all pooled connections on shutdown."""
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    yield
+    await engine.dispose()
@@ -1,3 +1,4 @@
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
 
@@ -17,6 +18,33 @@ class Settings(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
 
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_TIMEOUT: int = 30
+
+    SQL_LOG_MODE: Literal["off", "all", "sampled", "slow"] = "off"
+    SQL_LOG_SAMPLE_RATE: float = 0.01
+    SQL_SLOW_QUERY_MS: int = 500
+
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    AUTH_TOKEN_CACHE_SIZE: int = 10000
+
+    CALENDAR_FANOUT: bool = False
+
+    EVALUATION_SCORE_ROLLUP: bool = True
+
+    ANALYTICS_CACHE_TTL: int = 300
+
+    RESPONSE_CACHE_URL: Optional[str] = None
+    RESPONSE_CACHE_SIZE: int = 4096
+    RESPONSE_CACHE_TTL: int = 60
+
+    EXPORT_BATCH_SIZE: int = 1000
+
     @property
     def DB_URL(self):
         return (
@@ -1,10 +1,11 @@
 from fastapi import Depends, HTTPException, status, Path, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import Type, Any, Callable
+from sqlalchemy import select, exists, event
+from sqlalchemy.orm import Session
+from typing import Type, Any, Callable, NamedTuple, Sequence, List
 from src.config.db import get_db
-from src.models import UserRole, TaskAssigneeAssociation, User
-from src.schemas.user import UserPayload, TeamRole
+from src.models import UserRole, TaskAssigneeAssociation, User, Task, TeamUserAssociation
+from src.schemas.user import UserPayload
 from src.services.auth import get_current_user
 
 
@@ -20,7 +21,7 @@ async def is_team_member(
         current_user: UserPayload = Depends(get_current_user)
 ) -> UserPayload:
     """Allow access only for users who are members of the team specified by `team_id` path param."""
-    if team_id not in [team.team_id for team in current_user.teams]:
+    if not current_user.is_member(team_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You are not a member of this team.")
     return current_user
 
@@ -32,7 +33,7 @@ async def is_admin_and_member(
     """Allow access only for users who are admins and members of the specified team."""
     if current_user.role != UserRole.ADMIN.value:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only admins can access this endpoint")
-    if team_id not in [team.team_id for team in current_user.teams]:
+    if not current_user.is_member(team_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You are not a member of this team")
     return current_user
 
@@ -42,12 +43,11 @@ async def admin_manager_in_team(
         current_user: UserPayload = Depends(get_current_user)
 ) -> UserPayload:
     """Allow access only for admins or users who are MANAGER in the specified team."""
-    team_assoc = next((team for team in current_user.teams if team.team_id == team_id), None)
-    if not team_assoc:
+    if not current_user.is_member(team_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You are not a member of this team.")
     if current_user.role == UserRole.ADMIN.value:
         return current_user
-    if team_assoc.role != TeamRole.MANAGER:
+    if not current_user.is_manager(team_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You must be a manager in this team.")
     return current_user
 
@@ -58,67 +58,162 @@ async def admin_or_manager(
     """Allow access only for users who are admins or managers in any of their teams."""
     if current_user.role == UserRole.ADMIN.value:
         return current_user
-    if any(team.role == TeamRole.MANAGER for team in current_user.teams):
+    if current_user.manager_teams:
         return current_user
     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
                         detail="Only admins or team managers can access this endpoint.")
 
 
+LOADED_RESOURCES_KEY = "loaded_resources"
+
+
+def keep_loaded(db: AsyncSession, resource: Any) -> None:
+    """
+    Hold the resource a permission check loaded until the transaction ends. The identity map
+    references unmodified objects weakly, so without this the object is collected when the
+    dependency returns and the guarded service's db.get selects the row again.
+    """
+    db.info.setdefault(LOADED_RESOURCES_KEY, []).append(resource)
+
+
 async def can_change_status(
         team_id: int = Path(..., description="ID of the team"),
         task_id: int = Path(..., description="ID of the task"),
         db: AsyncSession = Depends(get_db),
         current_user: UserPayload = Depends(get_current_user),
 ) -> UserPayload:
-    """Allow changing task status for admins, managers of the team, or assignees of the task."""
-    team_assoc = next((team for team in current_user.teams if team.team_id == team_id), None)
-    if not team_assoc:
+    """
+    Allow changing task status for admins, managers of the team, or assignees of the task.
+    The task is loaded together with the assignee check in one query and kept for the request,
+    so the status update takes it from the session identity map instead of selecting it again.
+    """
+    if not current_user.is_member(team_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You are not a member of this team.")
-    if current_user.role == UserRole.ADMIN.value:
-        return current_user
-    if team_assoc.role == TeamRole.MANAGER:
+    is_assignee = exists().where(
+        TaskAssigneeAssociation.task_id == Task.id,
+        TaskAssigneeAssociation.user_id == current_user.id,
+    ).label("is_assignee")
+    stmt = select(Task, is_assignee).where(Task.id == task_id, Task.team_id == team_id)
+    row = (await db.execute(stmt)).one_or_none()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+    keep_loaded(db, row.Task)
+    if current_user.role == UserRole.ADMIN.value or current_user.is_manager(team_id):
         return current_user
-    stmt = select(TaskAssigneeAssociation.user_id).where(TaskAssigneeAssociation.task_id == task_id)
-    result = await db.execute(stmt)
-    assignee_ids = [row[0] for row in result.all()]
-    if current_user.id in assignee_ids:
+    if row.is_assignee:
         return current_user
     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
                         detail="You are not allowed to change the task status.")
 
 
+async def shares_team_with_participants(
+        participant_ids: List[int] = Query(..., description="IDs of the participants"),
+        db: AsyncSession = Depends(get_db),
+        current_user: UserPayload = Depends(get_current_user)
+) -> UserPayload:
+    """Allow access for admins or users who share a team with every requested participant."""
+    if current_user.role == UserRole.ADMIN.value:
+        return current_user
+    others = set(participant_ids) - {current_user.id}
+    if not others:
+        return current_user
+    team_ids = [team.team_id for team in current_user.teams]
+    shared = set()
+    if team_ids:
+        shared = set((await db.execute(
+            select(TeamUserAssociation.user_id).where(
+                TeamUserAssociation.team_id.in_(team_ids),
+                TeamUserAssociation.user_id.in_(others),
+            ).distinct()
+        )).scalars())
+    if others - shared:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
+                            detail="You can only view the availability of users from your teams.")
+    return current_user
+
+
 async def block_everyone() -> None:
     """Deny access to everyone - endpoint disabled."""
     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="This endpoint is disabled")
 
 
+class ResourceOwnership(NamedTuple):
+    """Creator of a resource, whether the requesting user is a superuser, and the resource when it was loaded."""
+    creator_id: int
+    is_superuser: bool
+    resource: Any = None
+
+
+OWNERSHIP_CACHE_KEY = "resource_ownership"
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _clear_ownership_cache(session: Session) -> None:
+    """Ownership results and loaded resources are only trusted within the transaction that read them."""
+    session.info.pop(OWNERSHIP_CACHE_KEY, None)
+    session.info.pop(LOADED_RESOURCES_KEY, None)
+
+
+async def get_resource_ownership(
+        db: AsyncSession,
+        model: Type[Any],
+        resource_id: int,
+        user_id: int,
+        creator_field: str = "creator_id",
+        options: Sequence[Any] = (),
+        load_resource: bool = False,
+) -> ResourceOwnership:
+    """
+    Fetch the resource's creator and the user's superuser flag in a single projected query.
+    With `load_resource` or loader `options` the whole resource is loaded instead and kept for
+    the request, so the guarded service takes it with db.get rather than selecting it again.
+    The result is cached on the session for the rest of the request.
+    """
+    load_resource = load_resource or bool(options)
+    cache = db.info.setdefault(OWNERSHIP_CACHE_KEY, {})
+    key = (model.__name__, resource_id, user_id, creator_field, load_resource, tuple(options))
+    if key in cache:
+        return cache[key]
+
+    is_superuser = select(User.is_superuser).where(User.id == user_id).scalar_subquery()
+    selected = model if load_resource else getattr(model, creator_field)
+    stmt = select(selected, is_superuser).options(*options).where(getattr(model, "id") == resource_id)
+    row = (await db.execute(stmt)).one_or_none()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{model.__name__} not found")
+
+    if load_resource:
+        keep_loaded(db, row[0])
+        ownership = ResourceOwnership(getattr(row[0], creator_field), bool(row[1]), resource=row[0])
+    else:
+        ownership = ResourceOwnership(row[0], bool(row[1]))
+    cache[key] = ownership
+    return ownership
+
+
 def creator_or_superuser(
         model: Type[Any],
         id_path_param: str = "id",
-        creator_field: str = "creator_id"
+        creator_field: str = "creator_id",
+        options: Sequence[Any] = (),
+        load_resource: bool = False,
 ) -> Callable:
-    """Allow access if current user is creator of the resource or a superuser."""
+    """
+    Allow access if current user is creator of the resource or a superuser.
+    Set `load_resource` when the guarded service reuses the resource; `options` eager-load
+    the relationships it reads from it.
+    """
 
     async def verify(
             resource_id: int = Path(..., alias=id_path_param, description=f"ID of the {model.__name__.lower()}"),
             db: AsyncSession = Depends(get_db),
             current_user: UserPayload = Depends(get_current_user),
     ) -> UserPayload:
-        stmt = select(model).where(getattr(model, "id") == resource_id)
-        result = await db.execute(stmt)
-        resource = result.scalar_one_or_none()
+        ownership = await get_resource_ownership(
+            db, model, resource_id, current_user.id, creator_field, options, load_resource)
 
-        if not resource:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{model.__name__} not found")
-
-        if getattr(resource, creator_field) == current_user.id:
-            return current_user
-
-        user_stmt = select(User.is_superuser).where(User.id == current_user.id)
-        user_result = await db.execute(user_stmt)
-        is_superuser = user_result.scalar_one_or_none()
-
-        if is_superuser:
+        if ownership.creator_id == current_user.id or ownership.is_superuser:
             return current_user
 
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
@@ -130,23 +225,25 @@ def creator_or_superuser(
 def creator_only(
         model: Type[Any],
         id_path_param: str = "id",
-        creator_field: str = "creator_id"
+        creator_field: str = "creator_id",
+        options: Sequence[Any] = (),
+        load_resource: bool = False,
 ) -> Callable:
-    """Allow access only if current user is the creator of the resource."""
+    """
+    Allow access only if current user is the creator of the resource.
+    Set `load_resource` when the guarded service reuses the resource; `options` eager-load
+    the relationships it reads from it.
+    """
 
     async def verify(
             resource_id: int = Path(..., alias=id_path_param, description=f"ID of the {model.__name__.lower()}"),
             db: AsyncSession = Depends(get_db),
             current_user: UserPayload = Depends(get_current_user),
     ) -> UserPayload:
-        stmt = select(model).where(getattr(model, "id") == resource_id)
-        result = await db.execute(stmt)
-        resource = result.scalar_one_or_none()
-
-        if resource is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{model.__name__} not found")
+        ownership = await get_resource_ownership(
+            db, model, resource_id, current_user.id, creator_field, options, load_resource)
 
-        if getattr(resource, creator_field) != current_user.id:
+        if ownership.creator_id != current_user.id:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
                                 detail="Only the creator can perform this action")
 
@@ -1,12 +1,25 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from src.routers import user, team, task, auth, comment, evaluation, team_user, task_user, calendar
-from src.routers import meeting
+from src.routers import meeting, metrics, analytics, export
 from src.admin import setup_admin
+from src.config.db import lifespan
+from src.utils.sql_logging import current_route
 
-app = FastAPI(title="Team Manager")
+app = FastAPI(title="Team Manager", lifespan=lifespan)
 
 admin = setup_admin(app)
 
+
+@app.middleware("http")
+async def bind_route_to_sql_log(request: Request, call_next):
+    """Remember which route issued the SQL statements executed while handling the request."""
+    token = current_route.set(f"{request.method} {request.url.path}")
+    try:
+        return await call_next(request)
+    finally:
+        current_route.reset(token)
+
+
 app.include_router(auth.router, prefix="/auth", tags=["Auth"])
 app.include_router(user.router, prefix="/users", tags=["Users"])
 app.include_router(team.router, prefix="/teams", tags=["Teams"])
@@ -17,4 +30,6 @@ app.include_router(team_user.router, prefix="/teams_users", tags=["Team manageme
 app.include_router(task_user.router, prefix="/tasks_users", tags=["Assignment complete tasks"])
 app.include_router(meeting.router, prefix="/meetings", tags=["Meetings"])
 app.include_router(calendar.router, prefix="/calendars", tags=["Calendar"])
-
+app.include_router(metrics.router, prefix="/metrics", tags=["Metrics"])
+app.include_router(analytics.router, prefix="/analytics", tags=["Analytics"])
+app.include_router(export.router, prefix="/exports", tags=["Export"])
@@ -1,7 +1,9 @@
+from src.models.calendar_entry import CalendarEntry
 from src.models.comment import Comment
 from src.models.enum import UserRole, TeamRole, MeetingStatus, TaskStatus, TaskPriority
 from src.models.evaluation import Evaluation
 from src.models.evaluation_user import EvaluationAssociation
+from src.models.evaluation_score_daily import EvaluationScoreDaily
 from src.models.meet_user import MeetingParticipantAssociation
 from src.models.meeting import Meeting
 from src.models.task import Task
@@ -28,5 +30,7 @@ __all__ = [
     'MeetingParticipantAssociation',
     'TaskStatusHistory',
     'EvaluationAssociation',
+    'CalendarEntry',
+    'EvaluationScoreDaily',
 ]
 
@@ -0,0 +1,32 @@
+from datetime import date, datetime
+from typing import Optional
+from sqlalchemy import ForeignKey, Date, DateTime, String, CheckConstraint, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from src.config.db import Base
+
+
+class CalendarEntry(Base):
+    """
+    Materialized calendar row: one task or meeting on one day of one user's calendar.
+    Maintained by the task and meeting write paths; rebuilt by `python -m src.admin.calendar`.
+    """
+    __tablename__ = "calendar_entries"
+    __table_args__ = (
+        CheckConstraint(
+            "(task_id IS NULL) <> (meeting_id IS NULL)", name="check_calendar_entry_source"),
+        Index("ix_calendar_entries_user_day", "user_id", "day"),
+        Index("ix_calendar_entries_task_id", "task_id"),
+        Index("ix_calendar_entries_meeting_id", "meeting_id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    task_id: Mapped[Optional[int]] = mapped_column(ForeignKey("tasks.id", ondelete="CASCADE"), nullable=True)
+    meeting_id: Mapped[Optional[int]] = mapped_column(ForeignKey("meetings.id", ondelete="CASCADE"), nullable=True)
+    title: Mapped[str] = mapped_column(String(100), nullable=False)
+    start_datetime: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    end_datetime: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"CalendarEntry: user_id={self.user_id}, day={self.day}, task_id={self.task_id}, meeting_id={self.meeting_id}"
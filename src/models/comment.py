@@ -1,5 +1,5 @@
 from sqlalchemy.orm import relationship, Mapped, mapped_column
-from sqlalchemy import ForeignKey, DateTime, Text
+from sqlalchemy import ForeignKey, DateTime, Text, Index, text
 from datetime import datetime, timezone
 from src.config.db import Base
 
@@ -7,6 +7,9 @@ from src.config.db import Base
 class Comment(Base):
     """Comment model representing user comments on tasks."""
     __tablename__ = "comments"
+    __table_args__ = (
+        Index("ix_comments_task_created", "task_id", text("created_at DESC")),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id"), nullable=False)
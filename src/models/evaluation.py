@@ -1,5 +1,5 @@
 from typing import List
-from sqlalchemy import ForeignKey, DateTime, Integer, Text, CheckConstraint, UniqueConstraint
+from sqlalchemy import ForeignKey, DateTime, Integer, Text, CheckConstraint, UniqueConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, timezone
 from src.config.db import Base
@@ -10,7 +10,8 @@ class Evaluation(Base):
     __tablename__ = "evaluations"
     __table_args__ = (
         UniqueConstraint("task_id", "evaluator_id", name="unique_task_evaluator"),
-        CheckConstraint('score BETWEEN 1 AND 5', name='check_score_range')
+        CheckConstraint('score BETWEEN 1 AND 5', name='check_score_range'),
+        Index("ix_evaluations_created_at", "created_at"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
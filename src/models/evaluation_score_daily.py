@@ -0,0 +1,17 @@
+from datetime import date
+from sqlalchemy import ForeignKey, Date, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from src.config.db import Base
+
+
+class EvaluationScoreDaily(Base):
+    """
+    Sum and count of the evaluation scores a user received on one UTC day.
+    Maintained by the evaluation write paths so averages over a period read one row per day.
+    """
+    __tablename__ = "evaluation_score_daily"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    score_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    score_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
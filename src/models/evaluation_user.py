@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy import ForeignKey, UniqueConstraint, Index
 from src.config.db import Base
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -11,6 +11,7 @@ class EvaluationAssociation(Base):
     __tablename__ = "evaluation_recipients"
     __table_args__ = (
         UniqueConstraint("evaluation_id", "user_id", name="uix_eval_user"),
+        Index("ix_evaluation_recipients_user_id", "user_id", "evaluation_id"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
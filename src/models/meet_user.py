@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from sqlalchemy import ForeignKey, Column, DateTime, Integer
+from sqlalchemy import ForeignKey, Column, DateTime, Integer, Index
 from src.config.db import Base
 
 
@@ -9,6 +9,9 @@ class MeetingParticipantAssociation(Base):
     Each row represents a user's participation in a meeting.
     """
     __tablename__ = "meeting_participant_association"
+    __table_args__ = (
+        Index("ix_meeting_participant_association_user_id", "user_id", "meeting_id"),
+    )
 
     meeting_id = Column(Integer, ForeignKey("meetings.id"), primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
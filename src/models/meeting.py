@@ -1,4 +1,5 @@
-from sqlalchemy import ForeignKey, Enum, DateTime, String, Text, CheckConstraint
+from sqlalchemy import ForeignKey, Enum, DateTime, String, Text, CheckConstraint, Index, Computed
+from sqlalchemy.dialects.postgresql import TSTZRANGE, Range
 from sqlalchemy.orm import relationship, mapped_column, Mapped
 from src.config.db import Base
 from src.models.enum import MeetingStatus
@@ -10,6 +11,8 @@ class Meeting(Base):
     __tablename__ = "meetings"
     __table_args__ = (
         CheckConstraint('end_datetime > start_datetime', name='check_meeting_times'),
+        Index("ix_meetings_start_end", "start_datetime", "end_datetime"),
+        Index("ix_meetings_during", "during", postgresql_using="gist"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -18,6 +21,11 @@ class Meeting(Base):
     location: Mapped[str | None] = mapped_column(String(200), nullable=True)
     start_datetime: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     end_datetime: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    during: Mapped[Range[datetime]] = mapped_column(
+        TSTZRANGE,
+        Computed("tstzrange(start_datetime, end_datetime, '[)')", persisted=True),
+        deferred=True
+    )
     creator_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     status: Mapped[MeetingStatus] = mapped_column(
         Enum(MeetingStatus),
@@ -1,6 +1,6 @@
 from typing import List, Optional
 from sqlalchemy.orm import relationship, Mapped, mapped_column
-from sqlalchemy import Enum, ForeignKey, DateTime, Text, String
+from sqlalchemy import Enum, ForeignKey, DateTime, Text, String, Index, text
 from datetime import datetime, timezone
 from src.config.db import Base
 from src.models.enum import TaskStatus, TaskPriority
@@ -12,6 +12,15 @@ class Task(Base):
     status, deadline, comments, and evaluation.
     """
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_team_status_priority", "team_id", "status", "priority"),
+        Index(
+            "ix_tasks_team_active_created", "team_id", "created_at", "id",
+            postgresql_where=text("status IN ('OPEN', 'IN_PROGRESS')")),
+        Index("ix_tasks_team_due_date", "team_id", "due_date"),
+        Index("ix_tasks_creator_id", "creator_id"),
+        Index("ix_tasks_due_date", "due_date"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(String(100), nullable=False)
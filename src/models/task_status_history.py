@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, DateTime, Enum as SQLEnum
+from sqlalchemy import ForeignKey, DateTime, Enum as SQLEnum, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from datetime import datetime, timezone
 from src.config.db import Base
@@ -8,6 +8,9 @@ from src.models.enum import TaskStatus
 class TaskStatusHistory(Base):
     """Represents a record of a task status change, """
     __tablename__ = "task_status_history"
+    __table_args__ = (
+        Index("ix_task_status_history_task_changed", "task_id", "changed_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id"), nullable=False)
@@ -1,8 +1,8 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.config.db import Base
-from sqlalchemy import Text, String
+from sqlalchemy import Text, String, DateTime
 from sqlalchemy.dialects import postgresql
 
 
@@ -16,6 +16,12 @@ class Team(Base):
     invite_code: Mapped[str] = mapped_column(String(20), unique=True, nullable=False)
     invite_code_expires_at: Mapped[datetime] = mapped_column(postgresql.TIMESTAMP(timezone=True), nullable=True)
     is_active: Mapped[bool] = mapped_column(default=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
 
     team_users: Mapped[List["TeamUserAssociation"]] = relationship(
         back_populates="team",
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import relationship, Mapped, mapped_column
-from sqlalchemy import Enum, String, Boolean
+from sqlalchemy import Enum, String, Boolean, DateTime
+from datetime import datetime, timezone
 from typing import List
 from src.config.db import Base
 from src.models.enum import UserRole
@@ -20,6 +21,12 @@ class User(Base):
     role: Mapped[UserRole] = mapped_column(Enum(UserRole), default=UserRole.USER, nullable=False)
     is_active: Mapped[bool] = mapped_column(default=True)
     is_superuser: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
     comments: Mapped[List["Comment"]] = relationship(
         "Comment",
         back_populates="author",
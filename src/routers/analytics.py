@@ -0,0 +1,104 @@
+from datetime import date
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query, Path
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.config.db import get_db
+from src.deps.permissions import admin_manager_in_team
+from src.schemas import UserPayload, TeamAnalytics, WeeklyThroughput, CycleTimeStats, AssigneeScore, OverdueStats
+from src.services.analytics import analytics_period, team_analytics, team_throughput, team_cycle_time, \
+    team_assignee_scores, team_overdue
+
+router = APIRouter()
+
+START_DATE = Query(None, description="Start of the period (inclusive, UTC). Defaults to twelve weeks before end_date")
+END_DATE = Query(None, description="End of the period (inclusive, UTC). Defaults to today")
+
+
+@router.get(
+    "/teams/{team_id}",
+    response_model=TeamAnalytics,
+    summary="Get team analytics",
+    description=(
+        "Weekly throughput, cycle time percentiles, per-assignee average score and overdue counts of a team "
+        "for the period. Only admins or managers in the team can access it."
+    )
+)
+async def get_team_analytics(
+        team_id: int = Path(..., description="ID of the team"),
+        start_date: Optional[date] = START_DATE,
+        end_date: Optional[date] = END_DATE,
+        db: AsyncSession = Depends(get_db),
+        current_user: UserPayload = Depends(admin_manager_in_team),
+) -> TeamAnalytics:
+    """Get all analytics of a team for the period."""
+    start_date, end_date = analytics_period(start_date, end_date)
+    return await team_analytics(db, team_id, start_date, end_date)
+
+
+@router.get(
+    "/teams/{team_id}/throughput",
+    response_model=List[WeeklyThroughput],
+    summary="Get team throughput",
+    description="Number of tasks moved to DONE per week of the period, with a running total."
+)
+async def get_team_throughput(
+        team_id: int = Path(..., description="ID of the team"),
+        start_date: Optional[date] = START_DATE,
+        end_date: Optional[date] = END_DATE,
+        db: AsyncSession = Depends(get_db),
+        current_user: UserPayload = Depends(admin_manager_in_team),
+) -> List[WeeklyThroughput]:
+    """Get weekly throughput of a team."""
+    start_date, end_date = analytics_period(start_date, end_date)
+    return await team_throughput(db, team_id, start_date, end_date)
+
+
+@router.get(
+    "/teams/{team_id}/cycle_time",
+    response_model=CycleTimeStats,
+    summary="Get team cycle time",
+    description="50th, 75th and 90th percentile of hours from task creation to its first move to DONE."
+)
+async def get_team_cycle_time(
+        team_id: int = Path(..., description="ID of the team"),
+        start_date: Optional[date] = START_DATE,
+        end_date: Optional[date] = END_DATE,
+        db: AsyncSession = Depends(get_db),
+        current_user: UserPayload = Depends(admin_manager_in_team),
+) -> CycleTimeStats:
+    """Get cycle time percentiles of a team."""
+    start_date, end_date = analytics_period(start_date, end_date)
+    return await team_cycle_time(db, team_id, start_date, end_date)
+
+
+@router.get(
+    "/teams/{team_id}/scores",
+    response_model=List[AssigneeScore],
+    summary="Get team members' average scores",
+    description="Average evaluation score of each member for the team's tasks in the period, ranked best first."
+)
+async def get_team_scores(
+        team_id: int = Path(..., description="ID of the team"),
+        start_date: Optional[date] = START_DATE,
+        end_date: Optional[date] = END_DATE,
+        db: AsyncSession = Depends(get_db),
+        current_user: UserPayload = Depends(admin_manager_in_team),
+) -> List[AssigneeScore]:
+    """Get ranked average scores of team members."""
+    start_date, end_date = analytics_period(start_date, end_date)
+    return await team_assignee_scores(db, team_id, start_date, end_date)
+
+
+@router.get(
+    "/teams/{team_id}/overdue",
+    response_model=OverdueStats,
+    summary="Get team overdue tasks",
+    description="Counts of unfinished team tasks past their due date: total, unassigned and per assignee."
+)
+async def get_team_overdue(
+        team_id: int = Path(..., description="ID of the team"),
+        db: AsyncSession = Depends(get_db),
+        current_user: UserPayload = Depends(admin_manager_in_team),
+) -> OverdueStats:
+    """Get overdue task counts of a team."""
+    return await team_overdue(db, team_id)
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.services.auth import decode_refresh_token
 from src.services.user import users_crud
-from src.utils.security import verify_password, create_access_token, create_refresh_token
+from src.utils.security import password_hasher, create_access_token, create_refresh_token
 from src.config.db import get_db
 from fastapi import Body
 from src.schemas import LoginRequest
@@ -14,7 +14,7 @@ router = APIRouter()
 async def login(data: LoginRequest, db: AsyncSession = Depends(get_db)) -> dict[str, str]:
     """Authenticate user and return a JWT access token."""
     user_data = await users_crud.get_for_login(db, data.email)
-    if not user_data or not verify_password(data.password, user_data["password"]):
+    if not user_data or not await password_hasher.verify(data.password, user_data["password"]):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
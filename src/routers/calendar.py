@@ -9,9 +9,14 @@ from src.schemas import UserPayload
 from src.schemas.calendar import CalendarEvent
 from src.services.auth import get_current_user
 from src.services.calendar import get_user_calendar, get_team_calendar
+from src.services.team_user import team_users_crud
+from src.utils.response_cache import response_cache, entity, entities
+from pydantic import TypeAdapter
 
 router = APIRouter()
 
+CALENDAR = TypeAdapter(Dict[date, List[CalendarEvent]])
+
 
 @router.get(
     "/",
@@ -29,7 +34,12 @@ async def user_calendar(
         current_user: User = Depends(get_current_user),
 ) -> Dict[date, List[CalendarEvent]]:
     """Get current user's tasks and meetings grouped by date in the given range."""
-    return await get_user_calendar(db, start_date, end_date, current_user.id)
+    async def load():
+        return await get_user_calendar(db, start_date, end_date, current_user.id), []
+
+    return await response_cache.get_or_load(
+        "GET /calendars/", f"calendar:{current_user.id}:{start_date}:{end_date}", CALENDAR, load,
+        depends_on=[entity("calendar", current_user.id)])
 
 
 @router.get(
@@ -48,5 +58,17 @@ async def team_calendar(
         db: AsyncSession = Depends(get_db),
         current_user: UserPayload = Depends(is_team_member),
 ) -> Dict[date, List[CalendarEvent]]:
-    """Get calendar events of a team grouped by date within the specified range."""
-    return await get_team_calendar(db, team_id, start_date, end_date)
\ No newline at end of file
+    """
+    Get calendar events of a team grouped by date within the specified range.
+    Cached responses depend on the team's tasks and on its members' calendars, which carry their meetings.
+    Members are resolved before loading; a change of membership gives the team a new version.
+    """
+    async def members():
+        return entities("calendar", await team_users_crud.member_ids(db, team_id))
+
+    async def load():
+        return await get_team_calendar(db, team_id, start_date, end_date), []
+
+    return await response_cache.get_or_load(
+        "GET /calendars/teams/{team_id}/calendar", f"team_calendar:{team_id}:{start_date}:{end_date}", CALENDAR,
+        load, depends_on=[entity("team", team_id)], resolve=members)
\ No newline at end of file
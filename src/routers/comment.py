@@ -1,15 +1,21 @@
-from typing import List
-from fastapi import APIRouter, Depends, status, Path
+from typing import Optional
+from fastapi import APIRouter, Depends, status, Path, Query
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from src.config.db import get_db
 from src.deps.permissions import creator_only
 from src.models import Comment
-from src.schemas import CommentRead, CommentBase, CommentUpdate, UserPayload
+from src.schemas import CommentRead, CommentBase, CommentUpdate, UserPayload, Page
 from src.services.auth import get_current_user
+from src.services.basecrud import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.services.comment import comment_crud
+from src.utils.response_cache import response_cache, entity, entities
+from pydantic import TypeAdapter
 
 router = APIRouter()
 
+COMMENT_PAGE = TypeAdapter(Page[CommentRead])
+
 
 @router.post(
     "/{task_id}",
@@ -38,7 +44,8 @@ async def update_comment(
         comment_id: int = Path(..., description="ID of the comment to update"),
         comment_in: CommentUpdate = ...,
         db: AsyncSession = Depends(get_db),
-        user: UserPayload = Depends(creator_only(Comment, id_path_param="comment_id"))
+        user: UserPayload = Depends(creator_only(
+            Comment, id_path_param="comment_id", creator_field="author_id", options=[selectinload(Comment.author)]))
 ) -> CommentRead:
     """Update an existing comment by its ID."""
     return await comment_crud.update_comment(db, comment_id, comment_in, user.id)
@@ -53,7 +60,8 @@ async def update_comment(
 async def delete_comment(
         comment_id: int = Path(..., description="ID of the comment to delete"),
         db: AsyncSession = Depends(get_db),
-        user: UserPayload = Depends(creator_only(Comment, id_path_param="comment_id"))
+        user: UserPayload = Depends(creator_only(
+            Comment, id_path_param="comment_id", creator_field="author_id", load_resource=True))
 ) -> None:
     """Delete a comment by its ID."""
     await comment_crud.delete(db, comment_id)
@@ -62,14 +70,25 @@ async def delete_comment(
 
 @router.get(
     "/task/{task_id}",
-    response_model=List[CommentRead],
+    response_model=Page[CommentRead],
     summary="Get comments by task",
-    description="Retrieve all comments for the specified task."
+    description="Retrieve comments for the specified task, newest first, one page at a time."
 )
 async def get_comments_by_task(
         task_id: int = Path(..., description="ID of the task to fetch comments for"),
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+        cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
         db: AsyncSession = Depends(get_db),
         user: UserPayload = Depends(get_current_user)
-) -> List[CommentRead]:
-    """Get all comments for a given task by task ID."""
-    return await comment_crud.get_comments_by_task(db, task_id)
\ No newline at end of file
+) -> Page[CommentRead]:
+    """Get a page of comments for a given task by task ID."""
+    async def authors():
+        return entities("user", await comment_crud.author_ids(db, task_id))
+
+    async def load():
+        page = await comment_crud.get_comments_by_task(db, task_id, limit, cursor)
+        return page, entities("user", (comment.author_id for comment in page.items))
+
+    return await response_cache.get_or_load(
+        "GET /comments/task/{task_id}", f"comments:{task_id}:{limit}:{cursor}", COMMENT_PAGE, load,
+        depends_on=[entity("comments", task_id)], resolve=authors)
\ No newline at end of file
@@ -1,15 +1,23 @@
-from fastapi import APIRouter, Depends, status, Query, Path
+from fastapi import APIRouter, Depends, status, Query, Path, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.config.db import get_db
 from src.deps.permissions import creator_only
 from src.models import User, Task
 from src.services.auth import get_current_user
-from src.schemas import EvaluationRead, EvaluationCreate
+from src.schemas import EvaluationRead, EvaluationCreate, Page
+from src.services.basecrud import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.services.evaluation import evaluation_crud
+from src.services.versions import task_evaluations_version
+from src.utils.conditional import conditional_response
+from src.utils.serialization import json_response
 from datetime import date
+from typing import Optional
+from pydantic import TypeAdapter
 
 router = APIRouter()
 
+EVALUATIONS = TypeAdapter(list[EvaluationRead])
+
 
 @router.post(
     "/tasks/{task_id}/evaluations",
@@ -46,17 +54,24 @@ async def update_evaluation(
 
 @router.get(
     "/my_evaluations",
-    response_model=list[EvaluationRead],
+    response_model=Page[EvaluationRead],
     status_code=status.HTTP_200_OK,
     summary="Get all evaluations for the current user",
-    description="Retrieve all evaluations that have been given to the current user."
+    description="Retrieve evaluations that have been given to the current user, newest first, one page at a time."
 )
 async def read_my_evaluations(
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+        cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+        start_date: Optional[date] = Query(None, description="Only evaluations created on or after this day"),
+        end_date: Optional[date] = Query(None, description="Only evaluations created on or before this day"),
+        min_score: Optional[int] = Query(None, ge=1, le=5, description="Minimum score"),
+        max_score: Optional[int] = Query(None, ge=1, le=5, description="Maximum score"),
         db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
-) -> list[EvaluationRead]:
-    """Get all the ratings given to the user."""
-    return await evaluation_crud.get_evaluations_for_user(db, current_user.id)
+) -> Page[EvaluationRead]:
+    """Get a page of the ratings given to the user."""
+    return json_response(Page[EvaluationRead], await evaluation_crud.get_evaluations_for_user(
+        db, current_user.id, limit, cursor, start_date, end_date, min_score, max_score))
 
 
 @router.get(
@@ -81,12 +96,20 @@ async def read_my_average_score(
     response_model=list[EvaluationRead],
     status_code=status.HTTP_200_OK,
     summary="Get all evaluations for a task",
-    description="Get all evaluations associated with a specific task by its ID."
+    description=(
+        "Get all evaluations associated with a specific task by its ID. "
+        "Supports If-None-Match and If-Modified-Since once the task has evaluations."
+    )
 )
 async def read_evaluations_for_task(
+        request: Request,
         task_id: int = Path(..., description="ID of the task to get evaluations for"),
         db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ) -> list[EvaluationRead]:
     """Get all evaluations for a specific task by task ID."""
-    return await evaluation_crud.get_evaluations_for_task(db, task_id)
+    async def load():
+        evaluations = await evaluation_crud.get_evaluations_for_task(db, task_id)
+        return Response(content=EVALUATIONS.dump_json(evaluations), media_type="application/json")
+
+    return await conditional_response(request, await task_evaluations_version(db, task_id), load)
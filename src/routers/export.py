@@ -0,0 +1,67 @@
+from fastapi import APIRouter, Depends, Query, Path
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.config.db import get_db
+from src.deps.permissions import admin_manager_in_team
+from src.schemas import UserPayload, ExportFormat
+from src.services.export import MEDIA_TYPES, team_tasks_export, team_comments_export, team_status_history_export
+
+router = APIRouter()
+
+FORMAT = Query(ExportFormat.NDJSON, alias="format", description="ndjson (one JSON object per line) or csv")
+
+
+def streaming_export(chunks, export_format: ExportFormat, filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'})
+
+
+@router.get(
+    "/teams/{team_id}/tasks",
+    summary="Export team tasks",
+    description="Stream all tasks of a team as NDJSON or CSV. Only admins or managers in the team can access it."
+)
+async def export_team_tasks(
+        team_id: int = Path(..., description="ID of the team"),
+        export_format: ExportFormat = FORMAT,
+        db: AsyncSession = Depends(get_db),
+        current_user: UserPayload = Depends(admin_manager_in_team),
+) -> StreamingResponse:
+    """Stream the tasks of a team ordered by ID."""
+    return streaming_export(
+        team_tasks_export(db.bind, team_id, export_format), export_format, f"team-{team_id}-tasks")
+
+
+@router.get(
+    "/teams/{team_id}/comments",
+    summary="Export team comments",
+    description="Stream the comments on all tasks of a team as NDJSON or CSV. Only admins or managers in the team can access it."
+)
+async def export_team_comments(
+        team_id: int = Path(..., description="ID of the team"),
+        export_format: ExportFormat = FORMAT,
+        db: AsyncSession = Depends(get_db),
+        current_user: UserPayload = Depends(admin_manager_in_team),
+) -> StreamingResponse:
+    """Stream the comments of a team's tasks ordered by task and time."""
+    return streaming_export(
+        team_comments_export(db.bind, team_id, export_format), export_format, f"team-{team_id}-comments")
+
+
+@router.get(
+    "/teams/{team_id}/status_history",
+    summary="Export team task status history",
+    description="Stream the status changes of all tasks of a team as NDJSON or CSV. Only admins or managers in the team can access it."
+)
+async def export_team_status_history(
+        team_id: int = Path(..., description="ID of the team"),
+        export_format: ExportFormat = FORMAT,
+        db: AsyncSession = Depends(get_db),
+        current_user: UserPayload = Depends(admin_manager_in_team),
+) -> StreamingResponse:
+    """Stream the status changes of a team's tasks ordered by task and time."""
+    return streaming_export(
+        team_status_history_export(db.bind, team_id, export_format), export_format,
+        f"team-{team_id}-status-history")
@@ -1,12 +1,17 @@
-from typing import List
-from fastapi import APIRouter, Depends, status, Path
+from datetime import datetime, timedelta
+from typing import List, Optional
+from fastapi import APIRouter, Depends, status, Path, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.deps.permissions import admin_or_manager, creator_or_superuser
+from sqlalchemy.orm import selectinload
+from src.deps.permissions import admin_or_manager, creator_or_superuser, shares_team_with_participants
 from src.models import User, Meeting
-from src.schemas import MeetingShortRead, MeetingCreate, MeetingUpdate, MeetingRead, UserPayload
+from src.schemas import MeetingShortRead, MeetingCreate, MeetingUpdate, MeetingRead, UserPayload, Page, \
+    MeetingAvailability
 from src.services.auth import get_current_user
 from src.config.db import get_db
+from src.services.basecrud import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.services.meeting import meeting_crud
+from src.utils.serialization import json_response
 
 router = APIRouter()
 
@@ -38,7 +43,8 @@ async def update_meeting(
         meeting_id: int = Path(..., description="ID of the meeting to update"),
         meet_in: MeetingUpdate = ...,
         db: AsyncSession = Depends(get_db),
-        current_user: UserPayload = Depends(creator_or_superuser(Meeting, id_path_param="meeting_id"))
+        current_user: UserPayload = Depends(creator_or_superuser(
+            Meeting, id_path_param="meeting_id", options=[selectinload(Meeting.participants)]))
 ) -> MeetingShortRead:
     """Update meeting."""
     return await meeting_crud.update_meet(db, meeting_id, meet_in, current_user.id)
@@ -46,16 +52,43 @@ async def update_meeting(
 
 @router.get(
     "/me_meetings",
-    response_model=List[MeetingShortRead],
+    response_model=Page[MeetingShortRead],
     summary="Get current user's meetings",
-    description="Get all meetings where the current user participates."
+    description="Get meetings where the current user participates, ordered by start time, one page at a time."
 )
 async def get_my_meetings(
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+        cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
         db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user)
-) -> List[MeetingShortRead]:
-    """Get all appointments of the current user."""
-    return await meeting_crud.get_user_meetings(db, current_user.id)
+) -> Page[MeetingShortRead]:
+    """Get a page of appointments of the current user."""
+    return json_response(
+        Page[MeetingShortRead], await meeting_crud.get_user_meetings(db, current_user.id, limit, cursor))
+
+
+@router.get(
+    "/availability",
+    response_model=MeetingAvailability,
+    summary="Find free time for a set of participants",
+    description=(
+        "Return the merged busy intervals of the given participants' scheduled meetings within the window "
+        "and the first free slots that are at least `duration_minutes` long. "
+        "Only admins or users who share a team with every participant can view it."
+    )
+)
+async def get_availability(
+        participant_ids: List[int] = Query(..., description="IDs of the participants"),
+        start: datetime = Query(..., description="Start of the search window"),
+        end: datetime = Query(..., description="End of the search window"),
+        duration_minutes: int = Query(..., ge=1, le=24 * 60, description="Required meeting length in minutes"),
+        limit: int = Query(10, ge=1, le=100, description="Maximum number of free slots to return"),
+        db: AsyncSession = Depends(get_db),
+        current_user: UserPayload = Depends(shares_team_with_participants)
+) -> MeetingAvailability:
+    """Get busy intervals and free slots for the participants."""
+    return await meeting_crud.get_availability(
+        db, participant_ids, start, end, timedelta(minutes=duration_minutes), limit)
 
 
 @router.get(
@@ -75,17 +108,19 @@ async def get_meeting_by_id(
 
 @router.get(
     "/meetings/",
-    response_model=List[MeetingShortRead],
+    response_model=Page[MeetingShortRead],
     status_code=status.HTTP_200_OK,
     summary="Get all meetings",
-    description="Get a list of all meetings. Only admins or managers can access this endpoint."
+    description="Get a page of all meetings. Only admins or managers can access this endpoint."
 )
 async def get_all_meetings(
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+        cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
         db: AsyncSession = Depends(get_db),
         current_user: UserPayload = Depends(admin_or_manager)
-) -> List[MeetingShortRead]:
-    """Get all meetings."""
-    return await meeting_crud.get_all(db)
+) -> Page[MeetingShortRead]:
+    """Get a page of meetings."""
+    return json_response(Page[MeetingShortRead], await meeting_crud.get_all(db, limit, cursor))
 
 
 @router.delete(
@@ -97,7 +132,8 @@ async def get_all_meetings(
 async def delete_meeting(
         meeting_id: int = Path(..., description="ID of the meeting to delete"),
         db: AsyncSession = Depends(get_db),
-        current_user: UserPayload = Depends(creator_or_superuser(Meeting, id_path_param="meeting_id"))
+        current_user: UserPayload = Depends(creator_or_superuser(
+            Meeting, id_path_param="meeting_id", load_resource=True))
 ) -> None:
     """Delete meeting"""
     await meeting_crud.delete(db, meeting_id)
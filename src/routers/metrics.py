@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends
+from src.deps.permissions import is_admin
+from src.schemas import UserPayload
+from src.utils.metrics import metrics
+
+router = APIRouter()
+
+
+@router.get(
+    "/",
+    summary="Get application metrics",
+    description="Return in-process counters, gauges and histograms. Only admins can access this endpoint."
+)
+async def read_metrics(current_user: UserPayload = Depends(is_admin)) -> dict:
+    """Return a snapshot of all registered metrics."""
+    return metrics.snapshot()
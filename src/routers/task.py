@@ -1,16 +1,24 @@
-from fastapi import APIRouter, Depends, status, Query, Path
+from fastapi import APIRouter, Depends, status, Query, Path, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from src.deps.permissions import admin_manager_in_team, block_everyone, can_change_status, is_team_member
-from src.models import TaskStatus, TaskPriority, User
+from src.models import Task, TaskStatus, TaskPriority, User
 from src.services.auth import get_current_user
 from src.services.task import tasks_crud
 from src.schemas import TaskCreate, TaskUpdate, TaskRead, TaskShortRead, TaskStatusUpdate, TaskFilter, \
-    UserPayload
+    UserPayload, Page, TaskBulkCreate, TaskBulkCreateResponse
+from src.services.basecrud import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.config.db import get_db
+from src.services.versions import task_version
+from src.utils.conditional import conditional_response
+from src.utils.response_cache import response_cache, entity
+from src.utils.serialization import json_response
+from pydantic import TypeAdapter
 
 router = APIRouter()
 
+TASK_READ = TypeAdapter(TaskRead)
+
 
 @router.post(
     "/{team_id}/tasks/",
@@ -29,6 +37,26 @@ async def create_task(
     return await tasks_crud.create_task(db, task_in, current_user.id, team_id)
 
 
+@router.post(
+    "/{team_id}/tasks/bulk",
+    response_model=TaskBulkCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create many tasks for a team",
+    description=(
+        "Create up to 5000 tasks for the specified team in one request. Items whose assignees are not "
+        "members of the team are skipped and listed in `errors`. Only admins or managers in the team can create tasks."
+    )
+)
+async def bulk_create_tasks(
+    team_id: int = Path(..., description="ID of the team to assign the tasks to"),
+    bulk_in: TaskBulkCreate = ...,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserPayload = Depends(admin_manager_in_team)
+) -> TaskBulkCreateResponse:
+    """Create many tasks for a specific team."""
+    return await tasks_crud.bulk_create_tasks(db, bulk_in.tasks, current_user.id, team_id)
+
+
 @router.get(
     "/",
     response_model=List[TaskShortRead],
@@ -47,15 +75,25 @@ async def get_all_tasks(
     "/{task_id}",
     response_model=TaskRead,
     summary="Get task by ID",
-    description="Retrieve detailed information about a task by its ID. Any authenticated user can access."
+    description=(
+        "Retrieve detailed information about a task by its ID. Any authenticated user can access. "
+        "Supports If-None-Match and If-Modified-Since: 304 is returned while the task is unchanged."
+    )
 )
 async def get_task_by_id(
+        request: Request,
         task_id: int = Path(..., description="ID of the task to retrieve"),
         db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ) -> TaskRead:
-    """Get a task by its ID with detailed info."""
-    return await tasks_crud.get_task_by_id(db, task_id)
+    """Get a task by its ID with detailed info, served from the response cache while it is unchanged."""
+    return await conditional_response(
+        request, await task_version(db, task_id),
+        lambda: response_cache.get_or_load(
+            "GET /tasks/{task_id}", entity("task", task_id), TASK_READ,
+            lambda: tasks_crud.get_task_with_dependencies(db, task_id),
+            depends_on=[entity("task", task_id)],
+            resolve=lambda: tasks_crud.read_dependency_names(db, Task.id == task_id)))
 
 
 @router.put(
@@ -111,24 +149,27 @@ async def update_task_status(
 
 @router.post(
     "/my",
-    response_model=List[TaskShortRead],
+    response_model=Page[TaskShortRead],
     status_code=status.HTTP_201_CREATED,
     summary="Get tasks related to current user",
     description="Get tasks where the current user is an author or an executor, with optional filtering by status, priority, and team."
 )
 async def get_my_tasks(
         filters: TaskFilter = ...,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+        cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
         db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user)
-) -> List[TaskShortRead]:
-    """Get tasks where the current user is the author or performer."""
-    return await tasks_crud.get_user_related_tasks(db, current_user.id, filters.statuses, filters.priorities,
-                                                   filters.team_id)
+) -> Page[TaskShortRead]:
+    """Get a page of tasks where the current user is the author or performer."""
+    page = await tasks_crud.get_user_related_tasks(db, current_user.id, filters.statuses, filters.priorities,
+                                                   filters.team_id, limit, cursor)
+    return json_response(Page[TaskShortRead], page, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
     "/{team_id}/tasks",
-    response_model=List[TaskShortRead],
+    response_model=Page[TaskShortRead],
     summary="Get tasks for a team",
     description="Retrieve tasks for the specified team, optionally filtered by statuses and priorities. Only team members can access."
 )
@@ -136,8 +177,11 @@ async def get_tasks_for_team(
         team_id: int = Path(..., description="ID of the team"),
         statuses: Optional[List[TaskStatus]] = Query(None, description="Filter by task statuses"),
         priorities: Optional[List[TaskPriority]] = Query(None, description="Filter by task priorities"),
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+        cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
         db: AsyncSession = Depends(get_db),
         current_user: UserPayload = Depends(is_team_member)
-) -> List[TaskShortRead]:
-    """Retrieve all tasks for a specific team."""
-    return await tasks_crud.get_team_tasks(db, team_id, statuses, priorities)
+) -> Page[TaskShortRead]:
+    """Retrieve a page of tasks for a specific team."""
+    return json_response(
+        Page[TaskShortRead], await tasks_crud.get_team_tasks(db, team_id, statuses, priorities, limit, cursor))
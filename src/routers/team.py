@@ -1,15 +1,23 @@
-from fastapi import APIRouter, Depends, status, Path
+from fastapi import APIRouter, Depends, status, Path, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 from src.config.db import get_db
 from src.deps.permissions import is_admin, is_team_member, is_admin_and_member
 from src.models import User
-from src.schemas import TeamCreate, TeamUpdate, TeamRead, TeamWithUsersAndTask, UserPayload
+from src.schemas import TeamCreate, TeamUpdate, TeamRead, TeamWithUsersAndTask, UserPayload, Page
 from src.services.auth import get_current_user
+from src.services.basecrud import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.services.team import teams_crud
+from src.services.versions import team_version
+from src.utils.conditional import conditional_response
+from src.utils.response_cache import response_cache, entity
+from src.utils.serialization import json_response
+from pydantic import TypeAdapter
 
 router = APIRouter()
 
+TEAM_WITH_USERS_AND_TASKS = TypeAdapter(TeamWithUsersAndTask)
+
 
 @router.post(
     "/",
@@ -37,36 +45,49 @@ async def get_my_teams(
         db: AsyncSession = Depends(get_db),
         current_user: User = Depends(get_current_user),
 ) -> List[TeamRead]:
-    return await teams_crud.get_user_teams(db, current_user.id)
+    return json_response(List[TeamRead], await teams_crud.get_user_teams(db, current_user.id))
 
 
 @router.get(
     "/{team_id}",
     response_model=TeamWithUsersAndTask,
     summary="Get team details",
-    description="Get detailed information about a team by ID including its users and tasks. Accessible by team members only."
+    description=(
+        "Get detailed information about a team by ID including its users and tasks. Accessible by team members only. "
+        "Supports If-None-Match and If-Modified-Since: 304 is returned while the team, its members and tasks "
+        "are unchanged."
+    )
 )
 async def read_team(
+        request: Request,
         team_id: int = Path(..., description="ID of the team to retrieve"),
         db: AsyncSession = Depends(get_db),
         current_user: UserPayload = Depends(is_team_member)
 ) -> TeamWithUsersAndTask:
-    """Get team details by ID with users and tasks."""
-    return await teams_crud.get_by_id_with_relations(db, team_id)
+    """Get team details by ID with users and tasks, served from the response cache while they are unchanged."""
+    return await conditional_response(
+        request, await team_version(db, team_id),
+        lambda: response_cache.get_or_load(
+            "GET /teams/{team_id}", entity("team", team_id), TEAM_WITH_USERS_AND_TASKS,
+            lambda: teams_crud.get_team_with_dependencies(db, team_id),
+            depends_on=[entity("team", team_id)],
+            resolve=lambda: teams_crud.read_dependency_names(db, team_id)))
 
 
 @router.get(
     "/",
-    response_model=List[TeamRead],
+    response_model=Page[TeamRead],
     summary="List all teams",
-    description="Retrieve a list of all teams. Only admins can access this endpoint."
+    description="Retrieve a page of teams. Only admins can access this endpoint."
 )
 async def read_teams_all(
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+        cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
         db: AsyncSession = Depends(get_db),
         current_user: UserPayload = Depends(is_admin)
-) -> List[TeamRead]:
-    """List teams."""
-    return await teams_crud.get_all(db)
+) -> Page[TeamRead]:
+    """List a page of teams."""
+    return json_response(Page[TeamRead], await teams_crud.get_all(db, limit, cursor))
 
 
 @router.put(
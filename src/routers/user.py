@@ -1,28 +1,50 @@
-from fastapi import APIRouter, Depends, status, Path
-from typing import List
+from fastapi import APIRouter, Depends, status, Path, Query, Response
+from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.config.db import get_db
 from src.deps.permissions import is_admin, block_everyone, is_team_member
 from src.services.auth import get_current_user
+from src.services.basecrud import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.services.user import users_crud
 from src.models import UserRole
-from src.schemas import UserCreate, UserRead, UserUpdate, UserReadWithTeams, UserPayload
+from src.schemas import UserCreate, UserRead, UserUpdate, UserReadWithTeams, UserPayload, Page
+from src.utils.response_cache import response_cache, entity, entities
+from src.utils.serialization import json_response
+from pydantic import TypeAdapter
 
 router = APIRouter()
 
+USER_READ_WITH_TEAMS = TypeAdapter(UserReadWithTeams)
+
+
+async def cached_user_with_teams(route: str, db: AsyncSession, user_id: int) -> Response:
+    """A user with team memberships from the response cache; it depends on the user and the teams' names."""
+    async def teams():
+        return entities("team", await users_crud.team_ids(db, user_id))
+
+    async def load():
+        user = await users_crud.get_with_teams(db, user_id)
+        return user, entities("team", (team.team_id for team in user.teams))
+
+    return await response_cache.get_or_load(
+        route, entity("user", user_id), USER_READ_WITH_TEAMS, load, depends_on=[entity("user", user_id)],
+        resolve=teams)
+
 
 @router.get(
     "/",
-    response_model=List[UserRead],
+    response_model=Page[UserRead],
     summary="Get all users",
-    description="Retrieve a list of all users in the system."
+    description="Retrieve a page of users in the system."
 )
 async def read_users(
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+        cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
         db: AsyncSession = Depends(get_db),
         current_user: UserPayload = Depends(is_admin)
-) -> List[UserRead]:
-    """Get a list of all users."""
-    return await users_crud.get_all(db)
+) -> Page[UserRead]:
+    """Get a page of users."""
+    return json_response(Page[UserRead], await users_crud.get_all(db, limit, cursor))
 
 
 @router.get(
@@ -36,7 +58,7 @@ async def read_own_user_detail(
         current_user: UserPayload = Depends(get_current_user),
 ) -> UserReadWithTeams:
     """Get current user's profile."""
-    return await users_crud.get_with_teams(db, current_user.id)
+    return await cached_user_with_teams("GET /users/me", db, current_user.id)
 
 
 @router.put(
@@ -66,7 +88,7 @@ async def read_user_detail(
         current_user: UserPayload = Depends(is_admin)
 ) -> UserRead:
     """Get a user by ID."""
-    return await users_crud.get_with_teams(db, user_id)
+    return await cached_user_with_teams("GET /users/{user_id}", db, user_id)
 
 
 @router.post(
@@ -118,14 +140,16 @@ async def set_user_role(
 
 @router.get(
     "/teams/{team_id}/users",
-    response_model=List[UserRead],
+    response_model=Page[UserRead],
     summary="Get team members",
-    description="Retrieve all users who are members of the specified team. Access restricted to team members."
+    description="Retrieve a page of users who are members of the specified team. Access restricted to team members."
 )
 async def get_team_users(
         team_id: int = Path(..., description="ID of the team"),
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+        cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
         db: AsyncSession = Depends(get_db),
         current_user: UserPayload = Depends(is_team_member)
-) -> List[UserRead]:
-    """Get all users who are members of the team."""
-    return await users_crud.get_team_users(db, team_id)
+) -> Page[UserRead]:
+    """Get a page of users who are members of the team."""
+    return json_response(Page[UserRead], await users_crud.get_team_users(db, team_id, limit, cursor))
@@ -1,7 +1,12 @@
+from src.schemas.analytics import WeeklyThroughput, CycleTimeStats, AssigneeScore, AssigneeOverdue, OverdueStats, \
+    TeamAnalytics
 from src.schemas.auth import LoginRequest
 from src.schemas.evaluation import EvaluationRead, EvaluationCreate
-from src.schemas.meeting import MeetingCreate, MeetingShortRead, MeetingRead, MeetingUpdate
-from src.schemas.task import TaskCreate, TaskUpdate, TaskShortRead, TaskRead, TaskStatusUpdate, TaskFilter
+from src.schemas.export import ExportFormat, TaskExportRow, CommentExportRow, StatusHistoryExportRow
+from src.schemas.meeting import MeetingCreate, MeetingShortRead, MeetingRead, MeetingUpdate, TimeInterval, \
+    MeetingAvailability
+from src.schemas.task import TaskCreate, TaskUpdate, TaskShortRead, TaskRead, TaskStatusUpdate, TaskFilter, \
+    TaskBulkItem, TaskBulkCreate, TaskBulkCreateResponse
 from src.schemas.task_user import UsersRemoveResponse, UsersRemoveRequest, AddUsersResponse, RoleUpdateResponse, \
     RoleUpdatePayload, TaskAssigneeCreate, TaskUserAdd, AssigneeInfo
 from src.schemas.team import TeamWithUsersAndTask, TeamRead, TeamUpdate, TeamCreate, TeamBase
@@ -10,9 +15,20 @@ from src.schemas.team_user import TeamUserAssociationRead, TeamUserUpdateRole, A
 from src.schemas.user import UserPayload, UserUpdate, UserCreate, UserReadWithTeams, UserRead, UserTeamRead, \
     UserTeamInfo, UserBase
 from src.schemas.comment import CommentBase,  CommentRead, CommentUpdate
+from src.schemas.pagination import Page
 
 
 __all__ = [
+    'WeeklyThroughput',
+    'CycleTimeStats',
+    'AssigneeScore',
+    'AssigneeOverdue',
+    'OverdueStats',
+    'TeamAnalytics',
+    'ExportFormat',
+    'TaskExportRow',
+    'CommentExportRow',
+    'StatusHistoryExportRow',
     'LoginRequest',
     'CommentBase',
     'CommentRead',
@@ -28,6 +44,9 @@ __all__ = [
     'TaskRead',
     'TaskStatusUpdate',
     'TaskFilter',
+    'TaskBulkItem',
+    'TaskBulkCreate',
+    'TaskBulkCreateResponse',
     'AssigneeInfo',
     'TaskUserAdd',
     'TaskAssigneeCreate',
@@ -55,6 +74,9 @@ __all__ = [
     'UserUpdate',
     'UserPayload',
     'MeetingUpdate',
+    'TimeInterval',
+    'MeetingAvailability',
+    'Page',
 ]
 
 
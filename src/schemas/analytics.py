@@ -0,0 +1,51 @@
+from datetime import date
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class WeeklyThroughput(BaseModel):
+    """Tasks of the team moved to DONE during one week (Monday-based, UTC)."""
+    week_start: date
+    completed: int
+    cumulative: int
+
+
+class CycleTimeStats(BaseModel):
+    """Hours from task creation to its first move to DONE, for tasks completed in the period."""
+    tasks: int
+    p50_hours: Optional[float] = None
+    p75_hours: Optional[float] = None
+    p90_hours: Optional[float] = None
+
+
+class AssigneeScore(BaseModel):
+    """Average score received by a team member for the team's tasks in the period."""
+    user_id: int
+    full_name: str
+    average_score: float
+    evaluations: int
+    rank: int
+
+
+class AssigneeOverdue(BaseModel):
+    """Overdue tasks assigned to one team member."""
+    user_id: int
+    overdue: int
+
+
+class OverdueStats(BaseModel):
+    """Team tasks past their due date that are not done yet."""
+    total: int
+    unassigned: int
+    by_assignee: List[AssigneeOverdue]
+
+
+class TeamAnalytics(BaseModel):
+    """All team performance metrics for one period."""
+    team_id: int
+    start_date: date
+    end_date: date
+    throughput: List[WeeklyThroughput]
+    cycle_time: CycleTimeStats
+    assignee_scores: List[AssigneeScore]
+    overdue: OverdueStats
@@ -0,0 +1,48 @@
+import enum
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, ConfigDict
+from src.models.enum import TaskStatus, TaskPriority
+
+
+class ExportFormat(str, enum.Enum):
+    """Encoding of an export stream."""
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class TaskExportRow(BaseModel):
+    """One task of a team export."""
+    id: int
+    title: str
+    description: Optional[str] = None
+    status: TaskStatus
+    priority: Optional[TaskPriority] = None
+    due_date: Optional[datetime] = None
+    creator_id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CommentExportRow(BaseModel):
+    """One comment on a task of a team export."""
+    id: int
+    task_id: int
+    author_id: int
+    content: str
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class StatusHistoryExportRow(BaseModel):
+    """One status change of a task of a team export."""
+    id: int
+    task_id: int
+    changed_by_id: int
+    new_status: TaskStatus
+    changed_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
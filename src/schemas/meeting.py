@@ -56,3 +56,15 @@ class MeetingUpdate(BaseModel):
     end_datetime: Optional[datetime] = None
     add_participant_ids: List[int] = Field(default_factory=list)
     remove_participant_ids: List[int] = Field(default_factory=list)
+
+
+class TimeInterval(BaseModel):
+    """Half-open time interval [start, end)."""
+    start: datetime
+    end: datetime
+
+
+class MeetingAvailability(BaseModel):
+    """Merged busy intervals of the participants and the free slots that fit the requested duration."""
+    busy: List[TimeInterval]
+    free_slots: List[TimeInterval]
@@ -63,6 +63,25 @@ class TaskRead(TaskBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+MAX_BULK_TASKS = 5000
+
+
+class TaskBulkItem(TaskBase):
+    """One task of a bulk request; repeated assignees are checked per item by the service, not here."""
+    assignees: Optional[List[TaskUserAdd]] = None
+
+
+class TaskBulkCreate(BaseModel):
+    """Schema for creating many tasks of one team in a single request."""
+    tasks: List[TaskBulkItem] = Field(min_length=1, max_length=MAX_BULK_TASKS)
+
+
+class TaskBulkCreateResponse(BaseModel):
+    """Created tasks, in request order, and errors for the items that were skipped."""
+    created: List[TaskShortRead]
+    errors: List[str]
+
+
 class TaskStatusUpdate(BaseModel):
     """Schema for update status."""
     status: TaskStatus
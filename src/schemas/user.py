@@ -1,5 +1,6 @@
-from pydantic import BaseModel, EmailStr, Field, field_validator, ConfigDict
-from typing import Optional, List
+from pydantic import BaseModel, EmailStr, Field, field_validator, ConfigDict, PrivateAttr
+from typing import Optional, List, Any, Mapping, FrozenSet
+from types import MappingProxyType
 import re
 from src.models.enum import TeamRole
 from src.models.user import UserRole
@@ -78,6 +79,37 @@ class UserUpdate(BaseModel):
 
 class UserPayload(BaseModel):
     """The payload model for the JWT token."""
+    model_config = ConfigDict(frozen=True)
+
     id: int
     role: str
     teams: List[UserTeamInfo] = Field(default_factory=list)
+
+    _team_roles: Mapping[int, TeamRole] = PrivateAttr(default_factory=lambda: MappingProxyType({}))
+    _manager_teams: FrozenSet[int] = PrivateAttr(default_factory=frozenset)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Index team roles once so permission checks are O(1) lookups."""
+        self._team_roles = MappingProxyType({team.team_id: team.role for team in self.teams})
+        self._manager_teams = frozenset(
+            team_id for team_id, role in self._team_roles.items() if role == TeamRole.MANAGER
+        )
+
+    @property
+    def team_roles(self) -> Mapping[int, TeamRole]:
+        """Read-only mapping of team_id to the user's role in that team."""
+        return self._team_roles
+
+    @property
+    def manager_teams(self) -> FrozenSet[int]:
+        """IDs of teams where the user is a MANAGER."""
+        return self._manager_teams
+
+    def is_member(self, team_id: int) -> bool:
+        return team_id in self._team_roles
+
+    def team_role(self, team_id: int) -> Optional[TeamRole]:
+        return self._team_roles.get(team_id)
+
+    def is_manager(self, team_id: int) -> bool:
+        return team_id in self._manager_teams
@@ -0,0 +1,224 @@
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone
+from time import time as now
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+from fastapi import HTTPException
+from sqlalchemy import select, func, cast, distinct, text, tuple_, Date, DateTime
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.config.settings import settings
+from src.models import Task, TaskStatus, TaskStatusHistory, TaskAssigneeAssociation, Evaluation, \
+    EvaluationAssociation, User
+from src.schemas import WeeklyThroughput, CycleTimeStats, AssigneeScore, AssigneeOverdue, OverdueStats, \
+    TeamAnalytics
+from src.utils.cache import TTLCache
+
+DEFAULT_PERIOD = timedelta(weeks=12)
+MAX_PERIOD = timedelta(days=731)
+ANALYTICS_CACHE_SIZE = 1024
+
+analytics_cache = TTLCache(maxsize=ANALYTICS_CACHE_SIZE)
+_versions: Dict[Hashable, int] = defaultdict(int)
+
+
+def team_scope(team_id: int) -> Tuple[str, int]:
+    """Cache scope of everything derived from the tasks of one team."""
+    return "team", team_id
+
+
+ASSIGNEES_SCOPE = "assignees"
+EVALUATIONS_SCOPE = "evaluations"
+
+
+def invalidate_analytics(*scopes: Hashable) -> None:
+    """
+    Bump the version of the given scopes. Cached results embed the versions they were computed
+    with, so every result depending on a bumped scope is recomputed on its next read.
+    """
+    for scope in scopes:
+        _versions[scope] += 1
+
+
+async def _cached(key: tuple, scopes: Tuple[Hashable, ...], compute: Callable[[], Awaitable[Any]]) -> Any:
+    """Return the cached result for `key` at the current versions of `scopes`, computing it on a miss."""
+    versioned_key = (key, tuple(_versions[scope] for scope in scopes))
+    value = analytics_cache.get(versioned_key)
+    if value is None:
+        value = await compute()
+        analytics_cache.set(versioned_key, value, now() + settings.ANALYTICS_CACHE_TTL)
+    return value
+
+
+def analytics_period(start_date: Optional[date], end_date: Optional[date]) -> Tuple[date, date]:
+    """Resolve an inclusive period of UTC days, defaulting to the last twelve weeks."""
+    end_date = end_date or datetime.now(timezone.utc).date()
+    start_date = start_date or end_date - DEFAULT_PERIOD + timedelta(days=1)
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date must not be after end_date")
+    if end_date - start_date > MAX_PERIOD:
+        raise HTTPException(status_code=400, detail=f"Period must not exceed {MAX_PERIOD.days} days")
+    return start_date, end_date
+
+
+def _utc_bounds(start_date: date, end_date: date) -> Tuple[datetime, datetime]:
+    """Half-open UTC timestamp range covering the inclusive days."""
+    return (
+        datetime.combine(start_date, time.min, timezone.utc),
+        datetime.combine(end_date + timedelta(days=1), time.min, timezone.utc))
+
+
+def _utc_week(column):
+    """Monday of the UTC week a timestamptz column falls into."""
+    return cast(func.date_trunc("week", func.timezone("UTC", column)), Date)
+
+
+async def get_throughput(db: AsyncSession, team_id: int, start_date: date, end_date: date) -> List[WeeklyThroughput]:
+    """
+    Distinct tasks moved to DONE per week, with a running total.
+    Weeks without completions are produced by generate_series so the series has no gaps.
+    """
+    start, end = _utc_bounds(start_date, end_date)
+    week = _utc_week(TaskStatusHistory.changed_at)
+    completed = (
+        select(week.label("week"), func.count(distinct(TaskStatusHistory.task_id)).label("completed"))
+        .join(Task, Task.id == TaskStatusHistory.task_id)
+        .where(
+            Task.team_id == team_id,
+            TaskStatusHistory.new_status == TaskStatus.DONE,
+            TaskStatusHistory.changed_at >= start,
+            TaskStatusHistory.changed_at < end)
+        .group_by(week)
+        .subquery())
+    weeks = select(
+        cast(
+            func.generate_series(
+                func.date_trunc("week", cast(start_date, DateTime)),
+                func.date_trunc("week", cast(end_date, DateTime)),
+                text("interval '1 week'")),
+            Date).label("week")).subquery()
+
+    count = func.coalesce(completed.c.completed, 0)
+    stmt = (
+        select(weeks.c.week, count, func.sum(count).over(order_by=weeks.c.week))
+        .outerjoin(completed, completed.c.week == weeks.c.week)
+        .order_by(weeks.c.week))
+    result = await db.execute(stmt)
+    return [
+        WeeklyThroughput(week_start=week_start, completed=completed, cumulative=cumulative)
+        for week_start, completed, cumulative in result.all()]
+
+
+async def get_cycle_time(db: AsyncSession, team_id: int, start_date: date, end_date: date) -> CycleTimeStats:
+    """
+    Percentiles of the hours between task creation and the task's first move to DONE,
+    for tasks whose first completion falls in the period.
+    """
+    start, end = _utc_bounds(start_date, end_date)
+    done = (
+        select(
+            TaskStatusHistory.task_id,
+            TaskStatusHistory.changed_at,
+            func.row_number().over(
+                partition_by=TaskStatusHistory.task_id,
+                order_by=TaskStatusHistory.changed_at).label("n"))
+        .join(Task, Task.id == TaskStatusHistory.task_id)
+        .where(Task.team_id == team_id, TaskStatusHistory.new_status == TaskStatus.DONE)
+        .subquery())
+    hours = func.extract("epoch", done.c.changed_at - Task.created_at) / 3600
+
+    stmt = (
+        select(
+            func.count(),
+            func.percentile_cont(0.5).within_group(hours),
+            func.percentile_cont(0.75).within_group(hours),
+            func.percentile_cont(0.9).within_group(hours))
+        .select_from(done)
+        .join(Task, Task.id == done.c.task_id)
+        .where(done.c.n == 1, done.c.changed_at >= start, done.c.changed_at < end))
+    tasks, p50, p75, p90 = (await db.execute(stmt)).one()
+    return CycleTimeStats(tasks=tasks, p50_hours=p50, p75_hours=p75, p90_hours=p90)
+
+
+async def get_assignee_scores(db: AsyncSession, team_id: int, start_date: date, end_date: date) -> List[AssigneeScore]:
+    """Average score each member received for the team's tasks in the period, ranked best first."""
+    start, end = _utc_bounds(start_date, end_date)
+    average = func.avg(Evaluation.score)
+    rank = func.rank().over(order_by=average.desc())
+    stmt = (
+        select(User.id, User.first_name, User.last_name, average, func.count(), rank)
+        .join(EvaluationAssociation, EvaluationAssociation.user_id == User.id)
+        .join(Evaluation, Evaluation.id == EvaluationAssociation.evaluation_id)
+        .join(Task, Task.id == Evaluation.task_id)
+        .where(Task.team_id == team_id, Evaluation.created_at >= start, Evaluation.created_at < end)
+        .group_by(User.id)
+        .order_by(rank, User.id))
+    result = await db.execute(stmt)
+    return [
+        AssigneeScore(
+            user_id=user_id,
+            full_name=f"{first_name} {last_name}".strip(),
+            average_score=float(average_score),
+            evaluations=evaluations,
+            rank=position)
+        for user_id, first_name, last_name, average_score, evaluations, position in result.all()]
+
+
+async def get_overdue(db: AsyncSession, team_id: int) -> OverdueStats:
+    """
+    Not-done team tasks past their due date: the team total, the unassigned ones and a count
+    per assignee, from one GROUPING SETS aggregate.
+    """
+    user_id = TaskAssigneeAssociation.user_id
+    stmt = (
+        select(func.grouping(user_id), user_id, func.count(distinct(Task.id)))
+        .outerjoin(TaskAssigneeAssociation, TaskAssigneeAssociation.task_id == Task.id)
+        .where(Task.team_id == team_id, Task.status != TaskStatus.DONE, Task.due_date < func.now())
+        .group_by(func.grouping_sets(tuple_(user_id), tuple_()))
+        .order_by(user_id))
+    result = await db.execute(stmt)
+
+    total = unassigned = 0
+    by_assignee = []
+    for is_total, assignee_id, overdue in result.all():
+        if is_total:
+            total = overdue
+        elif assignee_id is None:
+            unassigned = overdue
+        else:
+            by_assignee.append(AssigneeOverdue(user_id=assignee_id, overdue=overdue))
+    return OverdueStats(total=total, unassigned=unassigned, by_assignee=by_assignee)
+
+
+async def team_throughput(db: AsyncSession, team_id: int, start_date: date, end_date: date) -> List[WeeklyThroughput]:
+    return await _cached(
+        ("throughput", team_id, start_date, end_date), (team_scope(team_id),),
+        lambda: get_throughput(db, team_id, start_date, end_date))
+
+
+async def team_cycle_time(db: AsyncSession, team_id: int, start_date: date, end_date: date) -> CycleTimeStats:
+    return await _cached(
+        ("cycle_time", team_id, start_date, end_date), (team_scope(team_id),),
+        lambda: get_cycle_time(db, team_id, start_date, end_date))
+
+
+async def team_assignee_scores(db: AsyncSession, team_id: int, start_date: date, end_date: date) -> List[AssigneeScore]:
+    return await _cached(
+        ("scores", team_id, start_date, end_date), (team_scope(team_id), EVALUATIONS_SCOPE),
+        lambda: get_assignee_scores(db, team_id, start_date, end_date))
+
+
+async def team_overdue(db: AsyncSession, team_id: int) -> OverdueStats:
+    return await _cached(
+        ("overdue", team_id), (team_scope(team_id), ASSIGNEES_SCOPE),
+        lambda: get_overdue(db, team_id))
+
+
+async def team_analytics(db: AsyncSession, team_id: int, start_date: date, end_date: date) -> TeamAnalytics:
+    """All metrics of a team, each read through the cache."""
+    return TeamAnalytics(
+        team_id=team_id,
+        start_date=start_date,
+        end_date=end_date,
+        throughput=await team_throughput(db, team_id, start_date, end_date),
+        cycle_time=await team_cycle_time(db, team_id, start_date, end_date),
+        assignee_scores=await team_assignee_scores(db, team_id, start_date, end_date),
+        overdue=await team_overdue(db, team_id))
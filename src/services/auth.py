@@ -5,10 +5,17 @@ from src.config.settings import settings
 from fastapi import Depends, HTTPException, status
 from src.models import TeamRole
 from src.schemas import UserPayload, UserTeamInfo
+from src.utils.cache import TTLCache
+from src.utils.metrics import metrics
 
 # oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 bearer_scheme = HTTPBearer()
 
+# Verified access tokens keyed by signature; each entry lives until the token's exp claim.
+token_cache = TTLCache(maxsize=settings.AUTH_TOKEN_CACHE_SIZE)
+token_cache_hits = metrics.counter("auth_token_cache_hits_total")
+token_cache_misses = metrics.counter("auth_token_cache_misses_total")
+
 
 async def get_current_user(token: HTTPAuthorizationCredentials = Depends(bearer_scheme)) -> UserPayload:
     """Decode JWT token and return current user's ID, role and team roles."""
@@ -17,8 +24,15 @@ async def get_current_user(token: HTTPAuthorizationCredentials = Depends(bearer_
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    token_str = token.credentials
+    signature = token_str.rpartition(".")[2]
+    cached = token_cache.get(signature)
+    if cached is not None and cached[0] == token_str:
+        token_cache_hits.inc()
+        return cached[1]
+    token_cache_misses.inc()
+
     try:
-        token_str = token.credentials
         payload = jwt.decode(token_str, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
 
         if payload.get("token_type") == "refresh":
@@ -38,7 +52,9 @@ async def get_current_user(token: HTTPAuthorizationCredentials = Depends(bearer_
             for team in teams_data
         ]
 
-        return UserPayload(id=user_id, role=role, teams=teams)
+        user = UserPayload(id=user_id, role=role, teams=teams)
+        token_cache.set(signature, (token_str, user), expires_at=payload["exp"])
+        return user
 
     except (JWTError, ValueError, TypeError, KeyError) as e:
         raise credentials_exception
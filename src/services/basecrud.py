@@ -1,8 +1,19 @@
-from typing import Any, List, Type
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, Callable, List, Optional, Sequence, Type
 from fastapi import HTTPException
+from sqlalchemy import Row, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.sql import Select
 from pydantic import BaseModel
+from src.schemas import Page
+from src.utils.serialization import type_adapter
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
 
 
 class BaseCRUD:
@@ -11,6 +22,74 @@ class BaseCRUD:
         self.model = model
         self.read_schema = read_schema
 
+    @staticmethod
+    def encode_cursor(sort_value: Any, last_id: int) -> str:
+        """Pack the last row's (sort_key, id) into an opaque URL-safe cursor."""
+        if isinstance(sort_value, (datetime, date)):
+            sort_value = sort_value.isoformat()
+        raw = json.dumps([sort_value, last_id], separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str, sort_column: Any) -> tuple[Any, int]:
+        """Unpack a cursor produced by `encode_cursor`, restoring the sort key type."""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            sort_value, last_id = json.loads(raw)
+            python_type = sort_column.type.python_type
+            if python_type in (datetime, date):
+                sort_value = python_type.fromisoformat(sort_value)
+            return sort_value, int(last_id)
+        except (binascii.Error, ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    async def paginate(
+            self,
+            db: AsyncSession,
+            stmt: Select,
+            limit: int = DEFAULT_PAGE_SIZE,
+            cursor: Optional[str] = None,
+            sort_column: Any = None,
+            descending: bool = False,
+            schema: Optional[Type[BaseModel]] = None,
+            build: Optional[Callable[[Row], BaseModel]] = None,
+    ) -> Page:
+        """
+        Apply keyset pagination to a select of `self.model` ordered by (sort_column, id).
+        The statement must select the model entity first; rows after the cursor are fetched with
+        a row-value comparison so each page is a bounded index range scan.
+        Items are validated from the entities with `schema` in a single TypeAdapter call, or from
+        the whole row with `build` when the statement projects extra columns next to it.
+        """
+        schema = schema or self.read_schema
+        id_column = self.model.id
+        sort_column = id_column if sort_column is None else sort_column
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        keyset = id_column if sort_column is id_column else tuple_(sort_column, id_column)
+
+        if cursor:
+            sort_value, last_id = self.decode_cursor(cursor, sort_column)
+            bound = last_id if sort_column is id_column else tuple_(sort_value, last_id)
+            stmt = stmt.where(keyset < bound if descending else keyset > bound)
+
+        order = [sort_column] if sort_column is id_column else [sort_column, id_column]
+        stmt = stmt.order_by(*[c.desc() if descending else c.asc() for c in order]).limit(limit + 1)
+
+        result = await db.execute(stmt)
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1][0]
+            next_cursor = self.encode_cursor(getattr(last, sort_column.key), last.id)
+
+        if build is None:
+            items = type_adapter(List[schema]).validate_python([row[0] for row in rows], from_attributes=True)
+        else:
+            items = [build(row) for row in rows]
+        return Page(items=items, next_cursor=next_cursor)
+
     async def get_by_id(self, db: AsyncSession, obj_id: int) -> BaseModel:
         """Get single object by its ID."""
         result = await db.execute(select(self.model).where(self.model.id == obj_id))
@@ -19,11 +98,14 @@ class BaseCRUD:
             raise HTTPException(status_code=404, detail="Object not found")
         return self.read_schema.model_validate(obj)
 
-    async def get_all(self, db: AsyncSession) -> List[BaseModel]:
-        """Get all objects."""
-        result = await db.execute(select(self.model))
-        objs = result.scalars().all()
-        return [self.read_schema.model_validate(obj) for obj in objs]
+    async def get_all(
+            self,
+            db: AsyncSession,
+            limit: int = DEFAULT_PAGE_SIZE,
+            cursor: Optional[str] = None
+    ) -> Page:
+        """Get a page of objects ordered by ID."""
+        return await self.paginate(db, select(self.model), limit, cursor)
 
     async def create(self, db: AsyncSession, obj_in: BaseModel) -> BaseModel:
         """Create a new object."""
@@ -31,7 +113,6 @@ class BaseCRUD:
         db.add(obj)
         try:
             await db.commit()
-            await db.refresh(obj)
         except Exception as e:
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"Database error: {e}")
@@ -50,17 +131,24 @@ class BaseCRUD:
 
         try:
             await db.commit()
-            await db.refresh(obj)
         except Exception as e:
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"Database error: {e}")
 
         return self.read_schema.model_validate(obj)
 
-    async def delete(self, db: AsyncSession, obj_id: int) -> None:
-        """Delete object by its ID."""
-        result = await db.execute(select(self.model).where(self.model.id == obj_id))
-        obj = result.scalar_one_or_none()
+    async def delete(self, db: AsyncSession, obj_id: int, options: Sequence[Any] = ()) -> Any:
+        """
+        Delete object by its ID and return the deleted object.
+        `options` eager-load the collections the delete cascades into, so the cascade does not
+        lazy-load them one parent row at a time. Without options the object is taken from the
+        session identity map when a permission check already loaded it.
+        """
+        if options:
+            result = await db.execute(select(self.model).options(*options).where(self.model.id == obj_id))
+            obj = result.scalar_one_or_none()
+        else:
+            obj = await db.get(self.model, obj_id)
         if not obj:
             raise HTTPException(status_code=404, detail="Object not found")
 
@@ -70,3 +158,5 @@ class BaseCRUD:
         except Exception as e:
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"Database error: {e}")
+
+        return obj
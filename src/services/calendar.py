@@ -1,13 +1,157 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, exists, union, union_all, delete, insert, null, cast, func, Date
 import asyncio
 from collections import defaultdict
-from datetime import date
-from typing import Dict, List
-from src.models import Task, TaskAssigneeAssociation, Meeting, TeamUserAssociation, User
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+from sqlalchemy.sql import ColumnElement, Select
+from src.config.settings import settings
+from src.models import Task, TaskAssigneeAssociation, Meeting, TeamUserAssociation, CalendarEntry, \
+    MeetingParticipantAssociation
 from src.schemas.calendar import CalendarEvent, CalendarTask, CalendarMeeting
 
+ENTRY_COLUMNS = ("user_id", "day", "task_id", "meeting_id", "title", "start_datetime", "end_datetime")
+
+
+class CalendarCheckResult(NamedTuple):
+    """Differences between the materialized calendar and the rows derived from tasks and meetings."""
+    missing: List[tuple]
+    stale: List[tuple]
+
+    @property
+    def consistent(self) -> bool:
+        return not self.missing and not self.stale
+
+
+def _utc_day(column):
+    """Calendar day of a timestamptz column, taken in UTC like the API returns it."""
+    return cast(func.timezone("UTC", column), Date)
+
+
+def _task_entries_source(task_ids: Optional[List[int]] = None) -> Select:
+    """Calendar rows for tasks with a due date: one per creator or assignee."""
+    creators = select(Task.id.label("task_id"), Task.creator_id.label("user_id"))
+    assignees = select(TaskAssigneeAssociation.task_id, TaskAssigneeAssociation.user_id)
+    tasks = select(Task).where(Task.due_date.isnot(None))
+    if task_ids is not None:
+        creators = creators.where(Task.id.in_(task_ids))
+        assignees = assignees.where(TaskAssigneeAssociation.task_id.in_(task_ids))
+        tasks = tasks.where(Task.id.in_(task_ids))
+    task_users = union(creators, assignees).subquery()
+    task = tasks.subquery()
+
+    return (
+        select(
+            task_users.c.user_id,
+            _utc_day(task.c.due_date).label("day"),
+            task.c.id.label("task_id"),
+            null().label("meeting_id"),
+            task.c.title,
+            null().label("start_datetime"),
+            null().label("end_datetime"))
+        .join(task_users, task_users.c.task_id == task.c.id))
+
+
+def _meeting_entries_source(meeting_ids: Optional[List[int]] = None) -> Select:
+    """Calendar rows for meetings: one per participant."""
+    stmt = (
+        select(
+            MeetingParticipantAssociation.user_id,
+            _utc_day(Meeting.start_datetime).label("day"),
+            null().label("task_id"),
+            Meeting.id.label("meeting_id"),
+            func.coalesce(Meeting.title, "Untitled").label("title"),
+            Meeting.start_datetime,
+            Meeting.end_datetime)
+        .join(MeetingParticipantAssociation, MeetingParticipantAssociation.meeting_id == Meeting.id))
+    if meeting_ids is not None:
+        stmt = stmt.where(Meeting.id.in_(meeting_ids))
+    return stmt
+
+
+async def clear_calendar(db: AsyncSession, condition: ColumnElement[bool]) -> Set[int]:
+    """
+    Delete the calendar entries matching `condition` ahead of a delete that would cascade to them,
+    and return the users whose calendars lost entries.
+    """
+    result = await db.execute(delete(CalendarEntry).where(condition).returning(CalendarEntry.user_id))
+    return set(result.scalars().all())
+
+
+async def _replace_entries(db: AsyncSession, condition: ColumnElement[bool], source: Select) -> Set[int]:
+    """Swap the entries matching `condition` for the rows of `source`; return the users on either side."""
+    users = await clear_calendar(db, condition)
+    result = await db.execute(
+        insert(CalendarEntry).from_select(ENTRY_COLUMNS, source).returning(CalendarEntry.user_id))
+    return users | set(result.scalars().all())
+
+
+async def sync_task_calendar(db: AsyncSession, task_ids: Iterable[int]) -> Set[int]:
+    """
+    Replace the calendar entries of the given tasks with rows derived from their current state,
+    returning the users whose calendars changed.
+    Runs in the caller's transaction, so pending ORM changes are flushed first and the entries
+    commit or roll back together with the change that caused them.
+    """
+    task_ids = list(task_ids)
+    if not task_ids:
+        return set()
+    return await _replace_entries(db, CalendarEntry.task_id.in_(task_ids), _task_entries_source(task_ids))
+
+
+async def sync_meeting_calendar(db: AsyncSession, meeting_ids: Iterable[int]) -> Set[int]:
+    """Replace the calendar entries of the given meetings; see `sync_task_calendar`."""
+    meeting_ids = list(meeting_ids)
+    if not meeting_ids:
+        return set()
+    return await _replace_entries(
+        db, CalendarEntry.meeting_id.in_(meeting_ids), _meeting_entries_source(meeting_ids))
+
+
+async def rebuild_calendar(db: AsyncSession) -> int:
+    """Recreate the whole materialized calendar from tasks and meetings. The caller commits."""
+    await db.execute(delete(CalendarEntry))
+    await db.execute(insert(CalendarEntry).from_select(ENTRY_COLUMNS, _task_entries_source()))
+    await db.execute(insert(CalendarEntry).from_select(ENTRY_COLUMNS, _meeting_entries_source()))
+    return await db.scalar(select(func.count()).select_from(CalendarEntry))
+
+
+async def check_calendar(db: AsyncSession) -> CalendarCheckResult:
+    """Compare stored calendar entries with the rows the current tasks and meetings produce."""
+    expected = union_all(_task_entries_source(), _meeting_entries_source()).subquery()
+    stored = select(*(getattr(CalendarEntry, column) for column in ENTRY_COLUMNS))
+    expected_rows = select(*(expected.c[column] for column in ENTRY_COLUMNS))
+
+    missing = (await db.execute(expected_rows.except_(stored))).all()
+    stale = (await db.execute(stored.except_(expected_rows))).all()
+    return CalendarCheckResult(
+        missing=[tuple(row) for row in missing],
+        stale=[tuple(row) for row in stale])
+
+
+async def _fetch_all(db: AsyncSession, *stmts: Select) -> List[Sequence[Any]]:
+    """
+    Run independent calendar queries and return the rows of each.
+    An AsyncSession cannot execute statements concurrently, so with CALENDAR_FANOUT enabled
+    every query gets its own short-lived session (and pooled connection) on the same engine;
+    otherwise they run one after another on the request session.
+    """
+    if not settings.CALENDAR_FANOUT:
+        return [(await db.execute(stmt)).all() for stmt in stmts]
+
+    async def run(stmt: Select) -> Sequence[Any]:
+        async with AsyncSession(bind=db.bind, expire_on_commit=False) as session:
+            return (await session.execute(stmt)).all()
+
+    return list(await asyncio.gather(*(run(stmt) for stmt in stmts)))
+
+
+def _utc_bounds(start_date: date, end_date: date) -> Tuple[datetime, datetime]:
+    """Half-open UTC timestamp range covering whole days from start_date through end_date."""
+    return (
+        datetime.combine(start_date, time.min, tzinfo=timezone.utc),
+        datetime.combine(end_date + timedelta(days=1), time.min, tzinfo=timezone.utc))
+
 
 async def get_user_calendar(
         db: AsyncSession,
@@ -15,48 +159,35 @@ async def get_user_calendar(
         end_date: date,
         user_id: int,
 ) -> Dict[date, List[CalendarEvent]]:
-    """Fetches user's tasks and meetings within a date range with optimized queries."""
-    task_stmt, meeting_stmt = (
-        select(Task).distinct()
-        .where(
-            Task.due_date.between(start_date, end_date),
-            or_(
-                Task.creator_id == user_id,
-                Task.assignee_associations.any(TaskAssigneeAssociation.user_id == user_id)))
-        .options(selectinload(Task.assignee_associations)),
-
-        select(Meeting).distinct()
+    """Reads the user's materialized calendar for the date range with a single indexed scan."""
+    result = await db.execute(
+        select(
+            CalendarEntry.day,
+            CalendarEntry.task_id,
+            CalendarEntry.meeting_id,
+            CalendarEntry.title,
+            CalendarEntry.start_datetime,
+            CalendarEntry.end_datetime)
         .where(
-            Meeting.start_datetime.between(start_date, end_date),
-            Meeting.participants.any(id=user_id))
-        .options(selectinload(Meeting.participants)))
-
-    task_result, meeting_result = await asyncio.gather(
-        db.execute(task_stmt),
-        db.execute(meeting_stmt))
-
-    tasks = task_result.scalars().all()
-    meetings = meeting_result.scalars().all()
+            CalendarEntry.user_id == user_id,
+            CalendarEntry.day.between(start_date, end_date))
+        .order_by(
+            CalendarEntry.day,
+            CalendarEntry.meeting_id.isnot(None),
+            CalendarEntry.start_datetime,
+            CalendarEntry.id))
 
     calendar: Dict[date, List[CalendarEvent]] = defaultdict(list)
 
-    for task in tasks:
-        if task.due_date:
-            calendar[task.due_date.date()].append(CalendarTask(
-                id=task.id,
-                title=task.title,
-                due_date=task.due_date.date()))
-
-    for meeting in meetings:
-        calendar[meeting.start_datetime.date()].append(CalendarMeeting(
-            id=meeting.id,
-            title=meeting.title or "Untitled",
-            start_datetime=meeting.start_datetime,
-            end_datetime=meeting.end_datetime))
-
-    for events in calendar.values():
-        events.sort(
-            key=lambda e: e.due_date if isinstance(e, CalendarTask) else e.start_datetime.date())
+    for day, task_id, meeting_id, title, start_datetime, end_datetime in result.all():
+        if task_id is not None:
+            calendar[day].append(CalendarTask(id=task_id, title=title, due_date=day))
+        else:
+            calendar[day].append(CalendarMeeting(
+                id=meeting_id,
+                title=title,
+                start_datetime=start_datetime,
+                end_datetime=end_datetime))
 
     return dict(calendar)
 
@@ -67,47 +198,46 @@ async def get_team_calendar(
         start_date: date,
         end_date: date,
 ) -> Dict[date, List[CalendarEvent]]:
-    """Retrieve team calendar events with optimized single-query approach for meetings."""
+    """
+    Retrieve team calendar events within the date range.
+    Only the columns the calendar shows are selected; the day is computed and ordered in SQL,
+    so rows go straight into the event schemas without loading ORM entities.
+    """
+    range_start, range_end = _utc_bounds(start_date, end_date)
+    task_day = _utc_day(Task.due_date).label("day")
+    meeting_day = _utc_day(Meeting.start_datetime).label("day")
+
     task_stmt, meeting_stmt = (
-        select(Task)
+        select(task_day, Task.id, Task.title)
         .where(
             Task.team_id == team_id,
-            Task.due_date.between(start_date, end_date))
-        .options(selectinload(Task.assignee_associations)),
+            Task.due_date >= range_start,
+            Task.due_date < range_end)
+        .order_by(task_day, Task.id),
 
-        select(Meeting).distinct()
-        .join(Meeting.participants)
-        .join(TeamUserAssociation, TeamUserAssociation.user_id == User.id)
+        select(meeting_day, Meeting.id, Meeting.title, Meeting.start_datetime, Meeting.end_datetime)
         .where(
-            Meeting.start_datetime.between(start_date, end_date),
-            TeamUserAssociation.team_id == team_id)
-        .options(selectinload(Meeting.participants)))
-
-    task_result, meeting_result = await asyncio.gather(
-        db.execute(task_stmt),
-        db.execute(meeting_stmt))
+            Meeting.start_datetime >= range_start,
+            Meeting.start_datetime < range_end,
+            exists()
+            .where(
+                MeetingParticipantAssociation.meeting_id == Meeting.id,
+                TeamUserAssociation.user_id == MeetingParticipantAssociation.user_id,
+                TeamUserAssociation.team_id == team_id))
+        .order_by(meeting_day, Meeting.start_datetime, Meeting.id))
 
-    tasks = task_result.scalars().all()
-    meetings = meeting_result.scalars().all()
+    task_rows, meeting_rows = await _fetch_all(db, task_stmt, meeting_stmt)
 
     calendar: Dict[date, List[CalendarEvent]] = defaultdict(list)
 
-    for task in tasks:
-        if task.due_date:
-            calendar[task.due_date.date()].append(CalendarTask(
-                id=task.id,
-                title=task.title,
-                due_date=task.due_date.date()))
+    for day, task_id, title in task_rows:
+        calendar[day].append(CalendarTask(id=task_id, title=title, due_date=day))
 
-    for meeting in meetings:
-        calendar[meeting.start_datetime.date()].append(CalendarMeeting(
-            id=meeting.id,
-            title=meeting.title or "Untitled",
-            start_datetime=meeting.start_datetime,
-            end_datetime=meeting.end_datetime))
-
-    for events in calendar.values():
-        events.sort(key=lambda e: e.due_date if isinstance(e, CalendarTask) else e.start_datetime.date())
-
-    return dict(calendar)
+    for day, meeting_id, title, start_datetime, end_datetime in meeting_rows:
+        calendar[day].append(CalendarMeeting(
+            id=meeting_id,
+            title=title or "Untitled",
+            start_datetime=start_datetime,
+            end_datetime=end_datetime))
 
+    return dict(sorted(calendar.items()))
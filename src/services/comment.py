@@ -1,11 +1,12 @@
-from typing import List
+from typing import Any, List, Optional, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.models import Comment
-from src.schemas import CommentRead, CommentBase, CommentUpdate
-from src.services.basecrud import BaseCRUD
+from src.schemas import CommentRead, CommentBase, CommentUpdate, Page
+from src.services.basecrud import BaseCRUD, DEFAULT_PAGE_SIZE
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from fastapi import HTTPException
+from src.utils.response_cache import response_cache, entity
 
 
 class CommentCRUD(BaseCRUD):
@@ -26,6 +27,7 @@ class CommentCRUD(BaseCRUD):
         except Exception as e:
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"Database error: {e}")
+        await response_cache.invalidate(entity("comments", task_id))
 
         result = await db.execute(
             select(Comment)
@@ -43,13 +45,11 @@ class CommentCRUD(BaseCRUD):
             comment_in: CommentUpdate,
             user_id: int,
     ) -> CommentRead:
-        """Update comment content. Only the author can update their comment."""
-        result = await db.execute(
-            select(Comment)
-            .where(Comment.id == comment_id)
-            .options(selectinload(Comment.author))
-        )
-        comment: Comment | None = result.scalar_one_or_none()
+        """
+        Update comment content. Only the author can update their comment.
+        The comment is taken from the session identity map when the permission check already loaded it.
+        """
+        comment: Comment | None = await db.get(Comment, comment_id, options=[selectinload(Comment.author)])
 
         if not comment:
             raise HTTPException(status_code=404, detail="Comment not found")
@@ -65,19 +65,35 @@ class CommentCRUD(BaseCRUD):
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"Database error: {e}")
 
+        await response_cache.invalidate(entity("comments", comment.task_id))
         return CommentRead.model_validate(comment)
 
-    async def get_comments_by_task(self, db: AsyncSession, task_id: int) -> List[CommentRead]:
-        """Retrieve all comments for a specific task, ordered by creation date descending."""
-        result = await db.execute(
+    async def delete(self, db: AsyncSession, obj_id: int, options: Sequence[Any] = ()) -> Comment:
+        """Delete a comment by its ID."""
+        comment = await super().delete(db, obj_id, options=options)
+        await response_cache.invalidate(entity("comments", comment.task_id))
+        return comment
+
+    @staticmethod
+    async def author_ids(db: AsyncSession, task_id: int) -> List[int]:
+        """IDs of the users who commented on the task."""
+        result = await db.execute(select(Comment.author_id).where(Comment.task_id == task_id).distinct())
+        return list(result.scalars().all())
+
+    async def get_comments_by_task(
+            self,
+            db: AsyncSession,
+            task_id: int,
+            limit: int = DEFAULT_PAGE_SIZE,
+            cursor: Optional[str] = None
+    ) -> Page[CommentRead]:
+        """Retrieve a page of comments for a specific task, ordered by creation date descending."""
+        stmt = (
             select(Comment)
             .where(Comment.task_id == task_id)
-            .order_by(Comment.created_at.desc())
             .options(selectinload(Comment.author))
         )
-        comments = result.scalars().all()
-
-        return [CommentRead.model_validate(c) for c in comments]
+        return await self.paginate(db, stmt, limit, cursor, sort_column=Comment.created_at, descending=True)
 
 
 comment_crud = CommentCRUD()
@@ -1,13 +1,60 @@
-from datetime import datetime, date, timezone, time
-from src.models import TaskAssigneeAssociation, EvaluationAssociation, User
-from src.services.basecrud import BaseCRUD
+from datetime import datetime, date, timedelta, timezone, time
+from typing import Optional
+from src.config.settings import settings
+from src.models import TaskAssigneeAssociation, EvaluationAssociation, EvaluationScoreDaily, User
+from src.services.analytics import invalidate_analytics, EVALUATIONS_SCOPE
+from src.services.basecrud import BaseCRUD, DEFAULT_PAGE_SIZE
 from src.models.evaluation import Evaluation
-from src.schemas import EvaluationCreate, EvaluationRead
-from sqlalchemy import and_, select, func
+from src.schemas import EvaluationCreate, EvaluationRead, Page
+from sqlalchemy import Row, and_, select, func, cast, delete, update, true, Date, Numeric
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql import ColumnElement, Select
 from fastapi import HTTPException
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+ROLLUP_COLUMNS = ("user_id", "day", "score_sum", "score_count")
+
+
+def _received_scores(condition: ColumnElement[bool]) -> Select:
+    """Score sum and count per recipient and UTC day of the evaluations matching `condition`."""
+    day = cast(func.timezone("UTC", Evaluation.created_at), Date)
+    return (
+        select(
+            EvaluationAssociation.user_id,
+            day.label("day"),
+            func.sum(Evaluation.score).label("score_sum"),
+            func.count().label("score_count"))
+        .join(Evaluation, Evaluation.id == EvaluationAssociation.evaluation_id)
+        .where(condition)
+        .group_by(EvaluationAssociation.user_id, day))
+
+
+async def adjust_score_rollup(db: AsyncSession, condition: ColumnElement[bool], sign: int = 1) -> None:
+    """
+    Add (sign=1) or subtract (sign=-1) the received scores of the evaluations matching `condition`
+    to the daily rollup with one INSERT ... SELECT ... ON CONFLICT DO UPDATE.
+    Runs in the caller's transaction; pending recipients are flushed first by autoflush.
+    """
+    source = _received_scores(condition).subquery()
+    stmt = insert(EvaluationScoreDaily).from_select(
+        ROLLUP_COLUMNS,
+        select(source.c.user_id, source.c.day, source.c.score_sum * sign, source.c.score_count * sign))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[EvaluationScoreDaily.user_id, EvaluationScoreDaily.day],
+        set_={
+            "score_sum": EvaluationScoreDaily.score_sum + stmt.excluded.score_sum,
+            "score_count": EvaluationScoreDaily.score_count + stmt.excluded.score_count})
+    await db.execute(stmt)
+
+
+async def rebuild_score_rollup(db: AsyncSession) -> int:
+    """Recreate the daily score rollup from all evaluations. The caller commits."""
+    await db.execute(delete(EvaluationScoreDaily))
+    result = await db.execute(
+        insert(EvaluationScoreDaily).from_select(ROLLUP_COLUMNS, _received_scores(true())))
+    return result.rowcount
+
 
 class EvaluationCRUD(BaseCRUD):
     def __init__(self):
@@ -50,12 +97,13 @@ class EvaluationCRUD(BaseCRUD):
             ]
             db.add_all(recipients)
 
+            await adjust_score_rollup(db, Evaluation.id == evaluation.id)
             await db.commit()
         except SQLAlchemyError as e:
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"Database error: {e}")
 
-        await db.refresh(evaluation)
+        invalidate_analytics(EVALUATIONS_SCOPE)
         return EvaluationRead.model_validate(evaluation)
 
     async def update_evaluation(
@@ -76,35 +124,70 @@ class EvaluationCRUD(BaseCRUD):
         if not evaluation:
             raise HTTPException(status_code=404, detail="Evaluation not found")
 
+        score_delta = eva_in.score - evaluation.score
         evaluation.score = eva_in.score
         evaluation.feedback = eva_in.feedback
         evaluation.updated_at = datetime.now(timezone.utc)
 
         try:
+            if score_delta:
+                await db.execute(
+                    update(EvaluationScoreDaily)
+                    .where(
+                        EvaluationScoreDaily.day == evaluation.created_at.astimezone(timezone.utc).date(),
+                        EvaluationScoreDaily.user_id.in_(
+                            select(EvaluationAssociation.user_id)
+                            .where(EvaluationAssociation.evaluation_id == evaluation.id)))
+                    .values(score_sum=EvaluationScoreDaily.score_sum + score_delta))
             await db.commit()
-            await db.refresh(evaluation)
         except Exception as e:
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"Database error: {e}")
 
+        invalidate_analytics(EVALUATIONS_SCOPE)
         return EvaluationRead.model_validate(evaluation)
 
-    async def get_evaluations_for_user(self, db: AsyncSession, user_id: int) -> list[EvaluationRead]:
-        """Get all the ratings given to the user."""
-        result = await db.scalars(
-            select(EvaluationAssociation.evaluation_id).where(
-                EvaluationAssociation.user_id == user_id))
-
-        evaluation_ids = result.all()
-
-        if not evaluation_ids:
-            return []
-
-        result = await db.scalars(
-            select(Evaluation).where(Evaluation.id.in_(evaluation_ids)))
-
-        evaluations = result.all()
-        return [EvaluationRead.model_validate(e) for e in evaluations]
+    async def get_evaluations_for_user(
+            self,
+            db: AsyncSession,
+            user_id: int,
+            limit: int = DEFAULT_PAGE_SIZE,
+            cursor: Optional[str] = None,
+            start_date: Optional[date] = None,
+            end_date: Optional[date] = None,
+            min_score: Optional[int] = None,
+            max_score: Optional[int] = None
+    ) -> Page[EvaluationRead]:
+        """
+        Get a page of the ratings given to the user, newest first, with the evaluator's name.
+        One statement joins the recipients, evaluations and evaluators; dates are inclusive UTC days.
+        """
+        stmt = (
+            select(Evaluation, User.first_name, User.last_name)
+            .join(EvaluationAssociation, EvaluationAssociation.evaluation_id == Evaluation.id)
+            .join(User, User.id == Evaluation.evaluator_id)
+            .where(EvaluationAssociation.user_id == user_id))
+
+        if start_date is not None:
+            stmt = stmt.where(Evaluation.created_at >= datetime.combine(start_date, time.min, timezone.utc))
+        if end_date is not None:
+            stmt = stmt.where(
+                Evaluation.created_at < datetime.combine(end_date + timedelta(days=1), time.min, timezone.utc))
+        if min_score is not None:
+            stmt = stmt.where(Evaluation.score >= min_score)
+        if max_score is not None:
+            stmt = stmt.where(Evaluation.score <= max_score)
+
+        return await self.paginate(
+            db, stmt, limit, cursor, sort_column=Evaluation.created_at, descending=True,
+            build=self._with_evaluator_name)
+
+    @staticmethod
+    def _with_evaluator_name(row: Row) -> EvaluationRead:
+        """Build EvaluationRead from an (evaluation, first_name, last_name) row."""
+        evaluation, first_name, last_name = row
+        return EvaluationRead.model_validate(evaluation).model_copy(
+            update={"evaluator_full_name": f"{first_name} {last_name}".strip()})
 
     async def get_avg_score_user(
             self,
@@ -113,29 +196,30 @@ class EvaluationCRUD(BaseCRUD):
             start_date: date,
             end_date: date
     ) -> float | None:
-        """Calculate the average user score for the period."""
-        start_date = datetime.combine(start_date, time.min)
-        end_date = datetime.combine(end_date, time.max)
-
-        result = await db.scalars(
-            select(EvaluationAssociation.evaluation_id).where(
-                EvaluationAssociation.user_id == user_id))
-
-        evaluation_ids = result.all()
-
-        if not evaluation_ids:
-            return None
-
-        result = await db.execute(
-            select(func.avg(Evaluation.score))
-            .where(
-                and_(
-                    Evaluation.id.in_(evaluation_ids),
-                    Evaluation.created_at >= start_date,
-                    Evaluation.created_at <= end_date)))
-
-        avg_score = result.scalar_one_or_none()
-        return avg_score
+        """
+        Calculate the average score the user received between two UTC days, inclusive.
+        Reads one rollup row per day, or aggregates the received evaluations in a single
+        joined query when the rollup is disabled.
+        """
+        if settings.EVALUATION_SCORE_ROLLUP:
+            stmt = (
+                select(
+                    cast(func.sum(EvaluationScoreDaily.score_sum), Numeric)
+                    / func.nullif(func.sum(EvaluationScoreDaily.score_count), 0))
+                .where(
+                    EvaluationScoreDaily.user_id == user_id,
+                    EvaluationScoreDaily.day.between(start_date, end_date)))
+        else:
+            stmt = (
+                select(func.avg(Evaluation.score))
+                .join(EvaluationAssociation, EvaluationAssociation.evaluation_id == Evaluation.id)
+                .where(
+                    EvaluationAssociation.user_id == user_id,
+                    Evaluation.created_at >= datetime.combine(start_date, time.min, timezone.utc),
+                    Evaluation.created_at < datetime.combine(end_date + timedelta(days=1), time.min, timezone.utc)))
+
+        avg_score = await db.scalar(stmt)
+        return float(avg_score) if avg_score is not None else None
 
     async def get_evaluations_for_task(self, db: AsyncSession, task_id: int) -> list[EvaluationRead]:
         """Get all evaluations for a specific task, including evaluator full name."""
@@ -147,13 +231,7 @@ class EvaluationCRUD(BaseCRUD):
         result = await db.execute(stmt)
         rows = result.all()
 
-        evaluations = [
-            EvaluationRead.model_validate(evaluation).model_copy(
-                update={"evaluator_full_name": f"{first_name} {last_name}".strip()}
-            )
-            for evaluation, first_name, last_name in rows
-        ]
-        return evaluations
+        return [self._with_evaluator_name(row) for row in rows]
 
 
 evaluation_crud = EvaluationCRUD()
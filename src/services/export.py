@@ -0,0 +1,111 @@
+"""
+Streaming exports of a team's tasks, comments and status history.
+
+Rows are read through a server-side cursor `EXPORT_BATCH_SIZE` at a time and encoded batch by
+batch, so memory does not grow with the team. The generators pull the next batch only when the
+response has sent the previous chunk, which lets a slow client throttle the database reads.
+
+The request's session is closed once the route returns, before the body is streamed, so the
+export opens its own session on the same engine and keeps it for the life of the stream.
+"""
+import csv
+import io
+from typing import AsyncIterator, List, Type
+from pydantic import BaseModel
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+from src.config.db import get_async_sessionmaker
+from src.config.settings import settings
+from src.models import Task, Comment, TaskStatusHistory
+from src.schemas import ExportFormat, TaskExportRow, CommentExportRow, StatusHistoryExportRow
+from src.utils.serialization import type_adapter
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def team_tasks_query(team_id: int) -> Select:
+    return (
+        select(Task.id, Task.title, Task.description, Task.status, Task.priority, Task.due_date, Task.creator_id,
+               Task.created_at, Task.updated_at)
+        .where(Task.team_id == team_id)
+        .order_by(Task.id))
+
+
+def team_comments_query(team_id: int) -> Select:
+    return (
+        select(Comment.id, Comment.task_id, Comment.author_id, Comment.content, Comment.created_at)
+        .join(Task, Task.id == Comment.task_id)
+        .where(Task.team_id == team_id)
+        .order_by(Comment.task_id, Comment.created_at, Comment.id))
+
+
+def team_status_history_query(team_id: int) -> Select:
+    return (
+        select(TaskStatusHistory.id, TaskStatusHistory.task_id, TaskStatusHistory.changed_by_id,
+               TaskStatusHistory.new_status, TaskStatusHistory.changed_at)
+        .join(Task, Task.id == TaskStatusHistory.task_id)
+        .where(Task.team_id == team_id)
+        .order_by(TaskStatusHistory.task_id, TaskStatusHistory.changed_at, TaskStatusHistory.id))
+
+
+async def stream_batches(
+        bind: AsyncEngine,
+        stmt: Select,
+        schema: Type[BaseModel],
+        batch_size: int,
+) -> AsyncIterator[List[BaseModel]]:
+    """Validate the rows of `stmt` into `schema`, one cursor batch at a time, in a session of their own."""
+    adapter = type_adapter(List[schema])
+    async with get_async_sessionmaker(bind)() as session:
+        result = await session.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.partitions():
+            yield adapter.validate_python(partition, from_attributes=True)
+
+
+async def encode_ndjson(schema: Type[BaseModel], batches: AsyncIterator[List[BaseModel]]) -> AsyncIterator[bytes]:
+    """One JSON object per line, one chunk per batch."""
+    adapter = type_adapter(schema)
+    async for batch in batches:
+        yield b"".join(adapter.dump_json(item) + b"\n" for item in batch)
+
+
+async def encode_csv(schema: Type[BaseModel], batches: AsyncIterator[List[BaseModel]]) -> AsyncIterator[str]:
+    """A header row of the schema's fields, then one chunk of rows per batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(schema.model_fields)
+    async for batch in batches:
+        writer.writerows(item.model_dump(mode="json").values() for item in batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def export_stream(
+        bind: AsyncEngine,
+        stmt: Select,
+        schema: Type[BaseModel],
+        export_format: ExportFormat,
+) -> AsyncIterator:
+    """Chunks of the rows of `stmt` encoded as `export_format`."""
+    batches = stream_batches(bind, stmt, schema, settings.EXPORT_BATCH_SIZE)
+    if export_format is ExportFormat.CSV:
+        return encode_csv(schema, batches)
+    return encode_ndjson(schema, batches)
+
+
+def team_tasks_export(bind: AsyncEngine, team_id: int, export_format: ExportFormat) -> AsyncIterator:
+    return export_stream(bind, team_tasks_query(team_id), TaskExportRow, export_format)
+
+
+def team_comments_export(bind: AsyncEngine, team_id: int, export_format: ExportFormat) -> AsyncIterator:
+    return export_stream(bind, team_comments_query(team_id), CommentExportRow, export_format)
+
+
+def team_status_history_export(bind: AsyncEngine, team_id: int, export_format: ExportFormat) -> AsyncIterator:
+    return export_stream(bind, team_status_history_query(team_id), StatusHistoryExportRow, export_format)
@@ -1,12 +1,49 @@
-from typing import List
-from sqlalchemy import select, and_, or_
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import select, func, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
-from src.models import User, Meeting, MeetingStatus
-from src.schemas import MeetingShortRead, MeetingCreate, MeetingUpdate, MeetingRead
-from src.services.basecrud import BaseCRUD
+from src.models import User, Meeting, MeetingStatus, MeetingParticipantAssociation, CalendarEntry
+from src.schemas import MeetingShortRead, MeetingCreate, MeetingUpdate, MeetingRead, Page, TimeInterval, \
+    MeetingAvailability
+from src.services.basecrud import BaseCRUD, DEFAULT_PAGE_SIZE
+from src.services.calendar import sync_meeting_calendar, clear_calendar
 from sqlalchemy.orm import selectinload
-from datetime import datetime, timezone
+from src.utils.response_cache import response_cache, entities
+from datetime import datetime, timedelta, timezone
+
+MAX_AVAILABILITY_PARTICIPANTS = 200
+MAX_AVAILABILITY_WINDOW = timedelta(days=93)
+
+
+def merge_intervals(intervals: Iterable[Tuple[datetime, datetime]]) -> List[Tuple[datetime, datetime]]:
+    """Merge intervals sorted by start into non-overlapping busy blocks in a single pass."""
+    merged: List[Tuple[datetime, datetime]] = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def find_free_slots(
+        busy: Sequence[Tuple[datetime, datetime]],
+        window_start: datetime,
+        window_end: datetime,
+        duration: timedelta,
+        limit: int
+) -> List[Tuple[datetime, datetime]]:
+    """Return up to `limit` gaps between merged busy blocks that are at least `duration` long."""
+    slots: List[Tuple[datetime, datetime]] = []
+    cursor = window_start
+    for start, end in [*busy, (window_end, window_end)]:
+        if start - cursor >= duration:
+            slots.append((cursor, start))
+            if len(slots) == limit:
+                break
+        cursor = max(cursor, end)
+    return slots
 
 
 class MeetingCRUD(BaseCRUD):
@@ -15,6 +52,35 @@ class MeetingCRUD(BaseCRUD):
     def __init__(self):
         super().__init__(Meeting, MeetingShortRead)
 
+    async def delete(self, db: AsyncSession, obj_id: int, options: Sequence[Any] = ()) -> Meeting:
+        """Delete a meeting and drop it from its participants' calendars."""
+        calendar_users = await clear_calendar(db, CalendarEntry.meeting_id == obj_id)
+        meeting = await super().delete(db, obj_id, options=options)
+        await response_cache.invalidate(*entities("calendar", calendar_users))
+        return meeting
+
+    @staticmethod
+    async def get_conflicting_users(
+            db: AsyncSession,
+            user_ids: Iterable[int],
+            start_datetime: datetime,
+            end_datetime: datetime
+    ) -> List[int]:
+        """
+        Return IDs of users who already have a scheduled meeting overlapping [start, end).
+        Uses the `&&` operator on the generated `during` range, served by its GiST index.
+        """
+        stmt = (
+            select(MeetingParticipantAssociation.user_id)
+            .join(Meeting, Meeting.id == MeetingParticipantAssociation.meeting_id)
+            .where(
+                MeetingParticipantAssociation.user_id.in_(list(user_ids)),
+                Meeting.status == MeetingStatus.SCHEDULED,
+                Meeting.during.op("&&")(func.tstzrange(start_datetime, end_datetime, "[)")))
+            .distinct())
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+
     async def create_meet(self, db: AsyncSession, meet_in: MeetingCreate, creator_id: int) -> MeetingShortRead:
         """Create a meeting with verification of the existence of participants and time conflicts."""
         participant_ids = set(meet_in.participant_ids or [])
@@ -29,21 +95,8 @@ class MeetingCRUD(BaseCRUD):
                 status_code=400,
                 detail=f"Users with IDs {list(missing_user_ids)} do not exist.")
 
-        result = await db.execute(
-            select(User.id)
-            .join(User.meetings)
-            .where(
-                User.id.in_(participant_ids),
-                Meeting.status == MeetingStatus.SCHEDULED,
-                or_(
-                    and_(Meeting.start_datetime <= meet_in.start_datetime,
-                         Meeting.end_datetime > meet_in.start_datetime),
-                    and_(Meeting.start_datetime < meet_in.end_datetime,
-                         Meeting.end_datetime >= meet_in.end_datetime),
-                    and_(Meeting.start_datetime >= meet_in.start_datetime,
-                         Meeting.end_datetime <= meet_in.end_datetime))).distinct())
-
-        conflicting_users = [row[0] for row in result.all()]
+        conflicting_users = await self.get_conflicting_users(
+            db, participant_ids, meet_in.start_datetime, meet_in.end_datetime)
         if conflicting_users:
             raise HTTPException(
                 status_code=400,
@@ -63,12 +116,15 @@ class MeetingCRUD(BaseCRUD):
 
         db.add(meeting)
         try:
+            await db.flush()
+            calendar_users = await sync_meeting_calendar(db, [meeting.id])
             await db.commit()
-            await db.refresh(meeting)
         except Exception as e:
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"Database error: {e}")
 
+        await response_cache.invalidate(*entities("calendar", calendar_users))
+
         return MeetingShortRead.model_validate(meeting)
 
     async def update_meet(
@@ -82,13 +138,9 @@ class MeetingCRUD(BaseCRUD):
         Update the meeting, including adding and deleting participants,
         checking for the existence of users and time conflicts,
         and handling cancellation metadata.
+        The meeting is taken from the session identity map when the permission check already loaded it.
         """
-        result = await db.execute(
-            select(Meeting)
-            .options(selectinload(Meeting.participants))
-            .where(Meeting.id == meeting_id)
-        )
-        meeting = result.scalar_one_or_none()
+        meeting = await db.get(Meeting, meeting_id, options=[selectinload(Meeting.participants)])
         if not meeting:
             raise HTTPException(status_code=404, detail="Meeting not found")
 
@@ -117,21 +169,8 @@ class MeetingCRUD(BaseCRUD):
             result = await db.execute(select(User).where(User.id.in_(add_ids)))
             users_to_add = result.scalars().all()
 
-            result = await db.execute(
-                select(User.id)
-                .join(User.meetings)
-                .where(
-                    User.id.in_(add_ids),
-                    Meeting.status == MeetingStatus.SCHEDULED,
-                    or_(
-                        and_(Meeting.start_datetime <= meeting.start_datetime,
-                             Meeting.end_datetime > meeting.start_datetime),
-                        and_(Meeting.start_datetime < meeting.end_datetime,
-                             Meeting.end_datetime >= meeting.end_datetime),
-                        and_(Meeting.start_datetime >= meeting.start_datetime,
-                             Meeting.end_datetime <= meeting.end_datetime))).distinct())
-
-            conflicting_users = [row[0] for row in result.all()]
+            conflicting_users = await self.get_conflicting_users(
+                db, add_ids, meeting.start_datetime, meeting.end_datetime)
             if conflicting_users:
                 raise HTTPException(
                     status_code=400,
@@ -145,13 +184,62 @@ class MeetingCRUD(BaseCRUD):
             meeting.participants = [user for user in meeting.participants if user.id not in remove_ids]
 
         try:
+            calendar_users = await sync_meeting_calendar(db, [meeting.id])
             await db.commit()
-            await db.refresh(meeting)
         except Exception as e:
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"Database error: {e}")
+
+        await response_cache.invalidate(*entities("calendar", calendar_users))
         return MeetingShortRead.model_validate(meeting)
 
+    async def get_availability(
+            self,
+            db: AsyncSession,
+            participant_ids: List[int],
+            window_start: datetime,
+            window_end: datetime,
+            duration: timedelta,
+            limit: int
+    ) -> MeetingAvailability:
+        """
+        Merge the participants' scheduled meetings inside the window into busy intervals
+        and return the first free slots long enough for `duration`.
+        Meetings are fetched once, clipped to the window and ordered by start in SQL,
+        so the merge is a single linear pass.
+        """
+        participant_ids = list(set(participant_ids))
+        window_start, window_end = (
+            value if value.tzinfo else value.replace(tzinfo=timezone.utc) for value in (window_start, window_end))
+
+        if window_end <= window_start:
+            raise HTTPException(status_code=400, detail="Window end must be after window start")
+        if window_end - window_start > MAX_AVAILABILITY_WINDOW:
+            raise HTTPException(
+                status_code=400, detail=f"Window must not exceed {MAX_AVAILABILITY_WINDOW.days} days")
+        if len(participant_ids) > MAX_AVAILABILITY_PARTICIPANTS:
+            raise HTTPException(
+                status_code=400, detail=f"At most {MAX_AVAILABILITY_PARTICIPANTS} participants are allowed")
+
+        busy_start = func.greatest(Meeting.start_datetime, window_start)
+        busy_end = func.least(func.coalesce(Meeting.end_datetime, window_end), window_end)
+        result = await db.execute(
+            select(busy_start, busy_end)
+            .where(
+                Meeting.status == MeetingStatus.SCHEDULED,
+                Meeting.during.op("&&")(func.tstzrange(window_start, window_end, "[)")),
+                exists().where(
+                    MeetingParticipantAssociation.meeting_id == Meeting.id,
+                    MeetingParticipantAssociation.user_id.in_(participant_ids)))
+            .order_by(busy_start))
+
+        busy = merge_intervals(result.tuples())
+        free = find_free_slots(busy, window_start, window_end, duration, limit)
+
+        return MeetingAvailability(
+            busy=[TimeInterval(start=start, end=end) for start, end in busy],
+            free_slots=[TimeInterval(start=start, end=end) for start, end in free])
+
     async def get_by_id_detailed(self, db: AsyncSession, meeting_id: int) -> MeetingRead:
         """
         Get detailed information about the meeting by ID with
@@ -170,19 +258,19 @@ class MeetingCRUD(BaseCRUD):
             raise HTTPException(status_code=404, detail="Meeting not found")
         return MeetingRead.model_validate(meeting)
 
-    async def get_user_meetings(self, db: AsyncSession, user_id: int) -> List[MeetingShortRead]:
+    async def get_user_meetings(
+            self,
+            db: AsyncSession,
+            user_id: int,
+            limit: int = DEFAULT_PAGE_SIZE,
+            cursor: Optional[str] = None
+    ) -> Page[MeetingShortRead]:
         """
-        Get all the meetings that the specified user participates in,
+        Get a page of the meetings that the specified user participates in,
         sorted by start date.
         """
-        result = await db.execute(
-            select(Meeting)
-            .join(Meeting.participants)
-            .where(User.id == user_id)
-            .order_by(Meeting.start_datetime))
-
-        meetings = result.unique().scalars().all()
-        return [MeetingShortRead.model_validate(m) for m in meetings]
+        stmt = select(Meeting).join(Meeting.participants).where(User.id == user_id)
+        return await self.paginate(db, stmt, limit, cursor, sort_column=Meeting.start_datetime)
 
 
 meeting_crud = MeetingCRUD()
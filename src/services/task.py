@@ -1,12 +1,23 @@
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
-from src.models import Task, TaskStatus, TaskPriority, User, TaskAssigneeAssociation, TeamUserAssociation
+from sqlalchemy import ColumnElement, Select, select, or_, insert, func, literal_column
+from sqlalchemy.dialects.postgresql import aggregate_order_by, JSON
+from src.models import Task, TaskStatus, TaskPriority, User, TaskAssigneeAssociation, TeamUserAssociation, Evaluation, \
+    CalendarEntry
 from src.models.task_status_history import TaskStatusHistory
-from src.schemas import AssigneeInfo, TaskRead, TaskShortRead, TaskCreate, TaskUpdate
-from src.services.basecrud import BaseCRUD
-from sqlalchemy.orm import selectinload
+from src.schemas import AssigneeInfo, TaskRead, TaskShortRead, TaskCreate, TaskUpdate, Page, TaskBulkItem, \
+    TaskBulkCreateResponse
+from src.services.basecrud import BaseCRUD, DEFAULT_PAGE_SIZE
+from src.services.analytics import invalidate_analytics, team_scope
+from src.services.calendar import sync_task_calendar, clear_calendar
+from src.services.evaluation import adjust_score_rollup
+from src.services.versions import touch_team
+from sqlalchemy.orm import Load, aliased, selectinload
+from src.utils.response_cache import response_cache, entity, entities
+
+
+BULK_CHUNK_SIZE = 500
 
 
 class TaskCRUD(BaseCRUD):
@@ -25,7 +36,6 @@ class TaskCRUD(BaseCRUD):
 
         try:
             await db.flush()
-            await db.refresh(task)
 
             if task_in.assignees:
                 unique_assignees = {(a.user_id, a.role or "EXECUTOR"): a for a in task_in.assignees}.values()
@@ -52,8 +62,10 @@ class TaskCRUD(BaseCRUD):
                         role=assignee.role or "EXECUTOR")
                     db.add(association)
 
+            calendar_users = await sync_task_calendar(db, [task.id])
             await db.commit()
-            await db.refresh(task)
+            invalidate_analytics(team_scope(team_id))
+            await response_cache.invalidate(entity("team", team_id), *entities("calendar", calendar_users))
 
             return TaskShortRead.model_validate(task)
 
@@ -64,6 +76,110 @@ class TaskCRUD(BaseCRUD):
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"Failed to create task: {e}")
 
+    async def bulk_create_tasks(
+            self,
+            db: AsyncSession,
+            tasks_in: List[TaskBulkItem],
+            creator_id: int,
+            team_id: int,
+            chunk_size: int = BULK_CHUNK_SIZE
+    ) -> TaskBulkCreateResponse:
+        """
+        Create many tasks of one team in a single transaction.
+        Assignees of all items are checked against the team in one query; items with unknown
+        assignees, or listing a user twice with different roles, are skipped and reported. Tasks and assignee rows are written with multi-row
+        INSERT ... RETURNING statements of at most `chunk_size` rows.
+        """
+        errors = []
+        requested_ids = {a.user_id for task_in in tasks_in for a in task_in.assignees or []}
+        valid_user_ids = set()
+        if requested_ids:
+            result = await db.execute(
+                select(TeamUserAssociation.user_id)
+                .where(
+                    TeamUserAssociation.team_id == team_id,
+                    TeamUserAssociation.user_id.in_(requested_ids)))
+            valid_user_ids = set(result.scalars().all())
+
+        accepted = []
+        for index, task_in in enumerate(tasks_in):
+            roles = {}
+            for assignee in task_in.assignees or []:
+                roles.setdefault(assignee.user_id, set()).add(assignee.role or "EXECUTOR")
+            conflicting_user_ids = {user_id for user_id, user_roles in roles.items() if len(user_roles) > 1}
+            if conflicting_user_ids:
+                errors.append(f"Task {index}: users listed with different roles: {conflicting_user_ids}")
+                continue
+            unique_assignees = list({a.user_id: a for a in task_in.assignees or []}.values())
+            missing_user_ids = {a.user_id for a in unique_assignees} - valid_user_ids
+            if missing_user_ids:
+                errors.append(f"Task {index}: users not found or not in team: {missing_user_ids}")
+                continue
+            accepted.append((task_in, unique_assignees))
+
+        created = []
+        calendar_users = set()
+        try:
+            for start in range(0, len(accepted), chunk_size):
+                chunk = accepted[start:start + chunk_size]
+                result = await db.execute(
+                    insert(Task).returning(
+                        Task.id, Task.title, Task.description, Task.status, Task.priority, Task.due_date,
+                        sort_by_parameter_order=True),
+                    [
+                        {**task_in.model_dump(exclude={"assignees"}), "creator_id": creator_id, "team_id": team_id}
+                        for task_in, _ in chunk
+                    ])
+                rows = result.all()
+
+                assignee_rows = [
+                    {"task_id": row.id, "user_id": assignee.user_id, "role": assignee.role or "EXECUTOR"}
+                    for row, (_, assignees) in zip(rows, chunk)
+                    for assignee in assignees
+                ]
+                for assignee_start in range(0, len(assignee_rows), chunk_size):
+                    await db.execute(
+                        insert(TaskAssigneeAssociation),
+                        assignee_rows[assignee_start:assignee_start + chunk_size])
+
+                calendar_users |= await sync_task_calendar(db, [row.id for row in rows])
+                created.extend(TaskShortRead.model_validate(row) for row in rows)
+
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(status_code=500, detail=f"Failed to create tasks: {e}")
+
+        invalidate_analytics(team_scope(team_id))
+        await response_cache.invalidate(entity("team", team_id), *entities("calendar", calendar_users))
+        return TaskBulkCreateResponse(created=created, errors=errors)
+
+    @staticmethod
+    def delete_options(tasks: Optional[Load] = None) -> list[Load]:
+        """
+        Eager loads of the collections a task delete cascades into,
+        optionally nested under the loader of a parent's tasks collection.
+        """
+        def load(attr):
+            return selectinload(attr) if tasks is None else tasks.selectinload(attr)
+
+        return [
+            load(Task.evaluations).selectinload(Evaluation.recipients),
+            load(Task.comments),
+            load(Task.status_history)]
+
+    async def delete(self, db: AsyncSession, obj_id: int, options: Sequence[Any] = ()) -> Task:
+        """Delete a task with its evaluations, comments and status history."""
+        await touch_team(db, select(Task.team_id).where(Task.id == obj_id).scalar_subquery())
+        await adjust_score_rollup(db, Evaluation.task_id == obj_id, sign=-1)
+        calendar_users = await clear_calendar(db, CalendarEntry.task_id == obj_id)
+        task = await super().delete(db, obj_id, options=[*self.delete_options(), *options])
+        invalidate_analytics(team_scope(task.team_id))
+        await response_cache.invalidate(
+            entity("task", obj_id), entity("comments", obj_id), entity("team", task.team_id),
+            *entities("calendar", calendar_users))
+        return task
+
     async def update_task(self, db: AsyncSession, task_id: int, task_in: TaskUpdate, creator_id: int) -> TaskShortRead:
         """Update an existing task and update the creator_id from the token."""
         result = await db.execute(select(Task).where(Task.id == task_id))
@@ -78,12 +194,15 @@ class TaskCRUD(BaseCRUD):
             setattr(task, field, value)
 
         try:
+            calendar_users = await sync_task_calendar(db, [task.id])
             await db.commit()
-            await db.refresh(task)
         except Exception as e:
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"Database error: {e}")
 
+        invalidate_analytics(team_scope(task.team_id))
+        await response_cache.invalidate(
+            entity("task", task.id), entity("team", task.team_id), *entities("calendar", calendar_users))
         return TaskShortRead.model_validate(task)
 
     async def get_all_task(self, db: AsyncSession) -> List[TaskShortRead]:
@@ -92,19 +211,9 @@ class TaskCRUD(BaseCRUD):
         tasks = result.scalars().all()
         return [TaskShortRead.model_validate(task) for task in tasks]
 
-    async def get_task_by_id(self, db: AsyncSession, task_id: int) -> TaskRead:
-        """Retrieve a task by ID with full assignee info from the association table."""
-        result = await db.execute(
-            select(Task).options(
-                selectinload(Task.creator), selectinload(Task.assignee_associations)
-                .selectinload(TaskAssigneeAssociation.user))
-            .where(Task.id == task_id))
-
-        task = result.scalar_one_or_none()
-
-        if not task:
-            raise HTTPException(status_code=404, detail="Task not found")
-
+    @staticmethod
+    def to_task_read(task: Task) -> TaskRead:
+        """Build TaskRead from a task loaded with its creator and assignee users."""
         assignees: list[AssigneeInfo] = [
             AssigneeInfo.model_validate({
                 "id": assoc.user.id,
@@ -133,6 +242,80 @@ class TaskCRUD(BaseCRUD):
 
         return TaskRead.model_validate(task_data)
 
+    @staticmethod
+    def read_dependencies(task: Task) -> list[str]:
+        """Response cache entities a TaskRead of the task is built from: the task and the users it shows."""
+        return [
+            entity("task", task.id),
+            entity("user", task.creator_id),
+            *entities("user", (assoc.user_id for assoc in task.assignee_associations))]
+
+    @staticmethod
+    async def read_dependency_names(db: AsyncSession, condition: ColumnElement[bool]) -> list[str]:
+        """`read_dependencies` of the tasks matching `condition`, found by ID without loading the tasks."""
+        result = await db.execute(
+            select(Task.id, Task.creator_id, TaskAssigneeAssociation.user_id)
+            .outerjoin(TaskAssigneeAssociation, TaskAssigneeAssociation.task_id == Task.id)
+            .where(condition))
+        names = []
+        for task_id, creator_id, assignee_id in result.all():
+            names += [entity("task", task_id), entity("user", creator_id)]
+            if assignee_id is not None:
+                names.append(entity("user", assignee_id))
+        return list(dict.fromkeys(names))
+
+    async def get_task_by_id(self, db: AsyncSession, task_id: int) -> TaskRead:
+        """Retrieve a task by ID with full assignee info from the association table."""
+        task_read, _ = await self.get_task_with_dependencies(db, task_id)
+        return task_read
+
+    @staticmethod
+    def task_read_projection() -> Select:
+        """
+        Columns of TaskRead in one statement: the creator's email through a join and the
+        assignees aggregated into a JSON array, so no ORM entities are loaded.
+        """
+        creator = aliased(User)
+        assignee = func.json_build_object(
+            "id", User.id,
+            "email", User.email,
+            "first_name", User.first_name,
+            "last_name", User.last_name,
+            "role", TaskAssigneeAssociation.role,
+            "assigned_at", TaskAssigneeAssociation.assigned_at)
+        assignees = (
+            select(func.coalesce(
+                func.json_agg(aggregate_order_by(
+                    assignee, TaskAssigneeAssociation.assigned_at, TaskAssigneeAssociation.user_id)),
+                literal_column("'[]'::json"), type_=JSON))
+            .join(User, User.id == TaskAssigneeAssociation.user_id)
+            .where(TaskAssigneeAssociation.task_id == Task.id)
+            .scalar_subquery())
+
+        return (
+            select(
+                Task.id, Task.title, Task.description, Task.status, Task.priority, Task.due_date, Task.team_id,
+                Task.created_at, Task.updated_at, Task.creator_id, creator.email.label("creator_email"),
+                assignees.label("assignees"))
+            .join(creator, creator.id == Task.creator_id))
+
+    async def get_task_with_dependencies(self, db: AsyncSession, task_id: int) -> Tuple[TaskRead, list[str]]:
+        """
+        TaskRead of a task together with the response cache entities it depends on.
+        The projected row is validated once, reading its columns as attributes.
+        """
+        result = await db.execute(self.task_read_projection().where(Task.id == task_id))
+        row = result.one_or_none()
+
+        if row is None:
+            raise HTTPException(status_code=404, detail="Task not found")
+
+        task = TaskRead.model_validate(row)
+        return task, [
+            entity("task", task.id),
+            entity("user", row.creator_id),
+            *entities("user", (assignee.id for assignee in task.assignees))]
+
     async def update_status(
             self,
             db: AsyncSession,
@@ -140,9 +323,11 @@ class TaskCRUD(BaseCRUD):
             new_status: TaskStatus,
             changed_by_id: int
     ) -> TaskShortRead:
-        """Update the task's status and create a history record of the change."""
-        result = await db.execute(select(Task).where(Task.id == task_id))
-        task = result.scalar_one_or_none()
+        """
+        Update the task's status and create a history record of the change.
+        The task is taken from the session identity map when the permission check already loaded it.
+        """
+        task = await db.get(Task, task_id)
 
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
@@ -158,11 +343,12 @@ class TaskCRUD(BaseCRUD):
 
         try:
             await db.commit()
-            await db.refresh(task)
         except Exception as e:
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"Database error: {e}")
 
+        invalidate_analytics(team_scope(task.team_id))
+        await response_cache.invalidate(entity("task", task.id), entity("team", task.team_id))
         return TaskShortRead.model_validate(task)
 
     async def get_user_related_tasks(
@@ -171,9 +357,11 @@ class TaskCRUD(BaseCRUD):
             user_id: int,
             statuses: Optional[List[TaskStatus]] = None,
             priorities: Optional[List[TaskPriority]] = None,
-            team_id: Optional[int] = None
-    ) -> List[TaskShortRead]:
-        """Retrieves the tasks that the user is associated with, using the filters"""
+            team_id: Optional[int] = None,
+            limit: int = DEFAULT_PAGE_SIZE,
+            cursor: Optional[str] = None
+    ) -> Page[TaskShortRead]:
+        """Retrieves a page of the tasks that the user is associated with, newest first, using the filters"""
         stmt = (
             select(Task)
             .options(
@@ -197,18 +385,19 @@ class TaskCRUD(BaseCRUD):
         if priorities:
             stmt = stmt.where(Task.priority.in_(priorities))
 
-        result = await db.execute(stmt)
-        tasks = result.scalars().all()
-        return [TaskShortRead.model_validate(task) for task in tasks]
+        return await self.paginate(
+            db, stmt, limit, cursor, sort_column=Task.created_at, descending=True, schema=TaskShortRead)
 
     async def get_team_tasks(
             self,
             db: AsyncSession,
             team_id: int,
             statuses: Optional[List[TaskStatus]] = None,
-            priorities: Optional[List[TaskPriority]] = None
-    ) -> List[TaskShortRead]:
-        """Retrieve all tasks for a given team with optional filters."""
+            priorities: Optional[List[TaskPriority]] = None,
+            limit: int = DEFAULT_PAGE_SIZE,
+            cursor: Optional[str] = None
+    ) -> Page[TaskShortRead]:
+        """Retrieve a page of tasks for a given team, newest first, with optional filters."""
         stmt = select(Task).where(Task.team_id == team_id)
 
         if statuses is not None:
@@ -219,9 +408,8 @@ class TaskCRUD(BaseCRUD):
         if priorities:
             stmt = stmt.where(Task.priority.in_(priorities))
 
-        result = await db.execute(stmt)
-        tasks = result.scalars().all()
-        return [TaskShortRead.model_validate(task) for task in tasks]
+        return await self.paginate(
+            db, stmt, limit, cursor, sort_column=Task.created_at, descending=True, schema=TaskShortRead)
 
 
 tasks_crud = TaskCRUD()
@@ -5,8 +5,12 @@ from fastapi import HTTPException, status
 from src.models import TaskAssigneeAssociation, User
 from src.schemas import TaskUserAdd, AddUsersResponse, AddedUserInfo, \
     UsersRemoveResponse, RoleUpdatePayload, RoleUpdateResponse
+from src.services.analytics import invalidate_analytics, ASSIGNEES_SCOPE
 from src.services.basecrud import BaseCRUD
+from src.services.calendar import sync_task_calendar
+from src.services.versions import touch_tasks
 from sqlalchemy.orm import aliased
+from src.utils.response_cache import response_cache, entity, entities
 
 
 class TaskAssigneeCRUD(BaseCRUD):
@@ -71,10 +75,14 @@ class TaskAssigneeCRUD(BaseCRUD):
         if new_assocs:
             db.add_all(new_assocs)
             try:
+                await touch_tasks(db, [task_id])
+                calendar_users = await sync_task_calendar(db, [task_id])
                 await db.commit()
             except Exception as e:
                 await db.rollback()
                 raise HTTPException(status_code=500, detail=f"Database error: {e}")
+            invalidate_analytics(ASSIGNEES_SCOPE)
+            await response_cache.invalidate(entity("task", task_id), *entities("calendar", calendar_users))
 
         return AddUsersResponse(added=added, errors=errors)
 
@@ -94,11 +102,15 @@ class TaskAssigneeCRUD(BaseCRUD):
         deleted_user_ids = [user_id for (user_id,) in result.all()]
 
         try:
+            await touch_tasks(db, [task_id])
+            calendar_users = await sync_task_calendar(db, [task_id])
             await db.commit()
         except Exception as e:
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"Database error: {e}")
 
+        invalidate_analytics(ASSIGNEES_SCOPE)
+        await response_cache.invalidate(entity("task", task_id), *entities("calendar", calendar_users))
         not_found = sorted(set(user_ids) - set(deleted_user_ids))
 
         return UsersRemoveResponse(
@@ -127,6 +139,7 @@ class TaskAssigneeCRUD(BaseCRUD):
                 detail="Executor not found for this task")
 
         try:
+            await touch_tasks(db, [task_id])
             await db.commit()
         except Exception as e:
             await db.rollback()
@@ -134,6 +147,7 @@ class TaskAssigneeCRUD(BaseCRUD):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Database error: {e}")
 
+        await response_cache.invalidate(entity("task", task_id))
         return RoleUpdateResponse(msg="Role updated")
 
 
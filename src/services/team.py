@@ -1,14 +1,22 @@
 import uuid
+from typing import Any, List, Sequence, Tuple
 from datetime import datetime, timedelta, timezone
-from src.models import TeamUserAssociation, TeamRole, User, Team
-from src.schemas import TaskRead, TeamRead, TeamCreate, TeamUpdate, TeamWithUsersAndTask, \
+from src.models import TeamUserAssociation, TeamRole, User, Team, Task, TaskAssigneeAssociation, Evaluation, \
+    CalendarEntry
+from src.schemas import TeamRead, TeamCreate, TeamUpdate, TeamWithUsersAndTask, \
     TeamUserAssociationRead
+from src.services.analytics import invalidate_analytics, team_scope
 from src.services.basecrud import BaseCRUD
+from src.services.calendar import clear_calendar
+from src.services.evaluation import adjust_score_rollup
+from src.services.task import TaskCRUD
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 from sqlalchemy.orm import selectinload
+from src.utils.response_cache import response_cache, entity, entities
+from src.utils.serialization import type_adapter
 
 
 class TeamCRUD(BaseCRUD):
@@ -75,7 +83,7 @@ class TeamCRUD(BaseCRUD):
                     db.add(association)
 
                 await db.commit()
-                await db.refresh(team)
+                await response_cache.invalidate(*entities("user", user_roles))
 
                 return TeamRead.model_validate(team)
 
@@ -118,7 +126,6 @@ class TeamCRUD(BaseCRUD):
 
         try:
             await db.commit()
-            await db.refresh(team)
         except IntegrityError as e:
             await db.rollback()
             err_msg = str(e.orig).lower()
@@ -128,12 +135,39 @@ class TeamCRUD(BaseCRUD):
                 raise HTTPException(status_code=400, detail="Invite code conflict, try again")
             raise
 
+        await response_cache.invalidate(entity("team", team_id))
         return TeamRead.model_validate(team)
 
+    async def delete(self, db: AsyncSession, obj_id: int, options: Sequence[Any] = ()) -> Team:
+        """Delete a team with its memberships and tasks."""
+        team_tasks = select(Task.id).where(Task.team_id == obj_id)
+        await adjust_score_rollup(db, Evaluation.task_id.in_(team_tasks), sign=-1)
+        calendar_users = await clear_calendar(db, CalendarEntry.task_id.in_(team_tasks))
+        team = await super().delete(db, obj_id, options=[
+            selectinload(Team.team_users), *TaskCRUD.delete_options(selectinload(Team.tasks)), *options])
+        invalidate_analytics(team_scope(obj_id))
+        task_ids = [task.id for task in team.tasks]
+        await response_cache.invalidate(
+            entity("team", obj_id),
+            *entities("task", task_ids),
+            *entities("comments", task_ids),
+            *entities("user", (assoc.user_id for assoc in team.team_users)),
+            *entities("calendar", calendar_users))
+        return team
+
     async def get_by_id_with_relations(self, db: AsyncSession, team_id: int) -> TeamWithUsersAndTask:
         """Return team with flat user data and tasks"""
+        team_read, _ = await self.get_team_with_dependencies(db, team_id)
+        return team_read
+
+    async def get_team_with_dependencies(
+            self, db: AsyncSession, team_id: int) -> Tuple[TeamWithUsersAndTask, list[str]]:
+        """Team with users and tasks together with the response cache entities it depends on."""
+        tasks = selectinload(Team.tasks)
         stmt = (select(Team).options(selectinload(Team.team_users).selectinload(TeamUserAssociation.user),
-                                     selectinload(Team.tasks)).where(Team.id == team_id))
+                                     tasks.selectinload(Task.creator),
+                                     tasks.selectinload(Task.assignee_associations)
+                                     .selectinload(TaskAssigneeAssociation.user)).where(Team.id == team_id))
         result = await db.execute(stmt)
         team: Team | None = result.scalar_one_or_none()
         if not team:
@@ -152,12 +186,27 @@ class TeamCRUD(BaseCRUD):
             for assoc in team.team_users
         ]
 
-        return TeamWithUsersAndTask(
+        team_read = TeamWithUsersAndTask(
             id=team.id,
             name=team.name,
             description=team.description,
             team_users=flat_team_users,
-            tasks=[TaskRead.model_validate(task) for task in team.tasks])
+            tasks=[TaskCRUD.to_task_read(task) for task in team.tasks])
+        dependencies = [
+            entity("team", team.id),
+            *entities("user", (assoc.user_id for assoc in team.team_users)),
+            *(name for task in team.tasks for name in TaskCRUD.read_dependencies(task))]
+        return team_read, dependencies
+
+    @staticmethod
+    async def read_dependency_names(db: AsyncSession, team_id: int) -> list[str]:
+        """Response cache entities of `get_team_with_dependencies`, found by ID without loading the team."""
+        member_ids = await db.scalars(
+            select(TeamUserAssociation.user_id).where(TeamUserAssociation.team_id == team_id))
+        return [
+            entity("team", team_id),
+            *entities("user", member_ids.all()),
+            *await TaskCRUD.read_dependency_names(db, Task.team_id == team_id)]
 
     async def get_user_teams(self, db: AsyncSession, user_id: int) -> list[TeamRead]:
         """Возвращает все команды, в которых состоит пользователь."""
@@ -168,7 +217,7 @@ class TeamCRUD(BaseCRUD):
         )
         result = await db.execute(stmt)
         teams = result.scalars().all()
-        return [TeamRead.model_validate(team) for team in teams]
+        return type_adapter(List[TeamRead]).validate_python(teams, from_attributes=True)
 
 
 teams_crud = TeamCRUD()
@@ -3,10 +3,12 @@ from src.models import User, TeamUserAssociation, TeamRole
 from src.schemas import AddUsersResponse, UsersRemoveResponse, TeamUserAssociationRead, TeamUserAdd, \
     AddedUserInfo
 from src.services.basecrud import BaseCRUD
+from src.services.versions import touch_team
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete, update
 from sqlalchemy.orm import aliased
+from src.utils.response_cache import response_cache, entity, entities
 
 
 class TeamUserCRUD(BaseCRUD):
@@ -77,6 +79,7 @@ class TeamUserCRUD(BaseCRUD):
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"Database error: {e}")
 
+        await response_cache.invalidate(entity("team", team_id), *entities("user", (a.user_id for a in new_assocs)))
         return AddUsersResponse(added=added, errors=errors)
 
     async def remove_users(self, db: AsyncSession, team_id: int, user_ids: List[int]) -> UsersRemoveResponse:
@@ -95,7 +98,9 @@ class TeamUserCRUD(BaseCRUD):
         result = await db.execute(stmt)
         removed_user_ids = [user_id for (user_id,) in result.all()]
 
+        await touch_team(db, team_id)
         await db.commit()
+        await response_cache.invalidate(entity("team", team_id), *entities("user", removed_user_ids))
 
         not_found = list(set(user_ids) - set(removed_user_ids))
 
@@ -118,7 +123,14 @@ class TeamUserCRUD(BaseCRUD):
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User is not a member of the team")
 
+        await response_cache.invalidate(entity("team", team_id), entity("user", user_id))
         return {"msg": "User role updated"}
 
+    @staticmethod
+    async def member_ids(db: AsyncSession, team_id: int) -> List[int]:
+        """IDs of the team's members."""
+        result = await db.execute(select(TeamUserAssociation.user_id).where(TeamUserAssociation.team_id == team_id))
+        return list(result.scalars().all())
+
 
 team_users_crud = TeamUserCRUD()
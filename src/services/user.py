@@ -1,11 +1,13 @@
+from typing import List, Optional
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from src.models import TeamUserAssociation, User, UserRole
-from src.utils.security import pwd_context
-from src.services.basecrud import BaseCRUD
-from src.schemas import UserCreate, UserRead, UserUpdate, UserReadWithTeams, UserTeamRead
+from src.utils.security import password_hasher
+from src.services.basecrud import BaseCRUD, DEFAULT_PAGE_SIZE
+from src.schemas import UserCreate, UserRead, UserUpdate, UserReadWithTeams, UserTeamRead, Page
 from sqlalchemy.orm import selectinload
+from src.utils.response_cache import response_cache, entity
 
 
 class UserCRUD(BaseCRUD):
@@ -24,7 +26,7 @@ class UserCRUD(BaseCRUD):
                 detail="Email already registered"
             )
 
-        password = pwd_context.hash(obj_in.password)
+        password = await password_hasher.hash(obj_in.password)
 
         user_data = obj_in.model_dump(exclude={"password"})
         user = User(**user_data, password=password)
@@ -35,7 +37,6 @@ class UserCRUD(BaseCRUD):
         except Exception as e:
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"Database error: {e}")
-        await db.refresh(user)
         return UserRead.model_validate(user)
 
     async def update(self, db: AsyncSession, user_id: int, user_in: UserUpdate) -> UserRead:
@@ -56,7 +57,7 @@ class UserCRUD(BaseCRUD):
                     detail="Email already registered"
                 )
         if "password" in update_data:
-            password = pwd_context.hash(update_data.pop("password"))
+            password = await password_hasher.hash(update_data.pop("password"))
             user.password = password
 
         for field, value in update_data.items():
@@ -68,7 +69,7 @@ class UserCRUD(BaseCRUD):
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"Database error: {e}")
 
-        await db.refresh(user)
+        await response_cache.invalidate(entity("user", user.id))
         return UserRead.model_validate(user)
 
     @staticmethod
@@ -94,6 +95,12 @@ class UserCRUD(BaseCRUD):
 
         return user_data
 
+    @staticmethod
+    async def team_ids(db: AsyncSession, user_id: int) -> List[int]:
+        """IDs of the teams the user is a member of."""
+        result = await db.execute(select(TeamUserAssociation.team_id).where(TeamUserAssociation.user_id == user_id))
+        return list(result.scalars().all())
+
     async def get_with_teams(self, db: AsyncSession, user_id: int) -> UserReadWithTeams:
         """Retrieve a user by ID along with their team memberships and roles, including team names."""
         result = await db.execute(select(User).where(User.id == user_id).options(
@@ -138,19 +145,23 @@ class UserCRUD(BaseCRUD):
             await db.rollback()
             raise HTTPException(status_code=500, detail=f"Database error: {e}")
 
-        await db.refresh(user)
+        await response_cache.invalidate(entity("user", user.id))
         return UserRead.model_validate(user)
 
-    async def get_team_users(self, db: AsyncSession, team_id: int) -> list[UserRead]:
-        """Return all users who belong to a team."""
+    async def get_team_users(
+            self,
+            db: AsyncSession,
+            team_id: int,
+            limit: int = DEFAULT_PAGE_SIZE,
+            cursor: Optional[str] = None
+    ) -> Page[UserRead]:
+        """Return a page of users who belong to a team, ordered by ID."""
         stmt = (
             select(User)
             .join(TeamUserAssociation, TeamUserAssociation.user_id == User.id)
             .where(TeamUserAssociation.team_id == team_id))
 
-        result = await db.execute(stmt)
-        users = result.scalars().all()
-        return [UserRead.model_validate(user) for user in users]
+        return await self.paginate(db, stmt, limit, cursor)
 
 
 users_crud = UserCRUD()
@@ -0,0 +1,74 @@
+"""
+Version-only queries behind conditional GETs.
+
+The version of a response is the latest `updated_at` of every row it shows, computed in a single
+statement without loading relationships. Deleting a child row leaves no timestamp behind, so the
+writes that delete children touch the parent instead (see `touch_tasks` and `touch_team`).
+"""
+from datetime import datetime, timezone
+from typing import Iterable, Optional, Union
+from fastapi import HTTPException
+from sqlalchemy import select, update, union, func, ScalarSelect
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.models import Task, Team, TeamUserAssociation, TaskAssigneeAssociation, User, Evaluation
+
+
+def _users_version(user_ids) -> ScalarSelect:
+    """Scalar subquery of the latest change to any of the users selected by `user_ids`."""
+    return select(func.max(User.updated_at)).where(User.id.in_(user_ids)).scalar_subquery()
+
+
+async def task_version(db: AsyncSession, task_id: int) -> datetime:
+    """Latest change to a task, its assignees or the users a TaskRead of it shows."""
+    shown_users = union(
+        select(Task.creator_id).where(Task.id == task_id),
+        select(TaskAssigneeAssociation.user_id).where(TaskAssigneeAssociation.task_id == task_id))
+    result = await db.execute(
+        select(func.greatest(Task.updated_at, _users_version(shown_users))).where(Task.id == task_id))
+    version = result.scalar_one_or_none()
+    if version is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return version
+
+
+async def team_version(db: AsyncSession, team_id: int) -> datetime:
+    """Latest change to a team, its memberships, its tasks or the users a TeamWithUsersAndTask shows."""
+    team_tasks = select(Task.id).where(Task.team_id == team_id)
+    shown_users = union(
+        select(TeamUserAssociation.user_id).where(TeamUserAssociation.team_id == team_id),
+        select(Task.creator_id).where(Task.team_id == team_id),
+        select(TaskAssigneeAssociation.user_id).where(TaskAssigneeAssociation.task_id.in_(team_tasks)))
+    result = await db.execute(
+        select(func.greatest(
+            Team.updated_at,
+            select(func.max(Task.updated_at)).where(Task.team_id == team_id).scalar_subquery(),
+            select(func.max(TeamUserAssociation.updated_at))
+            .where(TeamUserAssociation.team_id == team_id).scalar_subquery(),
+            _users_version(shown_users)))
+        .where(Team.id == team_id))
+    version = result.scalar_one_or_none()
+    if version is None:
+        raise HTTPException(status_code=404, detail="Team not found")
+    return version
+
+
+async def task_evaluations_version(db: AsyncSession, task_id: int) -> Optional[datetime]:
+    """Latest change to the evaluations of a task or to their evaluators; None while it has none."""
+    evaluators = select(Evaluation.evaluator_id).where(Evaluation.task_id == task_id)
+    result = await db.execute(
+        select(func.greatest(func.max(Evaluation.updated_at), _users_version(evaluators)))
+        .where(Evaluation.task_id == task_id))
+    return result.scalar_one_or_none()
+
+
+async def touch_tasks(db: AsyncSession, task_ids: Iterable[int]) -> None:
+    """Move `updated_at` of the tasks forward, for changes to their assignees."""
+    await db.execute(
+        update(Task).where(Task.id.in_(list(task_ids))).values(updated_at=datetime.now(timezone.utc)))
+
+
+async def touch_team(db: AsyncSession, team_id: Union[int, ScalarSelect]) -> None:
+    """Move `updated_at` of a team forward, for its deleted tasks and memberships."""
+    await db.execute(
+        update(Team).where(Team.id == team_id).values(updated_at=datetime.now(timezone.utc))
+        .execution_options(synchronize_session=False))
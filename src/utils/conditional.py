@@ -0,0 +1,73 @@
+"""
+Conditional GET: ETag and Last-Modified validators from a response's version timestamp.
+
+Routes look the version up with a version-only query and answer 304 when the client's copy is
+current, before loading relationships or serializing anything.
+"""
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Awaitable, Callable, Optional
+from fastapi import Request, Response, status
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+CACHE_CONTROL = "private, no-cache"
+
+
+def etag(version: datetime) -> str:
+    """Strong entity tag of a version: its microseconds since the epoch in hex."""
+    return f'"{(version - EPOCH) // timedelta(microseconds=1):x}"'
+
+
+def last_modified(version: datetime) -> str:
+    return format_datetime(version.astimezone(timezone.utc), usegmt=True)
+
+
+def _parse_http_date(value: str) -> Optional[datetime]:
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def is_not_modified(request: Request, version: datetime) -> bool:
+    """
+    Whether the client's copy is current. If-None-Match takes precedence over If-Modified-Since
+    and is compared weakly, as for any GET; HTTP dates have whole seconds, so a version is not
+    newer than a date within the same second.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag(version) in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        since = _parse_http_date(if_modified_since)
+        return since is not None and version.replace(microsecond=0) <= since
+    return False
+
+
+def with_validators(response: Response, version: datetime) -> Response:
+    response.headers["ETag"] = etag(version)
+    response.headers["Last-Modified"] = last_modified(version)
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
+
+
+async def conditional_response(
+        request: Request,
+        version: Optional[datetime],
+        load: Callable[[], Awaitable[Response]],
+) -> Response:
+    """
+    Answer 304 when the client already has `version`, otherwise the loaded response with validators.
+    A write committed between the version query and `load` only makes the tag older than the body,
+    which costs the client one more full download, never a stale 304. Without a version (nothing
+    to show yet) the response is returned without validators.
+    """
+    if version is None:
+        return await load()
+    if is_not_modified(request, version):
+        return with_validators(Response(status_code=status.HTTP_304_NOT_MODIFIED), version)
+    return with_validators(await load(), version)
@@ -0,0 +1,85 @@
+from bisect import bisect_left
+from typing import Callable, Dict, Sequence
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Counter:
+    """Monotonically increasing in-process counter."""
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        self.value += amount
+
+
+class Gauge:
+    """Gauge whose value is read from a callback at snapshot time."""
+
+    def __init__(self, callback: Callable[[], float]) -> None:
+        self.callback = callback
+
+    @property
+    def value(self) -> float:
+        return self.callback()
+
+
+class Histogram:
+    """Cumulative bucketed histogram of observed values (seconds by default)."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> dict:
+        cumulative, buckets = 0, {}
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = self.count
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
+class MetricsRegistry:
+    """Registry of named counters, gauges and histograms exposed by the metrics endpoint."""
+
+    def __init__(self) -> None:
+        self.counters: Dict[str, Counter] = {}
+        self.gauges: Dict[str, Gauge] = {}
+        self.histograms: Dict[str, Histogram] = {}
+
+    def counter(self, name: str) -> Counter:
+        """Return the counter registered under `name`, creating it on first use."""
+        if name not in self.counters:
+            self.counters[name] = Counter()
+        return self.counters[name]
+
+    def gauge(self, name: str, callback: Callable[[], float]) -> Gauge:
+        """Register (or replace) a callback gauge under `name`."""
+        self.gauges[name] = Gauge(callback)
+        return self.gauges[name]
+
+    def histogram(self, name: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Return the histogram registered under `name`, creating it on first use."""
+        if name not in self.histograms:
+            self.histograms[name] = Histogram(buckets)
+        return self.histograms[name]
+
+    def snapshot(self) -> dict:
+        """Return current values of all registered metrics."""
+        return {
+            "counters": {name: c.value for name, c in self.counters.items()},
+            "gauges": {name: g.value for name, g in self.gauges.items()},
+            "histograms": {name: h.snapshot() for name, h in self.histograms.items()},
+        }
+
+
+metrics = MetricsRegistry()
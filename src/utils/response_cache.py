@@ -0,0 +1,202 @@
+"""
+Cache of serialized read responses, invalidated by entity versions.
+
+Every cached response records the version of each entity it was built from ("task:5",
+"user:3", ...). A write gives the entities it touched fresh versions, so only the responses
+that depended on them miss afterwards; nothing has to know which cache keys exist.
+
+Entries and versions live in a pluggable backend: an in-process LRU by default, or any server
+speaking the Redis protocol when RESPONSE_CACHE_URL is set (requires the `redis` package).
+"""
+import json
+import logging
+from time import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import uuid4
+from fastapi import Response
+from pydantic import TypeAdapter
+from src.config.settings import settings
+from src.utils.cache import TTLCache
+from src.utils.metrics import Counter, metrics
+
+logger = logging.getLogger(__name__)
+
+ENTRY_PREFIX = "response:"
+VERSION_PREFIX = "version:"
+VERSION_TTL_FACTOR = 10
+
+
+def entity(kind: str, entity_id: int) -> str:
+    """Name of one cached entity, e.g. entity("task", 5) == "task:5"."""
+    return f"{kind}:{entity_id}"
+
+
+def entities(kind: str, entity_ids: Iterable[int]) -> List[str]:
+    return [entity(kind, entity_id) for entity_id in entity_ids]
+
+
+class MemoryCacheBackend:
+    """In-process backend; the least recently used keys are evicted once `maxsize` is reached."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._cache = TTLCache(maxsize=maxsize)
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        return [self._cache.get(key) for key in keys]
+
+    async def set_many(self, items: Dict[str, bytes], ttl: int) -> None:
+        expires_at = time() + ttl
+        for key, value in items.items():
+            self._cache.set(key, value, expires_at)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+class RedisCacheBackend:
+    """Backend on a Redis protocol client such as `redis.asyncio.Redis`, shared by all workers."""
+
+    def __init__(self, client: Any) -> None:
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCacheBackend":
+        try:
+            from redis.asyncio import Redis
+        except ImportError as e:
+            raise RuntimeError("RESPONSE_CACHE_URL is set but the `redis` package is not installed") from e
+        return cls(Redis.from_url(url))
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        return list(await self.client.mget(keys))
+
+    async def set_many(self, items: Dict[str, bytes], ttl: int) -> None:
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(key, value, ex=ttl)
+            await pipe.execute()
+
+
+def create_backend(url: Optional[str], maxsize: int):
+    """Redis backend for a redis:// URL, the in-process one otherwise."""
+    if url:
+        return RedisCacheBackend.from_url(url)
+    return MemoryCacheBackend(maxsize)
+
+
+def _new_version() -> bytes:
+    return uuid4().hex.encode()
+
+
+def _pack(versions: Dict[str, bytes], body: bytes) -> bytes:
+    header = json.dumps({name: version.decode() for name, version in versions.items()})
+    return header.encode() + b"\n" + body
+
+
+def _unpack(raw: bytes) -> Tuple[Dict[str, bytes], bytes]:
+    header, _, body = raw.partition(b"\n")
+    return {name: version.encode() for name, version in json.loads(header).items()}, body
+
+
+class ResponseCache:
+    """Serve JSON responses from the backend while none of the entities they were built from changed."""
+
+    def __init__(self, backend, ttl: int) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.version_ttl = ttl * VERSION_TTL_FACTOR
+        self._route_counters: Dict[str, Tuple[Counter, Counter]] = {}
+
+    def _counters(self, route: str) -> Tuple[Counter, Counter]:
+        """Hit and miss counters of a route, plus a hit ratio gauge registered on first use."""
+        if route not in self._route_counters:
+            label = f'{{route="{route}"}}'
+            hits = metrics.counter(f"response_cache_hits_total{label}")
+            misses = metrics.counter(f"response_cache_misses_total{label}")
+            metrics.gauge(
+                f"response_cache_hit_ratio{label}",
+                lambda: hits.value / (hits.value + misses.value) if hits.value + misses.value else 0.0)
+            self._route_counters[route] = (hits, misses)
+        return self._route_counters[route]
+
+    async def _versions(self, names: Sequence[str]) -> Dict[str, bytes]:
+        """
+        Current versions of the entities. Entities without one get a fresh version first, so a
+        version that is later evicted can never compare equal to what an entry recorded.
+        """
+        current = await self.backend.get_many([VERSION_PREFIX + name for name in names])
+        versions = dict(zip(names, current))
+        missing = {name: _new_version() for name, version in versions.items() if version is None}
+        if missing:
+            await self.backend.set_many(
+                {VERSION_PREFIX + name: version for name, version in missing.items()}, self.version_ttl)
+            versions.update(missing)
+        return versions
+
+    async def _lookup(self, key: str) -> Optional[bytes]:
+        (raw,) = await self.backend.get_many([ENTRY_PREFIX + key])
+        if raw is None:
+            return None
+        recorded, body = _unpack(raw)
+        names = list(recorded)
+        current = await self.backend.get_many([VERSION_PREFIX + name for name in names])
+        if any(version != recorded[name] for name, version in zip(names, current)):
+            return None
+        return body
+
+    async def get_or_load(
+            self,
+            route: str,
+            key: str,
+            adapter: TypeAdapter,
+            load: Callable[[], Awaitable[Tuple[Any, Iterable[str]]]],
+            depends_on: Iterable[str] = (),
+            resolve: Optional[Callable[[], Awaitable[Iterable[str]]]] = None,
+    ) -> Response:
+        """
+        Return the cached response for `key`, or call `load` for the value and the entities it was
+        built from and cache its JSON. On a miss `resolve` finds the entities that depend on data,
+        such as a team's members, and the versions of those and of `depends_on` are read before
+        loading, so a write committed while the value is being loaded is not cached as current.
+        A value built from an entity whose version was not read before loading is returned
+        without being cached. Backend errors fall back to loading from the database.
+        """
+        hits, misses = self._counters(route)
+        versions: Optional[Dict[str, bytes]] = None
+        try:
+            body = await self._lookup(key)
+        except Exception:
+            logger.exception("Response cache read failed for %s", key)
+        else:
+            if body is not None:
+                hits.inc()
+                return Response(content=body, media_type="application/json")
+            names = list(dict.fromkeys([*depends_on, *(await resolve() if resolve else ())]))
+            try:
+                versions = await self._versions(names) if names else {}
+            except Exception:
+                logger.exception("Response cache read failed for %s", key)
+        misses.inc()
+
+        value, built_from = await load()
+        body = adapter.dump_json(value)
+        if versions is not None and all(name in versions for name in built_from):
+            try:
+                await self.backend.set_many({ENTRY_PREFIX + key: _pack(versions, body)}, self.ttl)
+            except Exception:
+                logger.exception("Response cache write failed for %s", key)
+        return Response(content=body, media_type="application/json")
+
+    async def invalidate(self, *names: str) -> None:
+        """Give the entities fresh versions, so every response built from one of them misses from now on."""
+        if not names:
+            return
+        try:
+            await self.backend.set_many(
+                {VERSION_PREFIX + name: _new_version() for name in set(names)}, self.version_ttl)
+        except Exception:
+            logger.exception("Response cache invalidation failed for %s", sorted(set(names)))
+
+
+response_cache = ResponseCache(
+    create_backend(settings.RESPONSE_CACHE_URL, settings.RESPONSE_CACHE_SIZE), settings.RESPONSE_CACHE_TTL)
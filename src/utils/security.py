@@ -1,7 +1,13 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Callable
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 from datetime import datetime, timedelta, timezone
 from jose import jwt
 from src.config.settings import settings
+from src.utils.metrics import metrics
 from uuid import uuid4
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -13,6 +19,53 @@ def verify_password(plain_password: str, password: str) -> bool:
     return pas
 
 
+class PasswordHasher:
+    """
+    Runs bcrypt hashing and verification on a dedicated, size-limited thread pool.
+    Keeps the event loop free during logins; once `max_pending` operations are in flight,
+    new ones are rejected with 503 instead of queueing without bound.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_pending = max_pending
+        self.pending = 0
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        self.hash_seconds = metrics.histogram("password_hash_seconds")
+        self.verify_seconds = metrics.histogram("password_verify_seconds")
+        self.rejected = metrics.counter("password_hash_rejected_total")
+        metrics.gauge("password_hash_pending", lambda: self.pending)
+
+    async def _run(self, histogram, func: Callable[..., Any], *args: Any) -> Any:
+        """Run `func` in the pool, recording its latency including time spent waiting for a worker."""
+        if self.pending >= self.max_pending:
+            self.rejected.inc()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication service is busy, try again later",
+            )
+        self.pending += 1
+        started = perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        finally:
+            self.pending -= 1
+            histogram.observe(perf_counter() - started)
+
+    async def hash(self, password: str) -> str:
+        """Hash a plain password."""
+        return await self._run(self.hash_seconds, pwd_context.hash, password)
+
+    async def verify(self, plain_password: str, password: str) -> bool:
+        """Verify a plain password against a hash."""
+        return await self._run(self.verify_seconds, pwd_context.verify, plain_password, password)
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """Create a JWT access token with an optional expiration time."""
     to_encode = data.copy()
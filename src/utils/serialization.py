@@ -0,0 +1,23 @@
+"""
+Single-pass serialization of trusted read schemas.
+
+Services already build read schemas from database rows. Returning one of them from a route makes
+FastAPI dump it to a dict, validate that against `response_model` and dump it again before
+encoding. `json_response` writes the schema straight to JSON bytes with a compiled TypeAdapter
+instead; `response_model` stays on the route for the OpenAPI schema.
+"""
+from functools import lru_cache
+from typing import Any
+from fastapi import Response, status
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def type_adapter(tp: Any) -> TypeAdapter:
+    """TypeAdapter of a type, built once per process."""
+    return TypeAdapter(tp)
+
+
+def json_response(tp: Any, value: Any, status_code: int = status.HTTP_200_OK) -> Response:
+    """Serialize `value`, which must already be an instance of `tp`, without validating it again."""
+    return Response(content=type_adapter(tp).dump_json(value), media_type="application/json", status_code=status_code)
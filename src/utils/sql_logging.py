@@ -0,0 +1,62 @@
+import json
+import logging
+import random
+import time
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("sql")
+current_route: ContextVar[str | None] = ContextVar("current_route", default=None)
+
+MAX_STATEMENT_LENGTH = 2000
+
+
+def _emit(level: int, statement: str, duration_ms: float, rowcount: int, executemany: bool) -> None:
+    """Write one statement as a single-line JSON record."""
+    logger.log(level, json.dumps({
+        "event": "sql",
+        "route": current_route.get(),
+        "duration_ms": round(duration_ms, 3),
+        "rowcount": rowcount,
+        "executemany": executemany,
+        "statement": " ".join(statement.split())[:MAX_STATEMENT_LENGTH],
+    }, ensure_ascii=False))
+
+
+def setup_sql_logging(engine: Engine, mode: str, sample_rate: float, slow_ms: int) -> None:
+    """
+    Attach statement logging to the engine according to `mode`:
+    "off" - nothing, "all" - every statement, "sampled" - a random share of statements
+    plus all slow ones, "slow" - only statements slower than `slow_ms`.
+    Parameters are never logged.
+    """
+    if mode == "off":
+        return
+
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "handle_error")
+    def drop_timer(exception_context):
+        # after_cursor_execute does not fire for a failed statement; drop its start time
+        # so the stack does not grow on the pooled connection.
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start_time"):
+            conn.info["query_start_time"].pop()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def log_statement(conn, cursor, statement, parameters, context, executemany):
+        duration_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+
+        if duration_ms >= slow_ms:
+            _emit(logging.WARNING, statement, duration_ms, cursor.rowcount, executemany)
+        elif mode == "all" or (mode == "sampled" and random.random() < sample_rate):
+            _emit(logging.INFO, statement, duration_ms, cursor.rowcount, executemany)
@@ -1,7 +1,9 @@
 import pytest
 import pytest_asyncio
 from src.schemas.user import UserPayload, UserRole, UserTeamInfo, TeamRole
-from src.models import User, Team, TaskPriority, TaskStatus, Task
+from src.models import User, Team, TaskPriority, TaskStatus, Task, TeamUserAssociation
+from src.main import app
+from src.services.auth import get_current_user
 from src.utils.security import pwd_context
 
 
@@ -120,3 +122,26 @@ async def create_task(test_session, user_in_db, team_in_db):
     await test_session.commit()
     await test_session.refresh(task)
     return task
+
+
+@pytest.fixture
+def as_team_admin(user_in_db, team_in_db):
+    """Authenticate requests as a global admin who manages `team_in_db`."""
+    app.dependency_overrides[get_current_user] = lambda: UserPayload(
+        id=user_in_db.id, role="admin", teams=[{"team_id": team_in_db.id, "role": "manager"}])
+    yield
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+@pytest_asyncio.fixture
+async def member(test_session, user_in_db, team_in_db):
+    """A second member of `team_in_db`, next to `user_in_db` who manages it."""
+    user = User(id=user_in_db.id + 1, email="member@example.com", first_name="Member", last_name="One",
+                password="x", role="USER")
+    test_session.add(user)
+    await test_session.flush()
+    test_session.add_all([
+        TeamUserAssociation(team_id=team_in_db.id, user_id=user_in_db.id, role=TeamRole.MANAGER),
+        TeamUserAssociation(team_id=team_in_db.id, user_id=user.id)])
+    await test_session.commit()
+    return user
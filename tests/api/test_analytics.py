@@ -0,0 +1,58 @@
+import pytest
+from httpx import AsyncClient
+from src.main import app
+from src.models import TaskStatus, TaskStatusHistory
+from src.schemas.user import UserPayload
+from src.services.auth import get_current_user
+
+
+@pytest.fixture
+def as_team_manager(user_in_db, team_in_db):
+    """Authenticate requests as a manager of `team_in_db`."""
+    app.dependency_overrides[get_current_user] = lambda: UserPayload(
+        id=user_in_db.id, role="user", teams=[{"team_id": team_in_db.id, "role": "manager"}])
+    yield
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+@pytest.mark.asyncio
+class TestTeamAnalytics:
+    async def test_completed_task_is_reported(
+            self, test_client: AsyncClient, test_session, as_team_manager, user_in_db, team_in_db):
+        task = (await test_client.post(f"/tasks/{team_in_db.id}/tasks/", json={"title": "Ship"})).json()
+        test_session.add(TaskStatusHistory(task_id=task["id"], changed_by_id=user_in_db.id, new_status=TaskStatus.DONE))
+        await test_session.commit()
+
+        response = await test_client.get(f"/analytics/teams/{team_in_db.id}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["throughput"]) in (12, 13)
+        assert data["throughput"][-1]["cumulative"] == 1
+        assert data["cycle_time"]["tasks"] == 1
+        assert data["overdue"] == {"total": 0, "unassigned": 0, "by_assignee": []}
+
+    async def test_repeated_request_is_served_from_cache(
+            self, test_client: AsyncClient, query_counter, as_team_manager, team_in_db):
+        url = f"/analytics/teams/{team_in_db.id}/overdue"
+        first = await test_client.get(url)
+        with query_counter:
+            second = await test_client.get(url)
+
+        assert second.json() == first.json()
+        query_counter.assert_budget(0)
+
+    async def test_reversed_period_is_rejected(self, test_client: AsyncClient, as_team_manager, team_in_db):
+        response = await test_client.get(
+            f"/analytics/teams/{team_in_db.id}/throughput", params={"start_date": "2025-02-01", "end_date": "2025-01-01"})
+
+        assert response.status_code == 400
+
+    async def test_executor_is_forbidden(self, test_client: AsyncClient, user_in_db, team_in_db):
+        app.dependency_overrides[get_current_user] = lambda: UserPayload(
+            id=user_in_db.id, role="user", teams=[{"team_id": team_in_db.id, "role": "executor"}])
+
+        response = await test_client.get(f"/analytics/teams/{team_in_db.id}/scores")
+
+        assert response.status_code == 403
+        app.dependency_overrides.pop(get_current_user, None)
@@ -0,0 +1,74 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+class TestConditionalGet:
+    """A current copy is answered with 304 after the version query alone; any change shown in the body gives 200."""
+
+    async def assert_not_modified(self, test_client: AsyncClient, query_counter, url: str, **headers) -> None:
+        with query_counter:
+            response = await test_client.get(url, headers=headers)
+        assert response.status_code == 304
+        assert response.content == b""
+        query_counter.assert_budget(1)
+
+    async def assert_changed(self, test_client: AsyncClient, url: str, tag: str) -> str:
+        response = await test_client.get(url, headers={"If-None-Match": tag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != tag
+        return response.headers["etag"]
+
+    async def test_task(self, test_client: AsyncClient, test_session, query_counter, as_team_admin, team_in_db,
+                        create_task, member):
+        url = f"/tasks/{create_task.id}"
+        response = await test_client.get(url)
+        assert response.headers["cache-control"] == "private, no-cache"
+        tag = response.headers["etag"]
+        await self.assert_not_modified(test_client, query_counter, url, **{"If-None-Match": tag})
+        await self.assert_not_modified(
+            test_client, query_counter, url, **{"If-Modified-Since": response.headers["last-modified"]})
+
+        await test_client.post(f"/tasks_users/{team_in_db.id}/{create_task.id}/assignees",
+                               json={"users": [{"user_id": member.id}]})
+        tag = await self.assert_changed(test_client, url, tag)
+
+        await test_client.request("DELETE", f"/tasks_users/{team_in_db.id}/{create_task.id}/assignees",
+                                  json={"user_ids": [member.id]})
+        tag = await self.assert_changed(test_client, url, tag)
+
+        await test_client.put("/users/me", json={"first_name": "Renamed"})
+        await self.assert_changed(test_client, url, tag)
+
+    async def test_team(self, test_client: AsyncClient, query_counter, as_team_admin, team_in_db, create_task,
+                        member):
+        url = f"/teams/{team_in_db.id}"
+        tag = (await test_client.get(url)).headers["etag"]
+        await self.assert_not_modified(test_client, query_counter, url, **{"If-None-Match": tag})
+
+        await test_client.put(f"/teams/{team_in_db.id}", json={"description": "changed"})
+        tag = await self.assert_changed(test_client, url, tag)
+
+        await test_client.request("DELETE", f"/teams_users/{team_in_db.id}/users", json={"user_ids": [member.id]})
+        tag = await self.assert_changed(test_client, url, tag)
+
+        await test_client.delete(f"/tasks/{team_in_db.id}/{create_task.id}")
+        await self.assert_changed(test_client, url, tag)
+
+    async def test_unknown_task(self, test_client: AsyncClient, as_team_admin):
+        response = await test_client.get("/tasks/999999", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 404
+
+    async def test_task_evaluations(self, test_client: AsyncClient, query_counter, as_team_admin, create_task):
+        url = f"/evaluations/task/{create_task.id}/evaluations"
+        response = await test_client.get(url)
+        assert response.json() == []
+        assert "etag" not in response.headers
+
+        await test_client.post(f"/evaluations/tasks/{create_task.id}/evaluations", json={"score": 4})
+        tag = (await test_client.get(url)).headers["etag"]
+        await self.assert_not_modified(test_client, query_counter, url, **{"If-None-Match": tag})
+
+        await test_client.put(f"/evaluations/{create_task.id}", json={"score": 5})
+        await self.assert_changed(test_client, url, tag)
@@ -0,0 +1,80 @@
+import csv
+import io
+import json
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from src.config.settings import settings
+from src.main import app
+from src.models import Comment, Task, Team, TaskStatus, TaskStatusHistory
+from src.schemas.user import UserPayload
+from src.services.auth import get_current_user
+
+
+@pytest_asyncio.fixture
+async def team_tasks(test_session, user_in_db, team_in_db):
+    """Five tasks of `team_in_db` with a comment and a status change each, and one task of another team."""
+    other = Team(name="Other Team", invite_code="OTHER1")
+    test_session.add(other)
+    await test_session.flush()
+    tasks = [Task(title=f"Task {i}", creator_id=user_in_db.id, team_id=team_in_db.id) for i in range(5)]
+    test_session.add_all([*tasks, Task(title="Foreign", creator_id=user_in_db.id, team_id=other.id)])
+    await test_session.flush()
+    test_session.add_all(
+        Comment(task_id=task.id, author_id=user_in_db.id, content=f'Says "hi", then\nleaves {i}')
+        for i, task in enumerate(tasks))
+    test_session.add_all(
+        TaskStatusHistory(task_id=task.id, changed_by_id=user_in_db.id, new_status=TaskStatus.DONE)
+        for task in tasks)
+    await test_session.commit()
+    return tasks
+
+
+@pytest.fixture
+def small_batches(monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+
+
+@pytest.mark.asyncio
+class TestTeamExport:
+    async def test_tasks_as_ndjson_in_batches(
+            self, test_client: AsyncClient, query_counter, as_team_admin, team_in_db, team_tasks, small_batches):
+        with query_counter:
+            response = await test_client.get(f"/exports/teams/{team_in_db.id}/tasks")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.headers["content-disposition"] == f'attachment; filename="team-{team_in_db.id}-tasks.ndjson"'
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["id"] for row in rows] == [task.id for task in team_tasks]
+        assert rows[0]["status"] == "open"
+        query_counter.assert_budget(1)
+
+    async def test_comments_as_csv(self, test_client: AsyncClient, as_team_admin, team_in_db, team_tasks, small_batches):
+        response = await test_client.get(f"/exports/teams/{team_in_db.id}/comments", params={"format": "csv"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        header, *rows = list(csv.reader(io.StringIO(response.text)))
+        assert header == ["id", "task_id", "author_id", "content", "created_at"]
+        assert [row[3] for row in rows] == [f'Says "hi", then\nleaves {i}' for i in range(5)]
+
+    async def test_status_history(self, test_client: AsyncClient, as_team_admin, team_in_db, team_tasks):
+        response = await test_client.get(f"/exports/teams/{team_in_db.id}/status_history")
+
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [(row["task_id"], row["new_status"]) for row in rows] == [(task.id, "done") for task in team_tasks]
+
+    async def test_empty_csv_has_header(self, test_client: AsyncClient, as_team_admin, team_in_db):
+        response = await test_client.get(f"/exports/teams/{team_in_db.id}/status_history", params={"format": "csv"})
+
+        assert response.text.splitlines() == ["id,task_id,changed_by_id,new_status,changed_at"]
+
+    async def test_executor_is_forbidden(self, test_client: AsyncClient, user_in_db, team_in_db):
+        app.dependency_overrides[get_current_user] = lambda: UserPayload(
+            id=user_in_db.id, role="user", teams=[{"team_id": team_in_db.id, "role": "executor"}])
+
+        response = await test_client.get(f"/exports/teams/{team_in_db.id}/tasks")
+
+        assert response.status_code == 403
+        app.dependency_overrides.pop(get_current_user, None)
@@ -0,0 +1,64 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from src.main import app
+from src.models import User
+from src.schemas.user import UserPayload
+from src.services.auth import get_current_user
+
+
+@pytest.mark.asyncio
+class TestMeetingAvailability:
+
+    async def test_availability_route(self, test_client: AsyncClient, user_in_db):
+        """The availability endpoint is not shadowed by /{meeting_id} and returns the whole window when free."""
+        app.dependency_overrides[get_current_user] = lambda: UserPayload(id=user_in_db.id, role="user")
+
+        response = await test_client.get("/meetings/availability", params={
+            "participant_ids": [user_in_db.id],
+            "start": "2030-01-07T09:00:00Z",
+            "end": "2030-01-07T17:00:00Z",
+            "duration_minutes": 30,
+        })
+        app.dependency_overrides.clear()
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["busy"] == []
+        assert len(data["free_slots"]) == 1
+        assert data["free_slots"][0]["start"].startswith("2030-01-07T09:00:00")
+
+    async def test_availability_of_teammate(self, test_client: AsyncClient, user_in_db, team_in_db, member):
+        """A member can look up the availability of users from their own team."""
+        app.dependency_overrides[get_current_user] = lambda: UserPayload(
+            id=member.id, role="user", teams=[{"team_id": team_in_db.id, "role": "executor"}])
+
+        response = await test_client.get("/meetings/availability", params={
+            "participant_ids": [member.id, user_in_db.id],
+            "start": "2030-01-07T09:00:00Z",
+            "end": "2030-01-07T17:00:00Z",
+            "duration_minutes": 30,
+        })
+        app.dependency_overrides.clear()
+
+        assert response.status_code == status.HTTP_200_OK
+
+    async def test_availability_outside_teams_forbidden(self, test_client: AsyncClient, test_session, team_in_db,
+                                                        member):
+        """A non-admin cannot read the busy intervals of users who share no team with them."""
+        outsider = User(id=member.id + 1, email="outsider@example.com", first_name="Out", last_name="Sider", password="x",
+                        role="USER")
+        test_session.add(outsider)
+        await test_session.commit()
+        app.dependency_overrides[get_current_user] = lambda: UserPayload(
+            id=member.id, role="user", teams=[{"team_id": team_in_db.id, "role": "executor"}])
+
+        response = await test_client.get("/meetings/availability", params={
+            "participant_ids": [member.id, outsider.id],
+            "start": "2030-01-07T09:00:00Z",
+            "end": "2030-01-07T17:00:00Z",
+            "duration_minutes": 30,
+        })
+        app.dependency_overrides.clear()
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
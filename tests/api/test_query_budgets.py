@@ -0,0 +1,230 @@
+import pytest
+import pytest_asyncio
+from fastapi.routing import APIRoute
+from httpx import AsyncClient
+from src.main import app
+from src.models import Comment, TeamRole, TeamUserAssociation, User
+from tests.query_budget import ROUTE_BUDGETS
+
+MEETING = {"title": "Sync", "start_datetime": "2030-05-01T10:00:00Z", "end_datetime": "2030-05-01T11:00:00Z"}
+
+
+def assert_selected_once(query_counter, table: str) -> None:
+    """The row loaded by the permission check is not selected again by the service."""
+    selects = [s for s in query_counter.statements if s.startswith("SELECT") and f"\nFROM {table} \n" in s + " \n"]
+    assert len(selects) == 1, selects
+
+
+@pytest.mark.asyncio
+class TestMutationQueryBudgets:
+    """
+    The write endpoints stay within their `ROUTE_BUDGETS`. Objects are returned from the identity map
+    after commit, so a budget only covers validation, the writes and derived calendar and rollup rows.
+    """
+
+    async def test_create_user(self, test_client: AsyncClient, query_counter, user_data):
+        with query_counter:
+            response = await test_client.post("/users/", json=user_data)
+        assert response.status_code == 201
+        query_counter.assert_budget(ROUTE_BUDGETS[("POST", "/users/")])
+
+    async def test_update_own_profile(self, test_client: AsyncClient, query_counter, as_team_admin):
+        with query_counter:
+            response = await test_client.put("/users/me", json={"first_name": "Renamed"})
+        assert response.status_code == 200
+        assert response.json()["first_name"] == "Renamed"
+        query_counter.assert_budget(ROUTE_BUDGETS[("PUT", "/users/me")])
+
+    async def test_set_global_role(self, test_client: AsyncClient, query_counter, as_team_admin, user_in_db):
+        with query_counter:
+            response = await test_client.put(f"/users/{user_in_db.id}/set_role", params={"role": "user"})
+        assert response.status_code == 200
+        query_counter.assert_budget(ROUTE_BUDGETS[("PUT", "/users/{user_id}/set_role")])
+
+    async def test_create_team(self, test_client: AsyncClient, query_counter, as_team_admin):
+        with query_counter:
+            response = await test_client.post("/teams/", json={"name": "Budget Team", "description": "desc", "users": []})
+        assert response.status_code == 201
+        query_counter.assert_budget(ROUTE_BUDGETS[("POST", "/teams/")])
+
+    async def test_update_team(self, test_client: AsyncClient, query_counter, as_team_admin, team_in_db):
+        with query_counter:
+            response = await test_client.put(f"/teams/{team_in_db.id}", json={"description": "changed"})
+        assert response.status_code == 200
+        query_counter.assert_budget(ROUTE_BUDGETS[("PUT", "/teams/{team_id}")])
+
+    async def test_create_task(self, test_client: AsyncClient, query_counter, as_team_admin, team_in_db):
+        with query_counter:
+            response = await test_client.post(f"/tasks/{team_in_db.id}/tasks/", json={"title": "Budget task"})
+        assert response.status_code == 201
+        query_counter.assert_budget(ROUTE_BUDGETS[("POST", "/tasks/{team_id}/tasks/")])
+
+    async def test_update_task(
+            self, test_client: AsyncClient, query_counter, as_team_admin, team_in_db, create_task):
+        with query_counter:
+            response = await test_client.put(
+                f"/tasks/{team_in_db.id}/{create_task.id}", json={"priority": "high"})
+        assert response.status_code == 200
+        query_counter.assert_budget(ROUTE_BUDGETS[("PUT", "/tasks/{team_id}/{task_id}")])
+
+    async def test_update_task_status(
+            self, test_client: AsyncClient, query_counter, as_team_admin, team_in_db, create_task):
+        with query_counter:
+            response = await test_client.patch(
+                f"/tasks/{team_in_db.id}/{create_task.id}/status", json={"status": "done"})
+        assert response.status_code == 200
+        query_counter.assert_budget(ROUTE_BUDGETS[("PATCH", "/tasks/{team_id}/{task_id}/status")])
+
+    async def test_create_meeting(self, test_client: AsyncClient, query_counter, as_team_admin):
+        with query_counter:
+            response = await test_client.post("/meetings/", json=MEETING)
+        assert response.status_code == 201
+        query_counter.assert_budget(ROUTE_BUDGETS[("POST", "/meetings/")])
+
+    async def test_update_meeting(self, test_client: AsyncClient, query_counter, as_team_admin):
+        meeting_id = (await test_client.post("/meetings/", json=MEETING)).json()["id"]
+        with query_counter:
+            response = await test_client.patch(f"/meetings/{meeting_id}", json={"location": "Room 2"})
+        assert response.status_code == 200
+        query_counter.assert_budget(ROUTE_BUDGETS[("PATCH", "/meetings/{meeting_id}")])
+        assert_selected_once(query_counter, "meetings")
+
+    async def test_create_evaluation(self, test_client: AsyncClient, query_counter, as_team_admin, create_task):
+        with query_counter:
+            response = await test_client.post(
+                f"/evaluations/tasks/{create_task.id}/evaluations", json={"score": 4})
+        assert response.status_code == 201
+        query_counter.assert_budget(ROUTE_BUDGETS[("POST", "/evaluations/tasks/{task_id}/evaluations")])
+
+    async def test_update_evaluation(self, test_client: AsyncClient, query_counter, as_team_admin, create_task):
+        await test_client.post(f"/evaluations/tasks/{create_task.id}/evaluations", json={"score": 4})
+        with query_counter:
+            response = await test_client.put(f"/evaluations/{create_task.id}", json={"score": 5})
+        assert response.status_code == 200
+        query_counter.assert_budget(ROUTE_BUDGETS[("PUT", "/evaluations/{task_id}")])
+
+    async def test_update_comment(self, test_client: AsyncClient, query_counter, as_team_admin, create_task):
+        comment_id = (await test_client.post(f"/comments/{create_task.id}", json={"content": "First"})).json()["id"]
+        with query_counter:
+            response = await test_client.put(f"/comments/{comment_id}", json={"content": "Edited"})
+        assert response.status_code == 200
+        assert response.json()["author_full_name"]
+        query_counter.assert_budget(ROUTE_BUDGETS[("PUT", "/comments/{comment_id}")])
+        assert_selected_once(query_counter, "comments")
+
+    async def test_delete_comment(self, test_client: AsyncClient, query_counter, as_team_admin, create_task):
+        comment_id = (await test_client.post(f"/comments/{create_task.id}", json={"content": "First"})).json()["id"]
+        with query_counter:
+            response = await test_client.delete(f"/comments/{comment_id}")
+        assert response.status_code == 204
+        query_counter.assert_budget(ROUTE_BUDGETS[("DELETE", "/comments/{comment_id}")])
+        assert_selected_once(query_counter, "comments")
+
+    async def test_delete_meeting(self, test_client: AsyncClient, query_counter, as_team_admin):
+        meeting_id = (await test_client.post("/meetings/", json=MEETING)).json()["id"]
+        with query_counter:
+            response = await test_client.delete(f"/meetings/{meeting_id}")
+        assert response.status_code == 204
+        query_counter.assert_budget(ROUTE_BUDGETS[("DELETE", "/meetings/{meeting_id}")])
+        assert_selected_once(query_counter, "meetings")
+
+
+@pytest_asyncio.fixture
+async def populated_team(test_session, test_client: AsyncClient, as_team_admin, user_in_db, team_in_db):
+    """A team with several members, assigned tasks, comments by different authors, meetings and evaluations."""
+    members = [
+        User(id=user_in_db.id + 1 + i, email=f"member{i}@example.com", first_name="Member", last_name=str(i),
+             password="x", role="USER")
+        for i in range(4)]
+    test_session.add_all(members)
+    await test_session.flush()
+    test_session.add(TeamUserAssociation(team_id=team_in_db.id, user_id=user_in_db.id, role=TeamRole.MANAGER))
+    test_session.add_all(TeamUserAssociation(team_id=team_in_db.id, user_id=m.id) for m in members)
+    await test_session.commit()
+
+    task_ids = []
+    for i in range(3):
+        response = await test_client.post(f"/tasks/{team_in_db.id}/tasks/", json={
+            "title": f"Task {i}",
+            "due_date": f"2030-05-0{i + 1}T09:00:00Z",
+            "assignees": [{"user_id": m.id} for m in members]})
+        task_ids.append(response.json()["id"])
+
+    test_session.add_all(
+        Comment(task_id=task_ids[0], author_id=author.id, content=f"Comment by {author.email}")
+        for author in [user_in_db, *members])
+    await test_session.commit()
+
+    for i in range(3):
+        await test_client.post("/meetings/", json={
+            "title": f"Meeting {i}",
+            "start_datetime": f"2030-05-0{i + 1}T12:00:00Z",
+            "end_datetime": f"2030-05-0{i + 1}T13:00:00Z",
+            "participant_ids": [m.id for m in members]})
+        await test_client.post(f"/evaluations/tasks/{task_ids[i]}/evaluations", json={"score": i + 2})
+
+    return {"team_id": team_in_db.id, "task_ids": task_ids, "member_ids": [m.id for m in members]}
+
+
+@pytest.mark.asyncio
+class TestRoutesNPlusOne:
+    """Endpoints over several related rows execute a constant number of statements."""
+
+    async def assert_constant(self, test_client: AsyncClient, query_counter, url: str):
+        with query_counter:
+            response = await test_client.get(url)
+        assert response.status_code == 200, response.text
+        query_counter.assert_no_n_plus_one()
+        return response.json()
+
+    async def test_comments_with_author_names(self, test_client: AsyncClient, query_counter, populated_team):
+        data = await self.assert_constant(
+            test_client, query_counter, f"/comments/task/{populated_team['task_ids'][0]}")
+        assert len(data["items"]) == 5
+        assert {item["author_full_name"] for item in data["items"]} >= {"Member 0", "Member 3"}
+
+    async def test_team_with_users_and_tasks(self, test_client: AsyncClient, query_counter, populated_team):
+        data = await self.assert_constant(test_client, query_counter, f"/teams/{populated_team['team_id']}")
+        assert len(data["team_users"]) == 5
+        assert len(data["tasks"]) == 3
+        assert all(len(task["assignees"]) == 4 for task in data["tasks"])
+
+    async def test_delete_team_loads_cascade_once(self, test_client: AsyncClient, query_counter, populated_team):
+        with query_counter:
+            response = await test_client.delete(f"/teams/{populated_team['team_id']}")
+        assert response.status_code == 204
+        query_counter.assert_no_n_plus_one()
+
+    @pytest.mark.parametrize("url", [
+        "/users/",
+        "/users/me",
+        "/users/1",
+        "/users/teams/{team_id}/users",
+        "/teams/",
+        "/teams/my_teams",
+        "/tasks/{task_id}",
+        "/tasks/{team_id}/tasks",
+        "/evaluations/my_evaluations",
+        "/evaluations/my_average_score?start_date=2020-01-01&end_date=2040-01-01",
+        "/evaluations/task/{task_id}/evaluations",
+        "/meetings/me_meetings",
+        "/meetings/meetings/",
+        "/calendars/?start_date=2030-05-01&end_date=2030-05-31",
+        "/calendars/teams/{team_id}/calendar?start_date=2030-05-01&end_date=2030-05-31",
+        "/analytics/teams/{team_id}",
+    ])
+    async def test_read_route(self, test_client: AsyncClient, query_counter, populated_team, url):
+        url = url.format(team_id=populated_team["team_id"], task_id=populated_team["task_ids"][0])
+        await self.assert_constant(test_client, query_counter, url)
+
+
+def test_every_route_has_a_budget():
+    """New endpoints must declare their statement budget in tests.query_budget.ROUTE_BUDGETS."""
+    declared = set(ROUTE_BUDGETS)
+    missing = [
+        (method, route.path)
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        for method in route.methods
+        if (method, route.path) not in declared]
+    assert not missing
@@ -0,0 +1,83 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+class TestResponseCache:
+    """Cached reads execute no statements and are refreshed by the writes that change them."""
+
+    async def get_cached(self, test_client: AsyncClient, query_counter, url: str, statements: int = 0) -> dict:
+        """
+        Read `url` twice and check the second response came from the cache,
+        executing at most `statements` (the version lookup of conditional routes).
+        """
+        first = await test_client.get(url)
+        assert first.status_code == 200, first.text
+        with query_counter:
+            second = await test_client.get(url)
+        query_counter.assert_budget(statements)
+        assert second.json() == first.json()
+        return second.json()
+
+    async def test_task_refreshed_by_task_assignee_and_user_writes(
+            self, test_client: AsyncClient, test_session, query_counter, as_team_admin, team_in_db, create_task,
+            member):
+        url = f"/tasks/{create_task.id}"
+        await self.get_cached(test_client, query_counter, url, statements=1)
+
+        await test_client.put(f"/tasks/{team_in_db.id}/{create_task.id}", json={"title": "Renamed"})
+        assert (await self.get_cached(test_client, query_counter, url, statements=1))["title"] == "Renamed"
+
+        await test_client.post(f"/tasks_users/{team_in_db.id}/{create_task.id}/assignees",
+                               json={"users": [{"user_id": member.id}]})
+        # Requests share one session in tests; drop collections loaded before the write.
+        test_session.expire(create_task, ["assignee_associations"])
+        task = await self.get_cached(test_client, query_counter, url, statements=1)
+        assert [a["id"] for a in task["assignees"]] == [member.id]
+
+        await test_client.put("/users/me", json={"email": "renamed@example.com"})
+        assert (await test_client.get(url)).json()["creator_email"] == "renamed@example.com"
+
+    async def test_team_refreshed_by_new_task_and_membership(
+            self, test_client: AsyncClient, test_session, query_counter, as_team_admin, team_in_db, member):
+        url = f"/teams/{team_in_db.id}"
+        assert len((await self.get_cached(test_client, query_counter, url, statements=1))["tasks"]) == 0
+
+        await test_client.post(f"/tasks/{team_in_db.id}/tasks/", json={"title": "New"})
+        test_session.expire(team_in_db, ["tasks"])
+        assert len((await self.get_cached(test_client, query_counter, url, statements=1))["tasks"]) == 1
+
+        await test_client.request("DELETE", f"/teams_users/{team_in_db.id}/users", json={"user_ids": [member.id]})
+        test_session.expire(team_in_db, ["team_users"])
+        assert len((await test_client.get(url)).json()["team_users"]) == 1
+
+    async def test_profile_refreshed_by_team_rename(
+            self, test_client: AsyncClient, query_counter, as_team_admin, team_in_db, member):
+        data = await self.get_cached(test_client, query_counter, "/users/me")
+        assert data["teams"][0]["team_name"] == "Test Team"
+
+        await test_client.put(f"/teams/{team_in_db.id}", json={"name": "Renamed Team"})
+        assert (await test_client.get("/users/me")).json()["teams"][0]["team_name"] == "Renamed Team"
+
+    async def test_comments_refreshed_by_new_comment(
+            self, test_client: AsyncClient, query_counter, as_team_admin, create_task):
+        url = f"/comments/task/{create_task.id}"
+        assert (await self.get_cached(test_client, query_counter, url))["items"] == []
+
+        await test_client.post(f"/comments/{create_task.id}", json={"content": "First"})
+        assert [c["content"] for c in (await test_client.get(url)).json()["items"]] == ["First"]
+
+    async def test_calendars_refreshed_by_participant_meeting(
+            self, test_client: AsyncClient, query_counter, as_team_admin, team_in_db, member):
+        dates = "?start_date=2030-05-01&end_date=2030-05-31"
+        user_url, team_url = f"/calendars/{dates}", f"/calendars/teams/{team_in_db.id}/calendar{dates}"
+        assert await self.get_cached(test_client, query_counter, user_url) == {}
+        assert await self.get_cached(test_client, query_counter, team_url) == {}
+
+        response = await test_client.post("/meetings/", json={
+            "title": "Sync", "start_datetime": "2030-05-01T10:00:00Z", "end_datetime": "2030-05-01T11:00:00Z",
+            "participant_ids": [member.id]})
+        assert response.status_code == 201
+
+        assert list((await test_client.get(user_url)).json()) == ["2030-05-01"]
+        assert list((await test_client.get(team_url)).json()) == ["2030-05-01"]
@@ -1,3 +1,4 @@
+import gc
 import pytest
 from httpx import AsyncClient
 from fastapi import status, HTTPException
@@ -5,6 +6,7 @@ from src.main import app
 from src.schemas.user import UserPayload
 from src.deps.permissions import admin_manager_in_team, is_team_member
 from src.services.auth import get_current_user
+from src.models import TaskAssigneeAssociation
 
 
 @pytest.mark.asyncio
@@ -246,7 +248,7 @@ class TestGetTasksForTeam:
 
         response = await test_client.get(f"/tasks/{team_in_db.id}/tasks")
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = response.json()["items"]
         assert isinstance(data, list)
         if data:
             assert "title" in data[0]
@@ -274,7 +276,7 @@ class TestGetTasksForTeam:
         }
         response = await test_client.get(f"/tasks/{team_in_db.id}/tasks", params=params)
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = response.json()["items"]
         assert isinstance(data, list)
 
         app.dependency_overrides.clear()
@@ -304,7 +306,7 @@ class TestGetMyTasks:
 
         response = await test_client.post("/tasks/my", json={})
         assert response.status_code == status.HTTP_201_CREATED
-        data = response.json()
+        data = response.json()["items"]
         assert isinstance(data, list)
         if data:
             assert "title" in data[0]
@@ -326,7 +328,7 @@ class TestGetMyTasks:
         }
         response = await test_client.post("/tasks/my", json=filters)
         assert response.status_code == status.HTTP_201_CREATED
-        data = response.json()
+        data = response.json()["items"]
         assert isinstance(data, list)
 
         app.dependency_overrides.clear()
@@ -342,3 +344,94 @@ class TestGetMyTasks:
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
         app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+class TestUpdateTaskStatus:
+
+    @staticmethod
+    def executor_payload(user_id: int, team_id: int) -> UserPayload:
+        return UserPayload(id=user_id, role="user", teams=[{"team_id": team_id, "role": "executor"}])
+
+    async def test_assignee_changes_status_in_three_statements(
+            self, test_client: AsyncClient, test_session, query_counter, user_in_db, team_in_db, create_task):
+        """Permission check loads the task once; the update costs only UPDATE + history INSERT."""
+        task_id = create_task.id
+        test_session.add(TaskAssigneeAssociation(task_id=task_id, user_id=user_in_db.id))
+        await test_session.commit()
+        # Only the request may hold the task it loads, as in a fresh session per request.
+        test_session.expunge(create_task)
+        gc.collect()
+        app.dependency_overrides[get_current_user] = lambda: self.executor_payload(user_in_db.id, team_in_db.id)
+
+        with query_counter:
+            response = await test_client.patch(
+                f"/tasks/{team_in_db.id}/{task_id}/status", json={"status": "in_progress"})
+        app.dependency_overrides.clear()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["status"] == "in_progress"
+        query_counter.assert_budget(3)
+
+    async def test_non_assignee_forbidden(self, test_client: AsyncClient, user_in_db, team_in_db, create_task):
+        """An executor who is not assigned to the task cannot change its status."""
+        app.dependency_overrides[get_current_user] = lambda: self.executor_payload(user_in_db.id, team_in_db.id)
+
+        response = await test_client.patch(
+            f"/tasks/{team_in_db.id}/{create_task.id}/status", json={"status": "done"})
+        app.dependency_overrides.clear()
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    async def test_task_from_other_team_not_found(self, test_client: AsyncClient, user_in_db, create_task):
+        """A task is not reachable through a team it does not belong to."""
+        other_team_id = create_task.team_id + 100
+        app.dependency_overrides[get_current_user] = lambda: UserPayload(
+            id=user_in_db.id, role="ADMIN", teams=[{"team_id": other_team_id, "role": "manager"}])
+
+        response = await test_client.patch(
+            f"/tasks/{other_team_id}/{create_task.id}/status", json={"status": "done"})
+        app.dependency_overrides.clear()
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+class TestBulkCreateTasks:
+
+    async def test_bulk_create(self, test_client: AsyncClient, user_in_db, team_in_db):
+        """Bulk endpoint creates all valid tasks and returns them in request order."""
+        async def override_admin_manager_in_team(team_id: int):
+            return UserPayload(id=user_in_db.id, role="admin", teams=[{"team_id": team_id, "role": "manager"}])
+
+        app.dependency_overrides[admin_manager_in_team] = override_admin_manager_in_team
+
+        payload = {"tasks": [{"title": f"Sprint task {i}", "priority": "high"} for i in range(3)]}
+        response = await test_client.post(f"/tasks/{team_in_db.id}/tasks/bulk", json=payload)
+        app.dependency_overrides.clear()
+
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert [t["title"] for t in data["created"]] == ["Sprint task 0", "Sprint task 1", "Sprint task 2"]
+        assert data["errors"] == []
+
+    async def test_conflicting_assignee_roles_reported_per_item(
+            self, test_client: AsyncClient, user_in_db, team_in_db):
+        """An item listing a user with two roles is reported; the rest of the batch is created."""
+        async def override_admin_manager_in_team(team_id: int):
+            return UserPayload(id=user_in_db.id, role="admin", teams=[{"team_id": team_id, "role": "manager"}])
+
+        app.dependency_overrides[admin_manager_in_team] = override_admin_manager_in_team
+
+        payload = {"tasks": [
+            {"title": "Kept"},
+            {"title": "Conflicting", "assignees": [
+                {"user_id": user_in_db.id, "role": "EXECUTOR"}, {"user_id": user_in_db.id, "role": "REVIEWER"}]},
+        ]}
+        response = await test_client.post(f"/tasks/{team_in_db.id}/tasks/bulk", json=payload)
+        app.dependency_overrides.clear()
+
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert [t["title"] for t in data["created"]] == ["Kept"]
+        assert data["errors"] == [f"Task 1: users listed with different roles: {{{user_in_db.id}}}"]
@@ -100,7 +100,7 @@ class TestReadTeamsAllAPI:
         response = await test_client.get("/teams/")
         assert response.status_code == status.HTTP_200_OK
 
-        data = response.json()
+        data = response.json()["items"]
         assert isinstance(data, list)
         assert len(data) >= 2
 
@@ -36,7 +36,7 @@ class TestUserAPI:
 
         response = await test_client.get("/users/")
         assert response.status_code == 200
-        users = response.json()
+        users = response.json()["items"]
         assert isinstance(users, list)
 
         app.dependency_overrides.clear()
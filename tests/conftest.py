@@ -5,6 +5,10 @@ from src.config.db import Base, get_db
 from src.config.settings import settings
 from httpx import AsyncClient, ASGITransport
 from src.main import app
+from src.services.analytics import analytics_cache
+from src.utils.response_cache import response_cache
+
+pytest_plugins = ["tests.query_budget"]
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -15,11 +19,13 @@ def ensure_test_env():
 
 @pytest_asyncio.fixture(scope="function")
 async def test_engine():
-    """Create a fresh test database engine and recreate schema per test."""
+    """Create a fresh test database engine and recreate schema per test, dropping cached analytics and responses."""
     engine = create_async_engine(settings.DB_URL, echo=False)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
+    analytics_cache.clear()
+    response_cache.backend.clear()
     yield engine
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
@@ -35,8 +41,8 @@ async def test_session(test_engine):
 
 
 @pytest_asyncio.fixture(scope="function")
-async def test_client(test_session):
-    """Override get_db dependency and provide an async test client."""
+async def test_client(test_session, query_recorder):
+    """Override get_db dependency and provide an async test client that counts statements per request."""
 
     async def override_get_db():
         yield test_session
@@ -47,8 +53,10 @@ async def test_client(test_session):
 
     async with AsyncClient(
             transport=transport,
-            base_url="http://test"
+            base_url="http://test",
+            event_hooks=query_recorder.event_hooks
     ) as client:
         yield client
 
     app.dependency_overrides.clear()
+
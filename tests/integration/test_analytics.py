@@ -0,0 +1,173 @@
+import pytest
+import pytest_asyncio
+from datetime import date, datetime, timezone
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.models import Task, TaskStatus, TaskStatusHistory, TaskAssigneeAssociation, Evaluation, \
+    EvaluationAssociation
+from src.schemas import EvaluationCreate, TaskCreate
+from src.services.analytics import analytics_period, get_throughput, get_cycle_time, get_assignee_scores, \
+    get_overdue, team_overdue, team_assignee_scores, invalidate_analytics, team_scope
+from src.services.task import tasks_crud
+
+START, END = date(2025, 1, 6), date(2025, 2, 2)
+
+
+def utc(*args) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def team_history(test_session: AsyncSession, create_user, create_team):
+    """
+    A team with two members and tasks completed, evaluated and overdue at fixed times,
+    plus a second team whose rows must never be counted.
+    """
+    manager = await create_user(email="manager@example.com")
+    alice = await create_user(email="alice@example.com", first_name="Alice", last_name="A")
+    bob = await create_user(email="bob@example.com", first_name="Bob", last_name="B")
+    team = await create_team(name="Analytics", creator_id=manager.id)
+    other = await create_team(name="Other", creator_id=manager.id)
+
+    def task(title, created_at, status=TaskStatus.DONE, due_date=None, team_id=team.id):
+        return Task(title=title, status=status, created_at=created_at, due_date=due_date,
+                    creator_id=manager.id, team_id=team_id)
+
+    tasks = {
+        "fast": task("fast", utc(2025, 1, 6)),
+        "slow": task("slow", utc(2025, 1, 6)),
+        "late_start": task("late_start", utc(2025, 1, 10)),
+        "before": task("before", utc(2024, 12, 1)),
+        "overdue_assigned": task("overdue_assigned", utc(2019, 1, 1), TaskStatus.OPEN, utc(2020, 1, 1)),
+        "overdue_unassigned": task("overdue_unassigned", utc(2019, 1, 1), TaskStatus.IN_PROGRESS, utc(2020, 1, 1)),
+        "done_late": task("done_late", utc(2019, 1, 1), TaskStatus.DONE, utc(2020, 1, 1)),
+        "future": task("future", utc(2025, 1, 1), TaskStatus.OPEN, utc(2099, 1, 1)),
+        "other": task("other", utc(2025, 1, 6), team_id=other.id),
+    }
+    test_session.add_all(tasks.values())
+    await test_session.flush()
+
+    done_at = [
+        ("fast", utc(2025, 1, 7)),
+        ("fast", utc(2025, 1, 8)),
+        ("slow", utc(2025, 1, 16)),
+        ("late_start", utc(2025, 1, 11)),
+        ("before", utc(2024, 12, 5)),
+        ("other", utc(2025, 1, 7)),
+    ]
+    test_session.add_all(
+        TaskStatusHistory(task_id=tasks[name].id, changed_by_id=manager.id, new_status=TaskStatus.DONE,
+                          changed_at=changed_at)
+        for name, changed_at in done_at)
+    test_session.add_all(
+        TaskAssigneeAssociation(task_id=tasks["overdue_assigned"].id, user_id=user.id, role="EXECUTOR")
+        for user in (alice, bob))
+
+    evaluations = [
+        ("fast", 4, [alice, bob]),
+        ("slow", 2, [alice]),
+        ("other", 1, [alice, bob]),
+    ]
+    for name, score, recipients in evaluations:
+        evaluation = Evaluation(task_id=tasks[name].id, evaluator_id=manager.id, score=score,
+                                created_at=utc(2025, 1, 20))
+        test_session.add(evaluation)
+        await test_session.flush()
+        test_session.add_all(EvaluationAssociation(evaluation_id=evaluation.id, user_id=user.id) for user in recipients)
+    await test_session.commit()
+
+    return {"team": team, "manager": manager, "alice": alice, "bob": bob, "tasks": tasks}
+
+
+@pytest.mark.asyncio
+class TestTeamAnalyticsMetrics:
+    async def test_throughput_counts_tasks_once_per_week_without_gaps(self, test_session, team_history):
+        weeks = await get_throughput(test_session, team_history["team"].id, START, END)
+
+        assert [(w.week_start, w.completed, w.cumulative) for w in weeks] == [
+            (date(2025, 1, 6), 2, 2),
+            (date(2025, 1, 13), 1, 3),
+            (date(2025, 1, 20), 0, 3),
+            (date(2025, 1, 27), 0, 3),
+        ]
+
+    async def test_cycle_time_percentiles_use_first_completion(self, test_session, team_history):
+        stats = await get_cycle_time(test_session, team_history["team"].id, START, END)
+
+        assert stats.tasks == 3
+        assert stats.p50_hours == pytest.approx(24)
+        assert stats.p75_hours == pytest.approx(132)
+        assert stats.p90_hours == pytest.approx(196.8)
+
+    async def test_cycle_time_of_empty_period(self, test_session, team_history):
+        stats = await get_cycle_time(test_session, team_history["team"].id, date(2030, 1, 1), date(2030, 1, 31))
+
+        assert stats.tasks == 0
+        assert stats.p50_hours is None
+
+    async def test_assignee_scores_are_ranked_within_team(self, test_session, team_history):
+        scores = await get_assignee_scores(test_session, team_history["team"].id, START, END)
+
+        assert [(s.user_id, s.full_name, s.average_score, s.evaluations, s.rank) for s in scores] == [
+            (team_history["bob"].id, "Bob B", 4.0, 1, 1),
+            (team_history["alice"].id, "Alice A", 3.0, 2, 2),
+        ]
+
+    async def test_overdue_totals_and_per_assignee(self, test_session, team_history):
+        overdue = await get_overdue(test_session, team_history["team"].id)
+
+        assert overdue.total == 2
+        assert overdue.unassigned == 1
+        assert {(a.user_id, a.overdue) for a in overdue.by_assignee} == {
+            (team_history["alice"].id, 1), (team_history["bob"].id, 1)}
+
+
+@pytest.mark.asyncio
+class TestTeamAnalyticsCache:
+    async def test_cached_until_scope_is_invalidated(self, test_session, team_history):
+        team_id = team_history["team"].id
+        assert (await team_overdue(test_session, team_id)).total == 2
+
+        test_session.add(Task(title="silent", status=TaskStatus.OPEN, due_date=utc(2020, 1, 1),
+                              creator_id=team_history["manager"].id, team_id=team_id))
+        await test_session.commit()
+        assert (await team_overdue(test_session, team_id)).total == 2
+
+        invalidate_analytics(team_scope(team_id))
+        assert (await team_overdue(test_session, team_id)).total == 3
+
+    async def test_task_write_invalidates_team(self, test_session, team_history):
+        team_id = team_history["team"].id
+        assert (await team_overdue(test_session, team_id)).unassigned == 1
+
+        await tasks_crud.create_task(
+            test_session, TaskCreate(title="new", due_date=utc(2020, 1, 1)), team_history["manager"].id, team_id)
+
+        assert (await team_overdue(test_session, team_id)).unassigned == 2
+
+    async def test_evaluation_write_invalidates_scores(self, test_session, team_history, evaluation_crud):
+        team_id = team_history["team"].id
+        assert len(await team_assignee_scores(test_session, team_id, START, date.today())) == 2
+
+        await evaluation_crud.update_evaluation(
+            test_session, EvaluationCreate(score=1), team_history["tasks"]["slow"].id, team_history["manager"].id)
+
+        scores = await team_assignee_scores(test_session, team_id, START, date.today())
+        assert {s.user_id: s.average_score for s in scores}[team_history["alice"].id] == 2.5
+
+
+class TestAnalyticsPeriod:
+    def test_defaults_to_twelve_weeks(self):
+        start_date, end_date = analytics_period(None, date(2025, 3, 31))
+
+        assert (start_date, end_date) == (date(2025, 1, 7), date(2025, 3, 31))
+
+    def test_rejects_reversed_period(self):
+        with pytest.raises(HTTPException) as exc:
+            analytics_period(date(2025, 2, 1), date(2025, 1, 1))
+        assert exc.value.status_code == 400
+
+    def test_rejects_too_long_period(self):
+        with pytest.raises(HTTPException) as exc:
+            analytics_period(date(2020, 1, 1), date(2025, 1, 1))
+        assert exc.value.status_code == 400
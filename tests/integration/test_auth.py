@@ -72,3 +72,43 @@ class TestAuthDependencies:
 
         with pytest.raises(HTTPException):
             await decode_refresh_token(token)
+
+    async def test_get_current_user_cached_token_skips_decode(self, monkeypatch):
+        """Repeat requests with the same token are served from the verified-token cache."""
+        from src.services import auth
+
+        token = create_access_token({
+            "sub": "7",
+            "role": "user",
+            "teams": [{"team_id": 3, "role": "executor"}],
+        })
+
+        class DummyCreds:
+            credentials = token
+
+        first = await get_current_user(token=DummyCreds())
+        hits_before = auth.token_cache_hits.value
+
+        def fail_decode(*args, **kwargs):
+            raise AssertionError("jwt.decode should not run for a cached token")
+
+        monkeypatch.setattr(auth.jwt, "decode", fail_decode)
+        second = await get_current_user(token=DummyCreds())
+
+        assert second is first
+        assert auth.token_cache_hits.value == hits_before + 1
+
+    async def test_get_current_user_tampered_token_not_served_from_cache(self):
+        """A token that only shares the signature with a cached one is still verified."""
+        token = create_access_token({"sub": "8", "role": "user", "teams": []})
+
+        class ValidCreds:
+            credentials = token
+
+        class TamperedCreds:
+            credentials = "x" + token
+
+        await get_current_user(token=ValidCreds())
+        with pytest.raises(HTTPException) as exc:
+            await get_current_user(token=TamperedCreds())
+        assert exc.value.status_code == 401
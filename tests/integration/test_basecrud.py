@@ -29,8 +29,8 @@ class TestBaseCRUDOperations:
         create_obj = TCreateSchema(name="list test")
         created = await crud.create(test_session, create_obj)
 
-        all_objs = await crud.get_all(test_session)
-        assert any(o.id == created.id for o in all_objs)
+        page = await crud.get_all(test_session)
+        assert any(o.id == created.id for o in page.items)
 
     async def test_update_success(self, test_session: AsyncSession, crud):
         """Test updating an existing object updates fields correctly."""
@@ -74,3 +74,37 @@ class TestBaseCRUDErrors:
         with pytest.raises(HTTPException) as exc_info:
             await crud.delete(test_session, 999999)
         assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+class TestBaseCRUDPagination:
+
+    async def test_pages_cover_all_rows_once(self, test_session: AsyncSession, crud):
+        """Walking next_cursor returns every row exactly once in id order."""
+        created = [await crud.create(test_session, TCreateSchema(name=f"row {i}")) for i in range(5)]
+
+        seen, cursor = [], None
+        while True:
+            page = await crud.get_all(test_session, limit=2, cursor=cursor)
+            assert len(page.items) <= 2
+            seen.extend(o.id for o in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert seen == [o.id for o in created]
+
+    async def test_last_page_has_no_cursor(self, test_session: AsyncSession, crud):
+        """A page that reaches the end of the result set has no next_cursor."""
+        await crud.create(test_session, TCreateSchema(name="only"))
+
+        page = await crud.get_all(test_session, limit=5)
+
+        assert len(page.items) == 1
+        assert page.next_cursor is None
+
+    async def test_invalid_cursor_raises_400(self, test_session: AsyncSession, crud):
+        """A malformed cursor is rejected with HTTP 400."""
+        with pytest.raises(HTTPException) as exc_info:
+            await crud.get_all(test_session, cursor="not-a-cursor")
+        assert exc_info.value.status_code == 400
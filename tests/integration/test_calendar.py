@@ -1,9 +1,14 @@
 import pytest
 from datetime import datetime, timedelta, timezone, date
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.services.calendar import get_user_calendar, get_team_calendar
+from src.services.calendar import get_user_calendar, get_team_calendar, rebuild_calendar, check_calendar
+from src.services.task import tasks_crud
+from src.services.task_user import task_user_crud
+from src.services.meeting import meeting_crud
 from src.models import TeamRole, MeetingParticipantAssociation, Meeting, TeamUserAssociation
 from src.schemas.calendar import CalendarTask, CalendarMeeting
+from src.config.settings import settings
+from src.schemas import TaskCreate, TaskUpdate, TaskUserAdd, TeamUserAdd, MeetingCreate, MeetingUpdate
 
 
 @pytest.mark.asyncio
@@ -38,6 +43,7 @@ class TestUserCalendar:
         start = date.today()
         end = start + timedelta(days=3)
 
+        await rebuild_calendar(test_session)
         calendar = await get_user_calendar(test_session, start, end, user.id)
 
         assert due.date() in calendar
@@ -91,3 +97,162 @@ class TestTeamCalendar:
         assert "Team Sync" in event_titles
         assert any(isinstance(e, CalendarTask) for e in calendar[due.date()])
         assert any(isinstance(e, CalendarMeeting) for e in calendar[due.date()])
+
+
+@pytest.mark.asyncio
+class TestCalendarFanout:
+    async def test_fanout_matches_sequential(
+            self,
+            test_session: AsyncSession,
+            create_user,
+            create_task,
+            create_team,
+            monkeypatch,
+    ):
+        """Fan-out mode runs sub-queries on separate sessions and returns the same calendar."""
+        user = await create_user(email="fanout_user@example.com")
+        team = await create_team(creator_id=user.id)
+
+        due = datetime.now(timezone.utc).replace(hour=11, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        await create_task(creator_id=user.id, team_id=team.id, due_date=due)
+
+        meeting = Meeting(
+            title="Planning",
+            start_datetime=due.replace(hour=12),
+            end_datetime=due.replace(hour=13),
+            creator_id=user.id
+        )
+        test_session.add(meeting)
+        await test_session.flush()
+        test_session.add(MeetingParticipantAssociation(meeting_id=meeting.id, user_id=user.id))
+        await test_session.commit()
+
+        start = date.today()
+        end = start + timedelta(days=3)
+        await rebuild_calendar(test_session)
+
+        monkeypatch.setattr(settings, "CALENDAR_FANOUT", False)
+        sequential = await get_user_calendar(test_session, start, end, user.id)
+        sequential_team = await get_team_calendar(test_session, team.id, start, end)
+
+        monkeypatch.setattr(settings, "CALENDAR_FANOUT", True)
+        fanout = await get_user_calendar(test_session, start, end, user.id)
+        fanout_team = await get_team_calendar(test_session, team.id, start, end)
+
+        assert fanout == sequential
+        assert fanout_team == sequential_team
+        assert {e.title for e in fanout[due.date()]} == {"Test task", "Planning"}
+
+
+@pytest.mark.asyncio
+class TestMaterializedCalendar:
+    async def test_task_write_paths_keep_calendar_in_sync(
+            self,
+            test_session: AsyncSession,
+            create_user,
+            create_team,
+    ):
+        """Creating, moving and reassigning a task updates the affected users' calendars."""
+        creator = await create_user(email="mat_creator@example.com")
+        executor = await create_user(email="mat_executor@example.com")
+        team = await create_team(creator_id=creator.id, users=[
+            TeamUserAdd(user_id=executor.id, role=TeamRole.EXECUTOR.value)])
+
+        due = datetime(2030, 5, 10, 12, tzinfo=timezone.utc)
+        task = await tasks_crud.create_task(
+            test_session,
+            TaskCreate(title="Report", due_date=due, assignees=[TaskUserAdd(user_id=executor.id)]),
+            creator_id=creator.id, team_id=team.id)
+        window = (date(2030, 5, 1), date(2030, 5, 31))
+
+        creator_calendar = await get_user_calendar(test_session, *window, creator.id)
+        executor_calendar = await get_user_calendar(test_session, *window, executor.id)
+        assert [e.id for e in creator_calendar[due.date()]] == [task.id]
+        assert [e.id for e in executor_calendar[due.date()]] == [task.id]
+
+        moved = due + timedelta(days=5)
+        await tasks_crud.update_task(
+            test_session, task.id, TaskUpdate(title="Final report", due_date=moved), creator_id=creator.id)
+        executor_calendar = await get_user_calendar(test_session, *window, executor.id)
+        assert list(executor_calendar) == [moved.date()]
+        assert executor_calendar[moved.date()][0].title == "Final report"
+
+        await task_user_crud.remove_executors(test_session, task.id, [executor.id])
+        assert await get_user_calendar(test_session, *window, executor.id) == {}
+
+        await task_user_crud.add_executors(test_session, task.id, [TaskUserAdd(user_id=executor.id)])
+        assert list(await get_user_calendar(test_session, *window, executor.id)) == [moved.date()]
+
+        assert (await check_calendar(test_session)).consistent
+
+    async def test_meeting_write_paths_keep_calendar_in_sync(
+            self,
+            test_session: AsyncSession,
+            create_user,
+    ):
+        """Meeting creation and participant changes are reflected in the calendar."""
+        creator = await create_user(email="meet_creator@example.com")
+        guest = await create_user(email="meet_guest@example.com")
+        start = datetime(2030, 6, 3, 9, tzinfo=timezone.utc)
+
+        meeting = await meeting_crud.create_meet(
+            test_session,
+            MeetingCreate(start_datetime=start, end_datetime=start + timedelta(hours=1), participant_ids=[guest.id]),
+            creator_id=creator.id)
+        window = (date(2030, 6, 1), date(2030, 6, 30))
+
+        guest_calendar = await get_user_calendar(test_session, *window, guest.id)
+        assert guest_calendar[start.date()][0].id == meeting.id
+        assert guest_calendar[start.date()][0].title == "Untitled"
+
+        await meeting_crud.update_meet(
+            test_session, meeting.id, MeetingUpdate(remove_participant_ids=[guest.id]), creator.id)
+        assert await get_user_calendar(test_session, *window, guest.id) == {}
+        assert start.date() in await get_user_calendar(test_session, *window, creator.id)
+
+        assert (await check_calendar(test_session)).consistent
+
+    async def test_check_detects_drift_and_rebuild_repairs(
+            self,
+            test_session: AsyncSession,
+            create_user,
+            create_task,
+    ):
+        """Rows written outside the service layer show up as missing until a rebuild."""
+        user = await create_user(email="drift_user@example.com")
+        await create_task(creator_id=user.id, due_date=datetime(2030, 7, 1, 8, tzinfo=timezone.utc))
+
+        result = await check_calendar(test_session)
+        assert len(result.missing) == 1
+        assert result.stale == []
+
+        assert await rebuild_calendar(test_session) == 1
+        assert (await check_calendar(test_session)).consistent
+
+
+@pytest.mark.asyncio
+class TestLeanTeamCalendar:
+    async def test_two_column_queries_grouped_by_day(
+            self,
+            test_session: AsyncSession,
+            query_counter,
+            create_user,
+            create_task,
+            create_team,
+    ):
+        """Team calendar issues one query per event type, with days ordered and the end day inclusive."""
+        creator = await create_user(email="lean_creator@example.com")
+        team = await create_team(creator_id=creator.id)
+        late_on_last_day = datetime(2030, 12, 31, 23, 30, tzinfo=timezone.utc)
+        early = datetime(2030, 1, 2, 8, tzinfo=timezone.utc)
+        await create_task(title="Late", creator_id=creator.id, team_id=team.id, due_date=late_on_last_day)
+        await create_task(title="Early", creator_id=creator.id, team_id=team.id, due_date=early)
+        await create_task(title="Next year", creator_id=creator.id, team_id=team.id,
+                          due_date=datetime(2031, 1, 1, 0, 30, tzinfo=timezone.utc))
+
+        with query_counter:
+            calendar = await get_team_calendar(test_session, team.id, date(2030, 1, 1), date(2030, 12, 31))
+
+        assert list(calendar) == [early.date(), late_on_last_day.date()]
+        assert [e.title for e in calendar[late_on_last_day.date()]] == ["Late"]
+        assert len(query_counter.statements) == 2
@@ -70,8 +70,24 @@ class TestCommentCRUD:
             test_session, task.id, CommentBase(content="Second"), user.id
         )
 
-        comments = await comment_crud.get_comments_by_task(test_session, task.id)
+        comments = (await comment_crud.get_comments_by_task(test_session, task.id)).items
 
         assert len(comments) == 2
         assert comments[0].content == "Second"
         assert comments[1].content == "First"
+
+    async def test_get_comments_by_task_paginated(self, test_session: AsyncSession, create_user, create_task):
+        """Comments are split into pages by a (created_at, id) cursor, newest first."""
+        user = await create_user(email="commenter3@example.com")
+        task = await create_task(creator_id=user.id)
+
+        for content in ("First", "Second", "Third"):
+            await comment_crud.create_comment(test_session, task.id, CommentBase(content=content), user.id)
+
+        first_page = await comment_crud.get_comments_by_task(test_session, task.id, limit=2)
+        second_page = await comment_crud.get_comments_by_task(
+            test_session, task.id, limit=2, cursor=first_page.next_cursor)
+
+        assert [c.content for c in first_page.items] == ["Third", "Second"]
+        assert [c.content for c in second_page.items] == ["First"]
+        assert second_page.next_cursor is None
@@ -1,8 +1,12 @@
 import pytest
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta, timezone
 from fastapi import HTTPException
-from src.models import EvaluationAssociation
-from src.schemas import EvaluationCreate
+from src.config.settings import settings
+from src.models import EvaluationAssociation, EvaluationScoreDaily
+from src.schemas import EvaluationCreate, TaskUserAdd
+from src.services.evaluation import rebuild_score_rollup
+from src.services.task import tasks_crud
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -100,15 +104,48 @@ class TestEvaluationCRUDRead:
         test_session.add(assoc)
         await test_session.commit()
 
-        results = await evaluation_crud.get_evaluations_for_user(test_session, assignee.id)
+        results = (await evaluation_crud.get_evaluations_for_user(test_session, assignee.id)).items
 
         assert any(e.score == 4 for e in results)
 
+    async def test_get_evaluations_for_user_paginated_with_filters(
+        self, test_session: AsyncSession, create_user, create_team, create_task, create_evaluation, evaluation_crud,
+        query_counter
+    ):
+        """Each page is one statement, carries the evaluator name and honours score and date filters."""
+        evaluator = await create_user(email="eval_pages@example.com", first_name="Ann", last_name="Lee")
+        assignee = await create_user(email="assignee_pages@example.com")
+        team = await create_team(creator_id=evaluator.id)
+        for score in (1, 3, 4, 5):
+            task = await create_task(creator_id=evaluator.id, team_id=team.id)
+            evaluation = await create_evaluation(task.id, evaluator.id, score=score)
+            test_session.add(EvaluationAssociation(evaluation_id=evaluation.id, user_id=assignee.id))
+        await test_session.commit()
+
+        with query_counter:
+            first = await evaluation_crud.get_evaluations_for_user(test_session, assignee.id, limit=2, min_score=3)
+        assert len(query_counter) == 1
+        second = await evaluation_crud.get_evaluations_for_user(
+            test_session, assignee.id, limit=2, cursor=first.next_cursor, min_score=3)
+
+        scores = [e.score for e in first.items + second.items]
+        assert sorted(scores) == [3, 4, 5]
+        assert second.next_cursor is None
+        assert {e.evaluator_full_name for e in first.items} == {"Ann Lee"}
+
+        today = datetime.now(timezone.utc).date()
+        page = await evaluation_crud.get_evaluations_for_user(
+            test_session, assignee.id, start_date=today, end_date=today, max_score=3)
+        assert sorted(e.score for e in page.items) == [1, 3]
+        page = await evaluation_crud.get_evaluations_for_user(
+            test_session, assignee.id, start_date=today + timedelta(days=1))
+        assert page.items == []
+
     async def test_get_evaluations_for_user_no_evals(self, test_session: AsyncSession, create_user, evaluation_crud):
         """Returns empty list if no evaluations for user."""
         user = await create_user(email="user_no_evals@example.com")
 
-        results = await evaluation_crud.get_evaluations_for_user(test_session, user.id)
+        results = (await evaluation_crud.get_evaluations_for_user(test_session, user.id)).items
 
         assert results == []
 
@@ -160,4 +197,58 @@ class TestEvaluationCRUDRead:
 
         results = await evaluation_crud.get_evaluations_for_task(test_session, task.id)
 
-        assert any("John Doe" == e.evaluator_full_name for e in results)
\ No newline at end of file
+        assert any("John Doe" == e.evaluator_full_name for e in results)
+
+
+@pytest.mark.asyncio
+class TestEvaluationScoreRollup:
+    async def evaluate_tasks(self, test_session, create_user, create_team, create_task, evaluation_crud, scores):
+        """Create one task per score, assigned to the same user, and evaluate each by the task creator."""
+        assignee = await create_user(email="rollup_assignee@example.com")
+        creator = await create_user(email="rollup_creator@example.com")
+        team = await create_team(creator_id=creator.id)
+        tasks = []
+        for score in scores:
+            task = await create_task(
+                creator_id=creator.id, team_id=team.id, assignees=[TaskUserAdd(user_id=assignee.id)])
+            await evaluation_crud.create_evaluation(test_session, EvaluationCreate(score=score), task.id, creator.id)
+            tasks.append(task)
+        return assignee, creator, tasks
+
+    @pytest.mark.parametrize("use_rollup", [True, False])
+    async def test_average_matches_in_both_modes(
+        self, test_session: AsyncSession, create_user, create_team, create_task, evaluation_crud, monkeypatch,
+        use_rollup
+    ):
+        """The rollup and the joined aggregate give the same average, bounded by inclusive days."""
+        monkeypatch.setattr(settings, "EVALUATION_SCORE_ROLLUP", use_rollup)
+        assignee, _, _ = await self.evaluate_tasks(
+            test_session, create_user, create_team, create_task, evaluation_crud, [3, 5, 4])
+        today = datetime.now(timezone.utc).date()
+
+        assert await evaluation_crud.get_avg_score_user(test_session, assignee.id, today, today) == pytest.approx(4.0)
+        assert await evaluation_crud.get_avg_score_user(
+            test_session, assignee.id, today + timedelta(days=1), today + timedelta(days=7)) is None
+
+    async def test_rollup_follows_updates_and_deletes(
+        self, test_session: AsyncSession, create_user, create_team, create_task, evaluation_crud
+    ):
+        """Score changes and task deletion are applied to the rollup, which stays equal to a rebuild."""
+        assignee, creator, tasks = await self.evaluate_tasks(
+            test_session, create_user, create_team, create_task, evaluation_crud, [2, 4])
+        today = datetime.now(timezone.utc).date()
+
+        await evaluation_crud.update_evaluation(test_session, EvaluationCreate(score=5), tasks[0].id, creator.id)
+        assert await evaluation_crud.get_avg_score_user(test_session, assignee.id, today, today) == pytest.approx(4.5)
+
+        await tasks_crud.delete(test_session, tasks[1].id)
+        assert await evaluation_crud.get_avg_score_user(test_session, assignee.id, today, today) == pytest.approx(5.0)
+
+        maintained = (await test_session.execute(
+            select(EvaluationScoreDaily.user_id, EvaluationScoreDaily.day,
+                   EvaluationScoreDaily.score_sum, EvaluationScoreDaily.score_count))).all()
+        await rebuild_score_rollup(test_session)
+        rebuilt = (await test_session.execute(
+            select(EvaluationScoreDaily.user_id, EvaluationScoreDaily.day,
+                   EvaluationScoreDaily.score_sum, EvaluationScoreDaily.score_count))).all()
+        assert maintained == rebuilt == [(assignee.id, today, 5, 1)]
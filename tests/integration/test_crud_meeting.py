@@ -90,6 +90,22 @@ class TestMeetingCRUDCreate:
         assert exc_info.value.status_code == 400
         assert "already have meetings" in exc_info.value.detail
 
+    async def test_create_meet_back_to_back_allowed(self, test_session: AsyncSession, create_user, meetings_crud):
+        """A meeting starting exactly when another ends is not a conflict."""
+        creator = await create_user(email="creator_b2b@example.com")
+        participant = await create_user(email="participant_b2b@example.com")
+
+        start = datetime.now(timezone.utc) + timedelta(days=1)
+        end = start + timedelta(hours=1)
+
+        await meetings_crud.create_meet(test_session, MeetingCreate(
+            title="First", start_datetime=start, end_datetime=end, participant_ids=[participant.id]), creator.id)
+        second = await meetings_crud.create_meet(test_session, MeetingCreate(
+            title="Second", start_datetime=end, end_datetime=end + timedelta(hours=1),
+            participant_ids=[participant.id]), creator.id)
+
+        assert second.title == "Second"
+
 
 @pytest.mark.asyncio
 class TestMeetingCRUDUpdate:
@@ -245,7 +261,7 @@ class TestMeetingCRUDGetUserMeetings:
     async def test_get_user_meetings_empty(self, test_session: AsyncSession, create_user, meetings_crud):
         """User has no meetings."""
         user = await create_user(email="user_without_meetings@example.com")
-        meetings = await meetings_crud.get_user_meetings(test_session, user.id)
+        meetings = (await meetings_crud.get_user_meetings(test_session, user.id)).items
         assert meetings == []
 
     async def test_get_user_meetings_multiple(self, test_session: AsyncSession, create_user, meetings_crud):
@@ -278,8 +294,50 @@ class TestMeetingCRUDGetUserMeetings:
         await meetings_crud.create_meet(test_session, meet_in_1, creator.id)
         await meetings_crud.create_meet(test_session, meet_in_2, creator.id)
 
-        meetings = await meetings_crud.get_user_meetings(test_session, user.id)
+        meetings = (await meetings_crud.get_user_meetings(test_session, user.id)).items
         assert len(meetings) >= 2
         titles = {m.title for m in meetings}
         assert "Meeting One" in titles
         assert "Meeting Two" in titles
+
+
+@pytest.mark.asyncio
+class TestMeetingAvailability:
+
+    async def test_availability_merges_participants_busy_time(
+            self, test_session: AsyncSession, create_user, meetings_crud):
+        """Busy time of all participants is merged; cancelled meetings and other users are ignored."""
+        alice = await create_user(email="alice_av@example.com")
+        bob = await create_user(email="bob_av@example.com")
+        carol = await create_user(email="carol_av@example.com")
+        day = datetime(2030, 3, 4, tzinfo=timezone.utc)
+
+        await meetings_crud.create_meet(test_session, MeetingCreate(
+            start_datetime=day.replace(hour=9), end_datetime=day.replace(hour=10)), alice.id)
+        await meetings_crud.create_meet(test_session, MeetingCreate(
+            start_datetime=day.replace(hour=9, minute=30), end_datetime=day.replace(hour=11)), bob.id)
+        await meetings_crud.create_meet(test_session, MeetingCreate(
+            start_datetime=day.replace(hour=12), end_datetime=day.replace(hour=13)), carol.id)
+        cancelled = await meetings_crud.create_meet(test_session, MeetingCreate(
+            start_datetime=day.replace(hour=14), end_datetime=day.replace(hour=15)), bob.id)
+        await meetings_crud.update_meet(
+            test_session, cancelled.id, MeetingUpdate(status=MeetingStatus.CANCELLED), bob.id)
+
+        availability = await meetings_crud.get_availability(
+            test_session, [alice.id, bob.id], day.replace(hour=8), day.replace(hour=18),
+            timedelta(hours=1), limit=5)
+
+        assert [(i.start, i.end) for i in availability.busy] == [(day.replace(hour=9), day.replace(hour=11))]
+        assert [(i.start, i.end) for i in availability.free_slots] == [
+            (day.replace(hour=8), day.replace(hour=9)),
+            (day.replace(hour=11), day.replace(hour=18)),
+        ]
+
+    async def test_availability_rejects_inverted_window(self, test_session: AsyncSession, meetings_crud):
+        """The window end must come after its start."""
+        start = datetime(2030, 3, 4, 10, tzinfo=timezone.utc)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await meetings_crud.get_availability(test_session, [1], start, start, timedelta(minutes=30), 5)
+
+        assert exc_info.value.status_code == 400
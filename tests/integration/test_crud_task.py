@@ -1,9 +1,12 @@
 import pytest
+from datetime import date, datetime, timezone
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from fastapi import HTTPException
-from src.models import TaskPriority, TaskStatus, TaskAssigneeAssociation, TeamUserAssociation, TeamRole
-from src.schemas import TaskCreate, TaskUpdate
+from src.models import Task, TaskPriority, TaskStatus, TaskAssigneeAssociation, TeamUserAssociation, TeamRole, \
+    CalendarEntry
+from src.schemas import TaskCreate, TaskUpdate, TaskUserAdd, TaskBulkItem
 from src.services.task import tasks_crud
 
 
@@ -106,6 +109,29 @@ class TestTaskCRUDReadUpdate:
         assert task_read.creator_email == creator.email
         assert isinstance(task_read.assignees, list)
 
+    async def test_get_task_by_id_matches_orm_graph(
+            self, test_session: AsyncSession, create_user, create_team, create_task):
+        """The projection builds the same TaskRead as the task loaded with its creator and assignee users."""
+        creator = await create_user(email="creator5@example.com")
+        team = await create_team(name="TaskTeam5", creator_id=creator.id)
+        members = [await create_user(email=f"assignee{i}@example.com") for i in range(3)]
+        task = await create_task(team_id=team.id, creator_id=creator.id)
+        test_session.add_all(
+            TaskAssigneeAssociation(task_id=task.id, user_id=member.id, role=role,
+                                    assigned_at=datetime(2025, 1, 1, 10, i, tzinfo=timezone.utc))
+            for i, (member, role) in enumerate(zip(members, ["EXECUTOR", None, "REVIEWER"])))
+        await test_session.commit()
+
+        task_read, dependencies = await tasks_crud.get_task_with_dependencies(test_session, task.id)
+
+        loaded = (await test_session.execute(
+            select(Task).where(Task.id == task.id).execution_options(populate_existing=True).options(
+                selectinload(Task.creator),
+                selectinload(Task.assignee_associations).selectinload(TaskAssigneeAssociation.user)))).scalar_one()
+        assert task_read == tasks_crud.to_task_read(loaded)
+        assert [a.id for a in task_read.assignees] == [m.id for m in members]
+        assert sorted(dependencies) == sorted(tasks_crud.read_dependencies(loaded))
+
     async def test_update_task_success(self, test_session: AsyncSession, create_user, create_task):
         """Successfully update task title and description."""
         creator = await create_user(email="creator5@example.com")
@@ -147,7 +173,7 @@ class TestTaskCRUDQueries:
         creator = await create_user(email="creator7@example.com")
         task = await create_task(creator_id=creator.id)
 
-        tasks = await tasks_crud.get_user_related_tasks(test_session, creator.id)
+        tasks = (await tasks_crud.get_user_related_tasks(test_session, creator.id)).items
 
         assert any(t.id == task.id for t in tasks)
 
@@ -157,6 +183,64 @@ class TestTaskCRUDQueries:
         team = await create_team(name="TeamTasks", creator_id=creator.id)
         task = await create_task(team_id=team.id, creator_id=creator.id)
 
-        tasks = await tasks_crud.get_team_tasks(test_session, team.id)
+        tasks = (await tasks_crud.get_team_tasks(test_session, team.id)).items
 
         assert any(t.id == task.id for t in tasks)
+
+
+@pytest.mark.asyncio
+class TestTaskCRUDBulkCreate:
+    async def test_bulk_create_chunks_and_reports_invalid_items(self, test_session: AsyncSession, create_user, create_team):
+        """Valid items are inserted across chunks with their assignees; items with non-members are reported."""
+        creator = await create_user(email="bulk_creator@example.com")
+        team = await create_team(name="BulkTeam", creator_id=creator.id)
+        member = await create_user(email="bulk_member@example.com")
+        outsider = await create_user(email="bulk_outsider@example.com")
+        test_session.add(TeamUserAssociation(user_id=member.id, team_id=team.id, role=TeamRole.EXECUTOR))
+        await test_session.commit()
+
+        due = datetime(2030, 9, 1, 10, tzinfo=timezone.utc)
+        tasks_in = [
+            TaskCreate(title=f"Imported {i}", due_date=due, assignees=[TaskUserAdd(user_id=member.id)])
+            for i in range(5)
+        ]
+        tasks_in.insert(2, TaskCreate(title="Bad", assignees=[TaskUserAdd(user_id=outsider.id)]))
+
+        result = await tasks_crud.bulk_create_tasks(
+            test_session, tasks_in, creator_id=creator.id, team_id=team.id, chunk_size=2)
+
+        assert [t.title for t in result.created] == [f"Imported {i}" for i in range(5)]
+        assert len(result.errors) == 1
+        assert result.errors[0].startswith("Task 2:")
+
+        created_ids = [t.id for t in result.created]
+        assignees = await test_session.scalars(
+            select(TaskAssigneeAssociation.task_id).where(TaskAssigneeAssociation.user_id == member.id))
+        assert sorted(assignees.all()) == sorted(created_ids)
+
+        entries = await test_session.scalars(
+            select(CalendarEntry.task_id).where(CalendarEntry.user_id == member.id, CalendarEntry.day == date(2030, 9, 1)))
+        assert sorted(entries.all()) == sorted(created_ids)
+
+    async def test_bulk_create_reports_conflicting_assignee_roles(
+            self, test_session: AsyncSession, create_user, create_team):
+        """A user listed twice is assigned once; listed with different roles, the item is reported instead."""
+        creator = await create_user(email="bulk_roles_creator@example.com")
+        team = await create_team(name="BulkRolesTeam", creator_id=creator.id)
+        member = await create_user(email="bulk_roles_member@example.com")
+        test_session.add(TeamUserAssociation(user_id=member.id, team_id=team.id, role=TeamRole.EXECUTOR))
+        await test_session.commit()
+
+        tasks_in = [
+            TaskBulkItem(title="Repeated", assignees=[TaskUserAdd(user_id=member.id), TaskUserAdd(user_id=member.id)]),
+            TaskBulkItem(title="Conflicting", assignees=[
+                TaskUserAdd(user_id=member.id, role="EXECUTOR"), TaskUserAdd(user_id=member.id, role="REVIEWER")]),
+        ]
+
+        result = await tasks_crud.bulk_create_tasks(test_session, tasks_in, creator_id=creator.id, team_id=team.id)
+
+        assert [t.title for t in result.created] == ["Repeated"]
+        assert result.errors == [f"Task 1: users listed with different roles: {{{member.id}}}"]
+        assignees = await test_session.scalars(
+            select(TaskAssigneeAssociation.task_id).where(TaskAssigneeAssociation.user_id == member.id))
+        assert assignees.all() == [result.created[0].id]
@@ -170,7 +170,7 @@ class TestUserCRUDGetTeamUsers:
         team_in = TeamCreate(name="Empty Team", description="No users")
         team = await teams_crud.create_team(test_session, team_in=team_in, creator_id=None)
 
-        users = await users_crud.get_team_users(test_session, team.id)
+        users = (await users_crud.get_team_users(test_session, team.id)).items
         assert users == []
 
     async def test_team_has_multiple_users(self, test_session: AsyncSession, create_user, create_team, users_crud):
@@ -187,7 +187,7 @@ class TestUserCRUDGetTeamUsers:
         test_session.add_all([association1, association2])
         await test_session.commit()
 
-        users = await users_crud.get_team_users(test_session, team.id)
+        users = (await users_crud.get_team_users(test_session, team.id)).items
 
         emails = {user.email for user in users}
         assert "member1@example.com" in emails
@@ -196,5 +196,5 @@ class TestUserCRUDGetTeamUsers:
 
     async def test_nonexistent_team_returns_empty(self, test_session: AsyncSession, users_crud):
         """Test get_team_users returns empty list for non-existent team."""
-        users = await users_crud.get_team_users(test_session, 999999)
+        users = (await users_crud.get_team_users(test_session, 999999)).items
         assert users == []
@@ -0,0 +1,18 @@
+import pytest
+from src.schemas import TaskExportRow
+from src.services.export import stream_batches, team_tasks_query
+
+
+@pytest.mark.asyncio
+class TestStreamBatches:
+    async def test_rows_arrive_in_cursor_batches(self, test_session, create_user, create_team, create_task):
+        creator = await create_user(email="exporter@example.com")
+        team = await create_team(name="Export Team", creator_id=creator.id)
+        tasks = [await create_task(title=f"Task {i}", creator_id=creator.id, team_id=team.id) for i in range(5)]
+
+        batches = [batch async for batch in stream_batches(
+            test_session.bind, team_tasks_query(team.id), TaskExportRow, batch_size=2)]
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [row.id for batch in batches for row in batch] == [task.id for task in tasks]
+        assert all(isinstance(row, TaskExportRow) for batch in batches for row in batch)
@@ -0,0 +1,69 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+HOT_QUERIES = [
+    (
+        "SELECT id FROM tasks WHERE team_id = 1 AND status IN ('OPEN', 'IN_PROGRESS') "
+        "ORDER BY created_at DESC, id DESC LIMIT 51",
+        "ix_tasks_team_active_created",
+    ),
+    (
+        "SELECT id FROM tasks WHERE team_id = 1 AND status = 'DONE' AND priority = 'HIGH'",
+        "ix_tasks_team_status_priority",
+    ),
+    (
+        "SELECT id FROM tasks WHERE team_id = 1 "
+        "AND due_date BETWEEN '2025-01-01' AND '2025-01-31'",
+        "ix_tasks_team_due_date",
+    ),
+    (
+        "SELECT id FROM tasks WHERE creator_id = 1",
+        "ix_tasks_creator_id",
+    ),
+    (
+        "SELECT id FROM tasks WHERE due_date BETWEEN '2025-01-01' AND '2025-01-31'",
+        "ix_tasks_due_date",
+    ),
+    (
+        "SELECT id FROM meetings WHERE start_datetime < '2025-01-31' AND end_datetime > '2025-01-01'",
+        "ix_meetings_start_end",
+    ),
+    (
+        "SELECT id FROM meetings WHERE during && tstzrange('2025-01-01', '2025-01-02', '[)')",
+        "ix_meetings_during",
+    ),
+    (
+        "SELECT meeting_id FROM meeting_participant_association WHERE user_id = 1",
+        "ix_meeting_participant_association_user_id",
+    ),
+    (
+        "SELECT id FROM comments WHERE task_id = 1 ORDER BY created_at DESC LIMIT 51",
+        "ix_comments_task_created",
+    ),
+    (
+        "SELECT id FROM task_status_history WHERE task_id = 1 ORDER BY changed_at",
+        "ix_task_status_history_task_changed",
+    ),
+    (
+        "SELECT evaluation_id FROM evaluation_recipients WHERE user_id = 1",
+        "ix_evaluation_recipients_user_id",
+    ),
+    (
+        "SELECT id FROM evaluations WHERE created_at >= '2025-01-01'",
+        "ix_evaluations_created_at",
+    ),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query,index_name", HOT_QUERIES)
+async def test_hot_query_uses_index(test_session: AsyncSession, query: str, index_name: str):
+    """Each hot access path is served by its dedicated index, not a sequential scan."""
+    await test_session.execute(text("SET LOCAL enable_seqscan = off"))
+    result = await test_session.execute(text(f"EXPLAIN {query}"))
+    plan = "\n".join(row[0] for row in result)
+
+    assert index_name in plan, plan
+    assert "Seq Scan" not in plan, plan
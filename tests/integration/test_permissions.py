@@ -0,0 +1,68 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from src.deps.permissions import get_resource_ownership
+from src.models import Task, User
+
+
+@pytest.mark.asyncio
+class TestResourceOwnership:
+
+    async def test_single_query_and_request_cache(
+            self, test_session: AsyncSession, query_counter, create_user, create_task):
+        """Creator and superuser flag come from one statement; a repeat lookup is served from the session."""
+        creator = await create_user(email="owner@example.com")
+        task = await create_task(creator_id=creator.id)
+
+        with query_counter:
+            first = await get_resource_ownership(test_session, Task, task.id, creator.id)
+            second = await get_resource_ownership(test_session, Task, task.id, creator.id)
+
+        assert first == second
+        assert first.creator_id == creator.id
+        assert first.is_superuser is False
+        assert first.resource is None
+        assert len(query_counter.statements) == 1
+        assert "tasks.title" not in query_counter.statements[0]
+
+    async def test_loaded_resource_cached_per_options(
+            self, test_session: AsyncSession, query_counter, create_user, create_task):
+        """A guard that reuses the resource loads it; guards with other loader options do not share the entry."""
+        creator = await create_user(email="loader@example.com")
+        task_id = (await create_task(creator_id=creator.id)).id
+        assignees = [selectinload(Task.assignee_associations)]
+
+        with query_counter:
+            projected = await get_resource_ownership(test_session, Task, task_id, creator.id)
+            loaded = await get_resource_ownership(test_session, Task, task_id, creator.id, load_resource=True)
+            eager = await get_resource_ownership(test_session, Task, task_id, creator.id, options=assignees)
+            again = await get_resource_ownership(test_session, Task, task_id, creator.id, options=assignees)
+
+        assert projected.resource is None
+        assert loaded.resource.id == task_id
+        assert "assignee_associations" in eager.resource.__dict__
+        assert again is eager
+        assert len(query_counter.statements) == 4
+
+    async def test_cache_cleared_after_commit(self, test_session: AsyncSession, create_user, create_task):
+        """A committed change is visible to the next ownership lookup."""
+        user = await create_user(email="promoted@example.com")
+        task = await create_task(creator_id=user.id)
+
+        before = await get_resource_ownership(test_session, Task, task.id, user.id)
+        await test_session.execute(update(User).where(User.id == user.id).values(is_superuser=True))
+        await test_session.commit()
+        after = await get_resource_ownership(test_session, Task, task.id, user.id)
+
+        assert before.is_superuser is False
+        assert after.is_superuser is True
+
+    async def test_missing_resource_raises_404(self, test_session: AsyncSession, create_user):
+        """Unknown resource IDs are reported as not found."""
+        user = await create_user(email="nobody@example.com")
+
+        with pytest.raises(HTTPException) as exc:
+            await get_resource_ownership(test_session, Task, 999999, user.id)
+        assert exc.value.status_code == 404
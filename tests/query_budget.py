@@ -0,0 +1,228 @@
+"""
+Pytest plugin counting the SQL statements executed for every request sent through `test_client`.
+
+Each route declares the most statements one request may execute in `ROUTE_BUDGETS`; a request
+over its budget fails the test that sent it. Statement shapes executed `N_PLUS_ONE_THRESHOLD`
+or more times within one request are reported as N+1 suspects in the terminal summary, and fail
+the test as well when pytest runs with `--fail-on-n-plus-one`.
+"""
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+import pytest
+from sqlalchemy import event
+from starlette.routing import Match
+
+N_PLUS_ONE_THRESHOLD = 3
+
+ROUTE_BUDGETS: dict[tuple[str, str], int] = {
+    ("POST", "/auth/login"): 2,
+    ("POST", "/auth/refresh"): 0,
+    ("GET", "/users/"): 1,
+    ("GET", "/users/me"): 4,
+    ("PUT", "/users/me"): 3,
+    ("GET", "/users/{user_id}"): 4,
+    ("POST", "/users/"): 2,
+    ("DELETE", "/users/{user_id}"): 0,
+    ("PUT", "/users/{user_id}/set_role"): 2,
+    ("GET", "/users/teams/{team_id}/users"): 1,
+    ("POST", "/teams/"): 3,
+    ("GET", "/teams/my_teams"): 1,
+    ("GET", "/teams/{team_id}"): 10,
+    ("GET", "/teams/"): 1,
+    ("PUT", "/teams/{team_id}"): 2,
+    ("DELETE", "/teams/{team_id}"): 16,
+    ("POST", "/tasks/{team_id}/tasks/"): 5,
+    ("POST", "/tasks/{team_id}/tasks/bulk"): 6,
+    ("GET", "/tasks/"): 0,
+    ("GET", "/tasks/{task_id}"): 3,
+    ("PUT", "/tasks/{team_id}/{task_id}"): 4,
+    ("DELETE", "/tasks/{team_id}/{task_id}"): 13,
+    ("PATCH", "/tasks/{team_id}/{task_id}/status"): 3,
+    ("POST", "/tasks/my"): 3,
+    ("GET", "/tasks/{team_id}/tasks"): 1,
+    ("POST", "/comments/{task_id}"): 3,
+    ("PUT", "/comments/{comment_id}"): 3,
+    ("DELETE", "/comments/{comment_id}"): 2,
+    ("GET", "/comments/task/{task_id}"): 3,
+    ("POST", "/evaluations/tasks/{task_id}/evaluations"): 6,
+    ("PUT", "/evaluations/{task_id}"): 4,
+    ("GET", "/evaluations/my_evaluations"): 1,
+    ("GET", "/evaluations/my_average_score"): 1,
+    ("GET", "/evaluations/task/{task_id}/evaluations"): 2,
+    ("POST", "/teams_users/{team_id}/users"): 2,
+    ("DELETE", "/teams_users/{team_id}/users"): 2,
+    ("PATCH", "/teams_users/{team_id}/users/{user_id}/role"): 1,
+    ("POST", "/tasks_users/{team_id}/{task_id}/assignees"): 5,
+    ("DELETE", "/tasks_users/{team_id}/{task_id}/assignees"): 4,
+    ("PATCH", "/tasks_users/{team_id}/{task_id}/{user_id}/role"): 2,
+    ("POST", "/meetings/"): 7,
+    ("PATCH", "/meetings/{meeting_id}"): 5,
+    ("GET", "/meetings/me_meetings"): 1,
+    ("GET", "/meetings/availability"): 2,
+    ("GET", "/meetings/{meeting_id}"): 3,
+    ("GET", "/meetings/meetings/"): 1,
+    ("DELETE", "/meetings/{meeting_id}"): 5,
+    ("GET", "/calendars/"): 1,
+    ("GET", "/calendars/teams/{team_id}/calendar"): 3,
+    ("GET", "/metrics/"): 0,
+    ("GET", "/analytics/teams/{team_id}"): 4,
+    ("GET", "/analytics/teams/{team_id}/throughput"): 1,
+    ("GET", "/analytics/teams/{team_id}/cycle_time"): 1,
+    ("GET", "/analytics/teams/{team_id}/scores"): 1,
+    ("GET", "/analytics/teams/{team_id}/overdue"): 1,
+    ("GET", "/exports/teams/{team_id}/tasks"): 1,
+    ("GET", "/exports/teams/{team_id}/comments"): 1,
+    ("GET", "/exports/teams/{team_id}/status_history"): 1,
+}
+
+_WHITESPACE = re.compile(r"\s+")
+_PARAMETER = re.compile(r"\$\d+")
+_PARAMETER_LIST = re.compile(r"\(\?[^(),]*(?:, \?[^(),]*)+\)")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a statement so executions differing only in bound values or IN-list length compare equal."""
+    shape = _PARAMETER.sub("?", _WHITESPACE.sub(" ", statement).strip())
+    return _PARAMETER_LIST.sub("(?, ...)", shape)
+
+
+class QueryCounter:
+    """Record the SQL statements an engine sends to the database inside a `with` block."""
+
+    def __init__(self, engine) -> None:
+        self.engine = engine.sync_engine
+        self.statements: list[str] = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.statements.append(statement)
+
+    def __enter__(self) -> "QueryCounter":
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+    def repeated_shapes(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> dict[str, int]:
+        """Statement shapes executed at least `threshold` times."""
+        counts = Counter(statement_shape(statement) for statement in self.statements)
+        return {shape: count for shape, count in counts.items() if count >= threshold}
+
+    def assert_budget(self, budget: int) -> None:
+        """Fail with the recorded statements when more than `budget` were executed."""
+        assert len(self.statements) <= budget, (
+            f"{len(self.statements)} statements executed, budget is {budget}:\n" + "\n".join(self.statements))
+
+    def assert_no_n_plus_one(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> None:
+        """Fail when any statement shape was repeated `threshold` or more times."""
+        repeated = self.repeated_shapes(threshold)
+        assert not repeated, "N+1 suspected:\n" + "\n".join(f"{count}x {shape}" for shape, count in repeated.items())
+
+
+@dataclass
+class RouteReport:
+    """Per-route statistics collected over the whole session."""
+    requests: int = 0
+    max_statements: int = 0
+    n_plus_one: dict[str, tuple[int, str]] = field(default_factory=dict)
+
+
+def resolve_route(app, method: str, path: str) -> str:
+    """Return the path template of the route serving `method path`, or the raw path when none matches."""
+    scope = {"type": "http", "method": method, "path": path, "root_path": ""}
+    for route in app.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+    return path
+
+
+class RequestQueryRecorder:
+    """httpx event hooks counting the statements of each request and checking them against the route budget."""
+
+    def __init__(self, engine, app, reports: dict, nodeid: str, fail_on_n_plus_one: bool) -> None:
+        self.counter = QueryCounter(engine)
+        self.app = app
+        self.reports = reports
+        self.nodeid = nodeid
+        self.fail_on_n_plus_one = fail_on_n_plus_one
+
+    @property
+    def event_hooks(self) -> dict:
+        return {"request": [self.on_request], "response": [self.on_response]}
+
+    async def on_request(self, request) -> None:
+        self.counter.__enter__()
+
+    async def on_response(self, response) -> None:
+        self.counter.__exit__(None, None, None)
+        method = response.request.method
+        route = resolve_route(self.app, method, response.request.url.path)
+        key = (method, route)
+
+        report = self.reports.setdefault(key, RouteReport())
+        report.requests += 1
+        report.max_statements = max(report.max_statements, len(self.counter))
+        repeated = self.counter.repeated_shapes()
+        for shape, count in repeated.items():
+            if count > report.n_plus_one.get(shape, (0, ""))[0]:
+                report.n_plus_one[shape] = (count, self.nodeid)
+
+        budget = ROUTE_BUDGETS.get(key)
+        if budget is not None:
+            self.counter.assert_budget(budget)
+        if self.fail_on_n_plus_one:
+            self.counter.assert_no_n_plus_one()
+
+
+_reports_key = pytest.StashKey[dict]()
+
+
+def pytest_addoption(parser) -> None:
+    parser.addoption(
+        "--fail-on-n-plus-one", action="store_true", default=False,
+        help="Fail requests that repeat a statement shape N+1 style instead of only reporting them.")
+
+
+def pytest_configure(config) -> None:
+    config.stash[_reports_key] = {}
+
+
+@pytest.fixture(scope="function")
+def query_counter(test_engine) -> QueryCounter:
+    """Count the statements executed against the test database."""
+    return QueryCounter(test_engine)
+
+
+@pytest.fixture(scope="function")
+def query_recorder(request, test_engine) -> RequestQueryRecorder:
+    """Per-request statement counting for `test_client`."""
+    from src.main import app
+
+    return RequestQueryRecorder(
+        test_engine, app, request.config.stash[_reports_key], request.node.nodeid,
+        request.config.getoption("fail_on_n_plus_one"))
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config) -> None:
+    reports: dict = config.stash.get(_reports_key, {})
+    suspects = [(key, shape, count, nodeid)
+                for key, report in sorted(reports.items())
+                for shape, (count, nodeid) in report.n_plus_one.items()]
+    unbudgeted = sorted(key for key in reports if key not in ROUTE_BUDGETS)
+    if not suspects and not unbudgeted:
+        return
+
+    terminalreporter.write_sep("=", "SQL query budget")
+    for (method, route), shape, count, nodeid in suspects:
+        terminalreporter.write_line(f"N+1 suspected: {method} {route} ran {count}x in {nodeid}", yellow=True)
+        terminalreporter.write_line(f"    {shape[:200]}")
+    for method, route in unbudgeted:
+        report = reports[(method, route)]
+        terminalreporter.write_line(
+            f"No budget: {method} {route} (max {report.max_statements} statements)", yellow=True)
@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta, timezone
+from src.services.meeting import merge_intervals, find_free_slots
+
+
+def at(hour: int, minute: int = 0) -> datetime:
+    return datetime(2030, 1, 7, hour, minute, tzinfo=timezone.utc)
+
+
+class TestMergeIntervals:
+    def test_merges_overlapping_touching_and_nested(self):
+        """Overlapping, touching and nested intervals collapse into single busy blocks."""
+        intervals = [
+            (at(9), at(10)),
+            (at(9, 30), at(11)),
+            (at(11), at(11, 30)),
+            (at(13), at(15)),
+            (at(13, 30), at(14)),
+        ]
+
+        assert merge_intervals(intervals) == [(at(9), at(11, 30)), (at(13), at(15))]
+
+    def test_empty(self):
+        assert merge_intervals([]) == []
+
+
+class TestFindFreeSlots:
+    def test_returns_gaps_long_enough(self):
+        """Only gaps of at least the requested duration are returned, including the window edges."""
+        busy = [(at(9), at(10)), (at(10, 20), at(12))]
+
+        slots = find_free_slots(busy, at(8), at(14), timedelta(minutes=30), limit=10)
+
+        assert slots == [(at(8), at(9)), (at(12), at(14))]
+
+    def test_limit(self):
+        """At most `limit` slots are returned."""
+        busy = [(at(9), at(10)), (at(11), at(12))]
+
+        slots = find_free_slots(busy, at(8), at(14), timedelta(minutes=30), limit=2)
+
+        assert slots == [(at(8), at(9)), (at(10), at(11))]
+
+    def test_no_busy_time(self):
+        assert find_free_slots([], at(8), at(9), timedelta(hours=1), limit=5) == [(at(8), at(9))]
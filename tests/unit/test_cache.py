@@ -0,0 +1,27 @@
+from time import time
+from src.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_get_returns_value_until_expiry(self):
+        """Values are returned while fresh and dropped once expired."""
+        cache = TTLCache(maxsize=10)
+        cache.set("fresh", 1, expires_at=time() + 60)
+        cache.set("stale", 2, expires_at=time() - 1)
+
+        assert cache.get("fresh") == 1
+        assert cache.get("stale") is None
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self):
+        """The least recently used entry is evicted when the cache is full."""
+        cache = TTLCache(maxsize=2)
+        expires_at = time() + 60
+        cache.set("a", 1, expires_at)
+        cache.set("b", 2, expires_at)
+        cache.get("a")
+        cache.set("c", 3, expires_at)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
@@ -0,0 +1,53 @@
+import pytest
+from datetime import datetime, timezone
+from fastapi import Request
+from src.utils.conditional import etag, last_modified, is_not_modified
+
+VERSION = datetime(2025, 3, 1, 12, 30, 15, 250000, tzinfo=timezone.utc)
+
+
+def request(**headers) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]})
+
+
+class TestValidators:
+    def test_etag_changes_with_microseconds(self):
+        assert etag(VERSION) != etag(VERSION.replace(microsecond=250001))
+        assert etag(VERSION).startswith('"') and etag(VERSION).endswith('"')
+
+    def test_last_modified_is_an_http_date(self):
+        assert last_modified(VERSION) == "Sat, 01 Mar 2025 12:30:15 GMT"
+
+
+class TestIsNotModified:
+    def test_without_conditional_headers(self):
+        assert not is_not_modified(request(), VERSION)
+
+    @pytest.mark.parametrize("header", [
+        etag(VERSION),
+        f'"other", {etag(VERSION)}',
+        f"W/{etag(VERSION)}",
+        "*",
+    ])
+    def test_matching_if_none_match(self, header):
+        assert is_not_modified(request(if_none_match=header), VERSION)
+
+    def test_other_etag(self):
+        assert not is_not_modified(request(if_none_match='"other"'), VERSION)
+
+    def test_if_none_match_takes_precedence_over_if_modified_since(self):
+        headers = request(if_none_match='"other"', if_modified_since=last_modified(VERSION))
+
+        assert not is_not_modified(headers, VERSION)
+
+    def test_if_modified_since_within_the_same_second(self):
+        assert is_not_modified(request(if_modified_since=last_modified(VERSION)), VERSION)
+
+    def test_if_modified_since_before_the_version(self):
+        assert not is_not_modified(request(if_modified_since="Sat, 01 Mar 2025 12:30:14 GMT"), VERSION)
+
+    def test_invalid_if_modified_since_is_ignored(self):
+        assert not is_not_modified(request(if_modified_since="yesterday"), VERSION)
@@ -0,0 +1,39 @@
+from src.config.db import engine, SessionLocal
+from src.config.settings import settings
+from src.utils.metrics import metrics, Histogram
+
+
+class TestEnginePool:
+
+    def test_sessions_share_single_engine(self):
+        """Every session from SessionLocal is bound to the process-wide engine."""
+        assert SessionLocal.kw["bind"] is engine
+        assert SessionLocal().bind is engine
+
+    def test_pool_is_configured_from_settings(self):
+        """Pool size and overflow come from settings."""
+        assert engine.pool.size() == settings.DB_POOL_SIZE
+        assert engine.pool._max_overflow == settings.DB_MAX_OVERFLOW
+        assert engine.pool._recycle == settings.DB_POOL_RECYCLE
+        assert engine.pool._timeout == settings.DB_POOL_TIMEOUT
+
+    def test_pool_gauges_registered(self):
+        """Pool usage gauges are exposed through the metrics registry."""
+        gauges = metrics.snapshot()["gauges"]
+        assert gauges["db_pool_size"] == settings.DB_POOL_SIZE
+        assert gauges["db_pool_checked_out"] == 0
+        assert "db_pool_overflow" in gauges
+
+
+class TestHistogram:
+
+    def test_observe_fills_cumulative_buckets(self):
+        """Observed values are counted in every bucket whose bound they do not exceed."""
+        histogram = Histogram(buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 3
+        assert snapshot["buckets"] == {"0.1": 1, "1.0": 2, "+Inf": 3}
@@ -0,0 +1,14 @@
+from tests.query_budget import statement_shape
+
+
+class TestStatementShape:
+    def test_bound_values_and_in_list_length_are_ignored(self):
+        """Executions of one query with different parameters and IN-list sizes share a shape."""
+        one = "SELECT users.id \nFROM users \nWHERE users.id IN ($1::INTEGER)"
+        three = "SELECT users.id FROM users WHERE users.id IN ($1::INTEGER, $2::INTEGER, $3::INTEGER)"
+        five = "SELECT users.id FROM users WHERE users.id IN ($4::INTEGER, $5::INTEGER, $6::INTEGER, $7::INTEGER)"
+        assert statement_shape(three) == statement_shape(five)
+        assert statement_shape(one) == "SELECT users.id FROM users WHERE users.id IN (?::INTEGER)"
+
+    def test_different_tables_have_different_shapes(self):
+        assert statement_shape("SELECT a FROM x WHERE id = $1") != statement_shape("SELECT a FROM y WHERE id = $1")
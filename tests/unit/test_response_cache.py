@@ -0,0 +1,189 @@
+import json
+import pytest
+from pydantic import BaseModel, TypeAdapter
+from src.utils.metrics import metrics
+from src.utils.response_cache import MemoryCacheBackend, RedisCacheBackend, ResponseCache, entity
+
+
+class FakeRedis:
+    """The part of the `redis.asyncio.Redis` API the cache uses, over a dict; TTLs are recorded, not enforced."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    def set(self, key, value, ex=None):
+        self.commands.append((key, value, ex))
+
+    async def execute(self):
+        for key, value, ex in self.commands:
+            self.client.data[key] = value
+            self.client.ttls[key] = ex
+        self.commands = []
+
+
+class BrokenBackend:
+    async def get_many(self, keys):
+        raise ConnectionError("cache is down")
+
+    async def set_many(self, items, ttl):
+        raise ConnectionError("cache is down")
+
+
+class Item(BaseModel):
+    id: int
+    owner_id: int
+    name: str
+
+
+ITEM = TypeAdapter(Item)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request):
+    backend = MemoryCacheBackend(maxsize=100) if request.param == "memory" else RedisCacheBackend(FakeRedis())
+    return ResponseCache(backend, ttl=60)
+
+
+class Loader:
+    """Counts loads and returns the current item with the owner as a derived dependency."""
+
+    def __init__(self):
+        self.item = Item(id=1, owner_id=7, name="first")
+        self.calls = 0
+
+    async def resolve(self):
+        return [entity("user", self.item.owner_id)]
+
+    async def __call__(self):
+        self.calls += 1
+        return self.item, [entity("user", self.item.owner_id)]
+
+
+async def get(cache, loader, route="GET /items/{item_id}"):
+    response = await cache.get_or_load(
+        route, "item:1", ITEM, loader, depends_on=[entity("item", 1)], resolve=loader.resolve)
+    return json.loads(response.body)
+
+
+@pytest.mark.asyncio
+class TestResponseCache:
+    async def test_second_read_is_a_hit(self, cache):
+        loader = Loader()
+
+        assert await get(cache, loader) == {"id": 1, "owner_id": 7, "name": "first"}
+        loader.item = Item(id=1, owner_id=7, name="changed without invalidation")
+        assert (await get(cache, loader))["name"] == "first"
+        assert loader.calls == 1
+
+    async def test_invalidating_a_known_dependency_reloads(self, cache):
+        loader = Loader()
+        await get(cache, loader)
+
+        loader.item = Item(id=1, owner_id=7, name="second")
+        await cache.invalidate(entity("item", 1))
+
+        assert (await get(cache, loader))["name"] == "second"
+        assert loader.calls == 2
+
+    async def test_invalidating_a_derived_dependency_reloads(self, cache):
+        loader = Loader()
+        await get(cache, loader)
+
+        await cache.invalidate(entity("user", 7))
+        await get(cache, loader)
+
+        assert loader.calls == 2
+
+    async def test_derived_dependency_written_during_load_reloads(self, cache):
+        """A write to a derived entity committed while loading is not cached as current."""
+        loader = Loader()
+
+        async def load_racing_a_write():
+            value = await loader()
+            await cache.invalidate(entity("user", 7))
+            return value
+
+        await cache.get_or_load(
+            "GET /items/{item_id}", "item:1", ITEM, load_racing_a_write,
+            depends_on=[entity("item", 1)], resolve=loader.resolve)
+        await get(cache, loader)
+
+        assert loader.calls == 2
+
+    async def test_unresolved_derived_dependency_is_not_cached(self, cache):
+        """A value built from an entity whose version was not read before loading is not stored."""
+        loader = Loader()
+        for _ in range(2):
+            await cache.get_or_load("GET /items/{item_id}", "item:1", ITEM, loader, depends_on=[entity("item", 1)])
+
+        assert loader.calls == 2
+
+    async def test_unrelated_entity_keeps_the_entry(self, cache):
+        loader = Loader()
+        await get(cache, loader)
+
+        await cache.invalidate(entity("item", 2), entity("user", 8))
+        await get(cache, loader)
+
+        assert loader.calls == 1
+
+    async def test_lost_versions_cause_a_miss(self):
+        """An entry never matches once the versions it recorded are gone, e.g. after eviction."""
+        client = FakeRedis()
+        cache = ResponseCache(RedisCacheBackend(client), ttl=60)
+        loader = Loader()
+        await get(cache, loader)
+
+        for key in [key for key in client.data if key.startswith("version:")]:
+            del client.data[key]
+        await get(cache, loader)
+
+        assert loader.calls == 2
+
+    async def test_entries_and_versions_expire(self):
+        client = FakeRedis()
+        cache = ResponseCache(RedisCacheBackend(client), ttl=60)
+        await get(cache, Loader())
+
+        assert client.ttls["response:item:1"] == 60
+        assert client.ttls["version:item:1"] == cache.version_ttl > 60
+
+    async def test_backend_errors_fall_back_to_loading(self):
+        cache = ResponseCache(BrokenBackend(), ttl=60)
+        loader = Loader()
+
+        assert (await get(cache, loader))["name"] == "first"
+        assert (await get(cache, loader))["name"] == "first"
+        await cache.invalidate(entity("item", 1))
+        assert loader.calls == 2
+
+    async def test_hit_ratio_per_route(self, cache):
+        route = f"GET /ratio/{id(cache)}"
+        loader = Loader()
+        for _ in range(4):
+            await get(cache, loader, route)
+
+        snapshot = metrics.snapshot()
+        label = f'{{route="{route}"}}'
+        assert snapshot["counters"][f"response_cache_hits_total{label}"] == 3
+        assert snapshot["counters"][f"response_cache_misses_total{label}"] == 1
+        assert snapshot["gauges"][f"response_cache_hit_ratio{label}"] == 0.75
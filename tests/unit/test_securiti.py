@@ -3,7 +3,10 @@ from datetime import timedelta, timezone, datetime
 from src.config.settings import settings
 from src.utils.security import create_access_token, create_refresh_token
 from uuid import UUID
-from src.utils.security import verify_password
+import asyncio
+from fastapi import HTTPException
+from src.utils.security import verify_password, PasswordHasher
+from src.utils.metrics import metrics
 from passlib.context import CryptContext
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -65,3 +68,34 @@ class TestPasswordVerification:
         hashed = pwd_context.hash(plain)
 
         assert verify_password(wrong, hashed) is False
+
+
+class TestPasswordHasher:
+
+    async def test_hash_and_verify_roundtrip(self):
+        """Hashing and verification run in the pool and record latency."""
+        hasher = PasswordHasher(max_workers=2, max_pending=4)
+        hashed_before = metrics.histogram("password_hash_seconds").count
+
+        hashed = await hasher.hash("supersecret")
+
+        assert await hasher.verify("supersecret", hashed) is True
+        assert await hasher.verify("notthis", hashed) is False
+        assert metrics.histogram("password_hash_seconds").count == hashed_before + 1
+        assert hasher.pending == 0
+
+    async def test_rejects_when_queue_is_full(self):
+        """Operations beyond max_pending fail fast with 503."""
+        hasher = PasswordHasher(max_workers=1, max_pending=1)
+        hashed = pwd_context.hash("supersecret")
+
+        results = await asyncio.gather(
+            hasher.verify("supersecret", hashed),
+            hasher.verify("supersecret", hashed),
+            return_exceptions=True,
+        )
+
+        assert results[0] is True
+        assert isinstance(results[1], HTTPException)
+        assert results[1].status_code == 503
+        assert hasher.pending == 0
@@ -0,0 +1,25 @@
+import json
+from datetime import datetime, timezone
+from fastapi.encoders import jsonable_encoder
+from src.models import Task, TaskStatus, TaskPriority
+from src.schemas import Page, TaskShortRead
+from src.utils.serialization import json_response, type_adapter
+
+
+def test_type_adapter_is_built_once():
+    assert type_adapter(Page[TaskShortRead]) is type_adapter(Page[TaskShortRead])
+
+
+def test_json_response_matches_fastapi_encoding():
+    tasks = [
+        Task(id=i, title=f"Task {i}", status=TaskStatus.OPEN, priority=TaskPriority.HIGH,
+             due_date=datetime(2025, 1, i + 1, 12, 30, tzinfo=timezone.utc))
+        for i in range(3)]
+    page = Page(items=type_adapter(list[TaskShortRead]).validate_python(tasks, from_attributes=True),
+                next_cursor="abc")
+
+    response = json_response(Page[TaskShortRead], page, status_code=201)
+
+    assert response.status_code == 201
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == jsonable_encoder(page)
@@ -0,0 +1,66 @@
+import json
+import logging
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from src.utils.sql_logging import setup_sql_logging, current_route
+
+
+def _sql_records(caplog):
+    return [json.loads(r.getMessage()) for r in caplog.records if r.name == "sql"]
+
+
+class TestSqlLogging:
+
+    def test_slow_mode_logs_statements_over_threshold(self, caplog):
+        """Slow statements are emitted as JSON with duration, rowcount and route."""
+        engine = create_engine("sqlite://")
+        setup_sql_logging(engine, mode="slow", sample_rate=0, slow_ms=0)
+
+        token = current_route.set("GET /tasks/1")
+        try:
+            with caplog.at_level(logging.INFO, logger="sql"), engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        finally:
+            current_route.reset(token)
+
+        records = _sql_records(caplog)
+        assert len(records) == 1
+        assert records[0]["route"] == "GET /tasks/1"
+        assert records[0]["statement"] == "SELECT 1"
+        assert records[0]["duration_ms"] >= 0
+        assert "rowcount" in records[0]
+
+    def test_slow_mode_skips_fast_statements(self, caplog):
+        """Statements under the threshold are not logged in slow mode."""
+        engine = create_engine("sqlite://")
+        setup_sql_logging(engine, mode="slow", sample_rate=1, slow_ms=60_000)
+
+        with caplog.at_level(logging.INFO, logger="sql"), engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert _sql_records(caplog) == []
+
+    def test_failed_statement_drops_its_timer(self, caplog):
+        """A statement that raises leaves no start time behind on the connection."""
+        engine = create_engine("sqlite://")
+        setup_sql_logging(engine, mode="slow", sample_rate=0, slow_ms=0)
+
+        with caplog.at_level(logging.INFO, logger="sql"), engine.connect() as conn:
+            with pytest.raises(OperationalError):
+                conn.execute(text("SELECT * FROM missing"))
+            assert conn.info["query_start_time"] == []
+            conn.execute(text("SELECT 1"))
+            assert conn.info["query_start_time"] == []
+
+        assert [r["statement"] for r in _sql_records(caplog)] == ["SELECT 1"]
+
+    def test_off_mode_attaches_nothing(self, caplog):
+        """Logging is fully disabled in off mode."""
+        engine = create_engine("sqlite://")
+        setup_sql_logging(engine, mode="off", sample_rate=1, slow_ms=0)
+
+        with caplog.at_level(logging.INFO, logger="sql"), engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert _sql_records(caplog) == []
@@ -0,0 +1,30 @@
+import pytest
+from pydantic import ValidationError
+from src.models import TeamRole
+from src.schemas import UserPayload, UserTeamInfo
+
+
+class TestUserPayloadTeamIndex:
+    def test_team_lookups(self):
+        """Team roles and manager teams are indexed when the payload is built."""
+        user = UserPayload(id=1, role="user", teams=[
+            UserTeamInfo(team_id=1, role=TeamRole.MANAGER),
+            UserTeamInfo(team_id=2, role=TeamRole.EXECUTOR),
+        ])
+
+        assert user.is_member(1) and user.is_member(2)
+        assert not user.is_member(3)
+        assert user.team_role(2) == TeamRole.EXECUTOR
+        assert user.team_role(3) is None
+        assert user.is_manager(1)
+        assert not user.is_manager(2)
+        assert user.manager_teams == frozenset({1})
+
+    def test_payload_is_immutable(self):
+        """The cached payload and its role mapping cannot be modified."""
+        user = UserPayload(id=1, role="user", teams=[UserTeamInfo(team_id=1, role=TeamRole.MANAGER)])
+
+        with pytest.raises(ValidationError):
+            user.role = "admin"
+        with pytest.raises(TypeError):
+            user.team_roles[2] = TeamRole.MANAGER